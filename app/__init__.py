@@ -5,7 +5,7 @@ from flask_login import LoginManager
 from flask_admin import Admin
 from flask_admin.contrib.sqla import ModelView
 from datetime import timedelta
-from .models import db, User, UserSettings, ApplicationHistory
+from .models import db, User, UserSettings, ApplicationHistory, Job, SavedSearch
 
 login_manager = LoginManager()
 
@@ -90,6 +90,8 @@ def create_app(test_config=None):
     admin.add_view(SecureModelView(User, db.session))
     admin.add_view(SecureModelView(UserSettings, db.session))
     admin.add_view(SecureModelView(ApplicationHistory, db.session))
+    admin.add_view(SecureModelView(Job, db.session))
+    admin.add_view(SecureModelView(SavedSearch, db.session))
     
     # Create database tables - improved approach for Heroku
     with app.app_context():
@@ -134,6 +136,14 @@ def create_app(test_config=None):
                     print("Admin user created in existing database.")
             except Exception as e:
                 print(f"Error checking for admin user: {str(e)}")
+        
+        # Add columns introduced since the tables were created, on any database
+        # (app/migrate.py only handles SQLite)
+        try:
+            from app.modules.job_search.job_store import ensure_job_store
+            ensure_job_store()
+        except Exception as e:
+            print(f"Error upgrading database tables: {str(e)}")
     
     # Register blueprints
     from app.api import routes
@@ -145,6 +155,12 @@ def create_app(test_config=None):
     from app.api import settings_routes
     app.register_blueprint(settings_routes.bp)
     
+    from app.api import saved_search_routes
+    app.register_blueprint(saved_search_routes.bp)
+
+    from app.api import resume_batch_routes
+    app.register_blueprint(resume_batch_routes.bp)
+
     # Register old user_routes with a different name to avoid conflicts
     from app.api import user_routes
     app.register_blueprint(user_routes.bp, name='user_api_v1')
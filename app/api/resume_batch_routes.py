@@ -0,0 +1,70 @@
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+from app.modules.resume_parser.batch import (ensure_resume_batch_tables, create_batch, recover_stale_batch, batch_to_dict,
+                                             item_to_dict)
+from ..models import ResumeBatch, ResumeBatchItem
+
+bp = Blueprint('resume_batches', __name__, url_prefix='/api/resume-batches')
+
+def _get_own_batch(batch_id):
+    ensure_resume_batch_tables()
+    batch = ResumeBatch.query.filter_by(id=batch_id, user_id=current_user.id).first()
+    # Polling is what notices a batch whose worker stopped
+    return recover_stale_batch(batch) if batch else None
+
+@bp.route('', methods=['POST'])
+@login_required
+def create_resume_batch():
+    """Upload resumes (PDF, DOCX or zips of them) to be parsed in the background
+
+    Send the files as multipart form data, each under 'files'. Returns the
+    batch right away; poll it for progress and results.
+    """
+    files = [file for file in request.files.getlist('files') if file.filename]
+    if not files:
+        return jsonify({'error': 'No files uploaded'}), 400
+
+    try:
+        batch = create_batch(current_user.id, files)
+        return jsonify({'batch': batch_to_dict(batch)}), 202
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<batch_id>', methods=['GET'])
+@login_required
+def get_resume_batch(batch_id):
+    """Get a batch's progress"""
+    batch = _get_own_batch(batch_id)
+    if not batch:
+        return jsonify({'error': 'Resume batch not found'}), 404
+    return jsonify({'batch': batch_to_dict(batch)})
+
+@bp.route('/<batch_id>/results', methods=['GET'])
+@login_required
+def get_resume_batch_results(batch_id):
+    """Get a page of a batch's resumes, in upload order
+
+    Query parameters:
+        offset: position of the first resume (default 0)
+        limit: number of resumes (default 50, at most 200)
+        status: only resumes with this status ('queued', 'parsed' or 'failed')
+    """
+    batch = _get_own_batch(batch_id)
+    if not batch:
+        return jsonify({'error': 'Resume batch not found'}), 404
+
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', 50, type=int), 1), 200)
+    query = ResumeBatchItem.query.filter_by(batch_id=batch.id)
+    if request.args.get('status'):
+        query = query.filter_by(status=request.args['status'])
+    items = query.order_by(ResumeBatchItem.position).offset(offset).limit(limit).all()
+
+    return jsonify({
+        'batch': batch_to_dict(batch),
+        'results': [item_to_dict(item) for item in items],
+        'offset': offset,
+        'limit': limit
+    })
@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, send_file, current_app
+from flask import Blueprint, request, jsonify, send_file, current_app, Response, stream_with_context
 from flask_login import login_required, current_user
 import json
 import os
@@ -9,6 +9,7 @@ import tempfile
 from datetime import datetime
 from app.modules.resume_parser import parser
 from app.modules.job_search import searcher
+from app.modules.job_search.job_store import history_job_fields
 from app.modules.application_customizer import customizer
 from app.modules.application_submitter import submitter
 from app.modules.notifications.email_service import EmailService
@@ -40,6 +41,8 @@ def parse_resume():
     try:
         parsed_data = parser.parse_resume(file)
         return jsonify({'data': parsed_data})
+    except parser.ResumeTooLargeError as e:
+        return jsonify({'error': str(e)}), 413
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -133,11 +136,26 @@ def search_jobs():
         # Extract auto_apply flag
         auto_apply = data.get('auto_apply', False)
         
+        # Optional paging: only the requested page of top matches is ranked
+        limit = data.get('limit')
+        offset = data.get('offset', 0)
+        try:
+            limit = int(limit) if limit is not None else None
+            offset = int(offset or 0)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+        
         # Search for jobs
-        jobs = searcher.search_jobs(data)
+        search_metadata = {}
+        try:
+            jobs = searcher.search_jobs(data, metadata=search_metadata, limit=limit,
+                                        offset=offset, cursor=data.get('cursor'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         # If auto_apply is True, automatically submit applications
-        if auto_apply and jobs:
+        # (only for the first page, so paging doesn't apply twice)
+        if auto_apply and jobs and not search_metadata.get('offset'):
             # Get resume data if available
             from app.modules.resume_parser import parser
             
@@ -179,7 +197,6 @@ def search_jobs():
                         'company': job.get('company', ''),
                         'location': job.get('location', ''),
                         'platform': job.get('source', 'external'),
-                        'description': job.get('description', ''),
                         'application_type': 'easy_apply' if job.get('easy_apply', False) else 'external',
                         'success': True,  # This would be the actual result in real implementation
                         'timestamp': datetime.utcnow(),
@@ -187,8 +204,8 @@ def search_jobs():
                         'notification_sent': False
                     }
                     
-                    # Save to database
-                    app_history = ApplicationHistory(**application_result)
+                    # Save to database (the description lives on the referenced job)
+                    app_history = ApplicationHistory(**application_result, **history_job_fields(job))
                     db.session.add(app_history)
                     db.session.commit()
                     
@@ -210,10 +227,58 @@ def search_jobs():
                     logger.error(f"Error auto-applying to job {job.get('id')}: {str(e)}")
                     job['auto_apply_error'] = str(e)
         
-        return jsonify({'jobs': jobs})
+        return jsonify({'jobs': jobs, 'metadata': search_metadata})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@bp.route('/search-jobs/stream', methods=['GET', 'POST'])
+@login_required
+def search_jobs_stream():
+    """Stream job search results as Server-Sent Events
+    
+    Emits a 'jobs' event for each site as soon as it responds, then a 'done'
+    event with the search metadata. Accepts the same JSON body as
+    /search-jobs, or query parameters for EventSource clients (keywords and
+    sites as comma-separated lists).
+    """
+    if request.method == 'POST':
+        data = request.json
+    else:
+        data = {key: value for key, value in request.args.items()}
+        for list_field in ('keywords', 'sites'):
+            if list_field in data:
+                data[list_field] = [item.strip() for item in data[list_field].split(',') if item.strip()]
+    
+    if not data or 'keywords' not in data:
+        return jsonify({'error': 'No search parameters provided'}), 400
+    
+    search_metadata = {}
+    try:
+        results = searcher.iter_search_jobs(data, metadata=search_metadata)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    def _event(event, payload):
+        return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+    
+    def generate():
+        try:
+            for site, jobs in results:
+                yield _event('jobs', {'site': site, 'jobs': jobs})
+            yield _event('done', {'metadata': search_metadata})
+        except Exception as e:
+            logger.error(f"Error streaming job search: {str(e)}")
+            yield _event('error', {'error': str(e)})
+        finally:
+            # Runs when the client disconnects too; cancels sites not searched yet
+            results.close()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @bp.route('/customize-application', methods=['POST'])
 @login_required
 def customize_application():
@@ -286,7 +351,7 @@ def submit_application():
                 company=job_data.get('company', ''),
                 location=job_data.get('location', ''),
                 platform=job_data.get('source', 'external'),
-                description=job_data.get('description', ''),
+                **history_job_fields(job_data),
                 application_type='easy_apply' if job_data.get('easy_apply', False) else 'external',
                 success=result.get('success', False),
                 timestamp=datetime.utcnow(),
@@ -372,7 +437,7 @@ def submit_application():
                 company=data['job'].get('company', ''),
                 location=data['job'].get('location', ''),
                 platform=data['job'].get('source', 'external'),
-                description=data['job'].get('description', ''),
+                **history_job_fields(data['job']),
                 application_type='easy_apply' if data['job'].get('easy_apply', False) else 'external',
                 success=result.get('success', False),
                 timestamp=datetime.utcnow(),
@@ -441,6 +506,7 @@ def get_application_history():
             history_list.append({
                 'id': app.id,
                 'job_id': app.job_id,
+                'job_ref_id': app.job_ref_id,
                 'job_url': app.job_url,
                 'position': app.position,
                 'company': app.company,
@@ -516,6 +582,7 @@ def export_applications():
             history_list.append({
                 'id': app.id,
                 'job_id': app.job_id,
+                'job_ref_id': app.job_ref_id,
                 'job_url': app.job_url,
                 'position': app.position,
                 'company': app.company,
@@ -0,0 +1,152 @@
+from flask import Blueprint, request, jsonify
+from flask_login import login_required, current_user
+import json
+from app.modules.job_search.searcher import JOB_SITES
+from app.modules.job_search.job_store import job_to_dict
+from app.modules.job_search.scheduler import ensure_saved_search_tables, build_default_saved_searches
+from ..models import db, SavedSearch, SavedSearchMatch
+
+bp = Blueprint('saved_searches', __name__, url_prefix='/api/saved-searches')
+
+def _search_to_dict(search):
+    return {
+        'id': search.id,
+        'name': search.name,
+        'keywords': search.get_keywords_list(),
+        'location': search.location,
+        'job_type': search.job_type,
+        'sites': search.get_sites_list(),
+        'is_active': search.is_active,
+        'last_run_at': search.last_run_at.isoformat() if search.last_run_at else None,
+        'last_error': search.last_error,
+        'new_matches': SavedSearchMatch.query.filter_by(saved_search_id=search.id, seen=False).count()
+    }
+
+def _get_own_search(search_id):
+    ensure_saved_search_tables()
+    return SavedSearch.query.filter_by(id=search_id, user_id=current_user.id).first()
+
+@bp.route('', methods=['GET'])
+@login_required
+def list_saved_searches():
+    """List the current user's saved searches"""
+    try:
+        ensure_saved_search_tables()
+        searches = SavedSearch.query.filter_by(user_id=current_user.id).order_by(SavedSearch.created_at).all()
+        return jsonify({'saved_searches': [_search_to_dict(search) for search in searches]})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('', methods=['POST'])
+@login_required
+def create_saved_search():
+    """Create a saved search"""
+    data = request.json
+    if not data or not data.get('keywords'):
+        return jsonify({'error': 'Keywords are required'}), 400
+
+    keywords = data['keywords']
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    keywords = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+    sites = data.get('sites') or []
+    if not isinstance(sites, list):
+        return jsonify({'error': 'Sites must be a list'}), 400
+    sites = [site.strip().lower() for site in sites if isinstance(site, str) and site.strip().lower() in JOB_SITES]
+    if not keywords:
+        return jsonify({'error': 'Keywords are required'}), 400
+
+    try:
+        ensure_saved_search_tables()
+        search = SavedSearch(
+            user_id=current_user.id,
+            name=data.get('name') or ', '.join(keywords),
+            keywords=','.join(keywords),
+            location=data.get('location', ''),
+            job_type=data.get('job_type', ''),
+            sites=','.join(sites) if sites else None
+        )
+        db.session.add(search)
+        db.session.commit()
+        return jsonify({'saved_search': _search_to_dict(search)}), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/defaults', methods=['POST'])
+@login_required
+def create_default_saved_searches():
+    """Create saved searches from the user's job titles and preferred locations"""
+    try:
+        created = build_default_saved_searches(current_user)
+        return jsonify({'saved_searches': [_search_to_dict(search) for search in created]})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<search_id>', methods=['PATCH'])
+@login_required
+def update_saved_search(search_id):
+    """Pause or resume a saved search"""
+    data = request.json or {}
+    search = _get_own_search(search_id)
+    if not search:
+        return jsonify({'error': 'Saved search not found'}), 404
+
+    if 'is_active' in data:
+        search.is_active = bool(data['is_active'])
+    if 'name' in data:
+        search.name = data['name']
+    db.session.commit()
+    return jsonify({'saved_search': _search_to_dict(search)})
+
+@bp.route('/<search_id>', methods=['DELETE'])
+@login_required
+def delete_saved_search(search_id):
+    """Delete a saved search and its matches"""
+    search = _get_own_search(search_id)
+    if not search:
+        return jsonify({'error': 'Saved search not found'}), 404
+
+    try:
+        SavedSearchMatch.query.filter_by(saved_search_id=search.id).delete()
+        db.session.delete(search)
+        db.session.commit()
+        return jsonify({'success': True})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/<search_id>/matches', methods=['GET'])
+@login_required
+def get_saved_search_matches(search_id):
+    """Get the jobs a saved search found, newest first
+
+    Query parameters:
+        unseen: only matches not returned before ('true')
+        mark_seen: mark the returned matches as seen (default 'true')
+    """
+    search = _get_own_search(search_id)
+    if not search:
+        return jsonify({'error': 'Saved search not found'}), 404
+
+    query = SavedSearchMatch.query.filter_by(saved_search_id=search.id)
+    if request.args.get('unseen', 'false').lower() == 'true':
+        query = query.filter_by(seen=False)
+    matches = query.order_by(SavedSearchMatch.created_at.desc(), SavedSearchMatch.match_score.desc()).limit(200).all()
+
+    jobs = []
+    for match in matches:
+        job = job_to_dict(match.job)
+        job['match_score'] = match.match_score
+        job['match_reasons'] = json.loads(match.match_reasons) if match.match_reasons else []
+        job['found_at'] = match.created_at.isoformat()
+        job['seen'] = match.seen
+        jobs.append(job)
+
+    if request.args.get('mark_seen', 'true').lower() == 'true':
+        for match in matches:
+            match.seen = True
+        db.session.commit()
+
+    return jsonify({'jobs': jobs})
@@ -1,4 +1,5 @@
 import os
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -46,6 +47,106 @@ class Config:
     JOB_SEARCH_API2_HOST = os.environ.get('JOB_SEARCH_API2_HOST', 'job-search-api2.p.rapidapi.com')
     HIRING_MANAGER_API_HOST = os.environ.get('HIRING_MANAGER_API_HOST', 'hiring-manager-api.p.rapidapi.com')
     
+    # Send every provider request to this server instead (e.g. http://127.0.0.1:8900 for
+    # benchmarks/fake_providers.py); the provider host becomes the first path segment
+    PROVIDER_BASE_URL = os.environ.get('PROVIDER_BASE_URL', '').rstrip('/')
+    
+    # Job search fan-out settings
+    JOB_SEARCH_DEADLINE_SECONDS = float(os.environ.get('JOB_SEARCH_DEADLINE_SECONDS', '15'))
+    JOB_SEARCH_MAX_DEADLINE_SECONDS = float(os.environ.get('JOB_SEARCH_MAX_DEADLINE_SECONDS', '60'))  # cap on a client's deadline
+    JOB_SEARCH_MAX_WORKERS = int(os.environ.get('JOB_SEARCH_MAX_WORKERS', '20'))
+    
+    # Provider pagination: in top-K searches, further pages are fetched until
+    # there are enough well-scoring jobs, within a per-search page budget
+    JOB_SEARCH_MAX_PAGES = int(os.environ.get('JOB_SEARCH_MAX_PAGES', '5'))  # per site
+    JOB_SEARCH_PAGE_BUDGET = int(os.environ.get('JOB_SEARCH_PAGE_BUDGET', '10'))  # extra pages per search
+    JOB_SEARCH_GOOD_SCORE = int(os.environ.get('JOB_SEARCH_GOOD_SCORE', '40'))
+    
+    # Outbound HTTP settings for job search providers
+    HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', '3.05'))
+    HTTP_READ_TIMEOUT = float(os.environ.get('HTTP_READ_TIMEOUT', '10'))
+    HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', '20'))
+    HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', '10'))
+    
+    # Local data directory for process-shared state (SQLite files)
+    DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+    
+    # Provider search result cache settings
+    SEARCH_CACHE_BACKEND = os.environ.get('SEARCH_CACHE_BACKEND', 'sqlite').lower()  # sqlite, memory or none
+    SEARCH_CACHE_PATH = os.environ.get('SEARCH_CACHE_PATH', os.path.join(DATA_DIR, 'search_cache.sqlite'))
+    SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get('SEARCH_CACHE_MAX_ENTRIES', '5000'))
+    SEARCH_CACHE_DEFAULT_TTL = float(os.environ.get('SEARCH_CACHE_DEFAULT_TTL', '1800'))
+    SEARCH_CACHE_TTLS = os.environ.get('SEARCH_CACHE_TTLS', 'active_jobs=600,workday=3600,workday_jobs=3600')
+    SEARCH_CACHE_STALE_SECONDS = float(os.environ.get('SEARCH_CACHE_STALE_SECONDS', '3600'))
+    
+    # Provider rate limiting and circuit breaker settings (state shared by all workers)
+    PROVIDER_STATE_PATH = os.environ.get('PROVIDER_STATE_PATH', os.path.join(DATA_DIR, 'provider_state.sqlite'))
+    PROVIDER_RATE_LIMIT_DEFAULT = float(os.environ.get('PROVIDER_RATE_LIMIT_DEFAULT', '5'))  # requests per second, 0 disables
+    PROVIDER_RATE_LIMITS = os.environ.get('PROVIDER_RATE_LIMITS', '')  # e.g. 'glassdoor=0.5,indeed=2'
+    PROVIDER_RATE_BURST = float(os.environ.get('PROVIDER_RATE_BURST', '10'))
+    
+    # Identical provider requests (e.g. google and google_jobs) share one response
+    PROVIDER_REQUEST_SHARE_SECONDS = float(os.environ.get('PROVIDER_REQUEST_SHARE_SECONDS', '5'))
+    # Hedged requests: duplicate a request still running after the endpoint's p95 latency
+    PROVIDER_HEDGING_ENABLED = os.environ.get('PROVIDER_HEDGING_ENABLED', 'False').lower() in ('true', '1', 't')
+    PROVIDER_HEDGE_SAMPLES = int(os.environ.get('PROVIDER_HEDGE_SAMPLES', '200'))
+    PROVIDER_HEDGE_MIN_SAMPLES = int(os.environ.get('PROVIDER_HEDGE_MIN_SAMPLES', '20'))
+    PROVIDER_HEDGE_MIN_DELAY_SECONDS = float(os.environ.get('PROVIDER_HEDGE_MIN_DELAY_SECONDS', '0.5'))
+    # Responses of feeds marked for streaming are parsed incrementally above this size (needs ijson)
+    PROVIDER_STREAM_MIN_BYTES = int(os.environ.get('PROVIDER_STREAM_MIN_BYTES', str(1024 * 1024)))
+    BREAKER_FAILURE_THRESHOLD = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', '3'))
+    BREAKER_COOLDOWN_SECONDS = float(os.environ.get('BREAKER_COOLDOWN_SECONDS', '60'))
+    BREAKER_PROBE_TIMEOUT = float(os.environ.get('BREAKER_PROBE_TIMEOUT', '30'))
+    
+    # Per-provider latency and yield metrics (shared by all workers, served at /api/admin_v2/metrics)
+    PROVIDER_METRICS_ENABLED = os.environ.get('PROVIDER_METRICS_ENABLED', 'True').lower() in ('true', '1', 't')
+    PROVIDER_METRICS_PATH = os.environ.get('PROVIDER_METRICS_PATH', os.path.join(DATA_DIR, 'provider_metrics.sqlite'))
+    PROVIDER_METRICS_FLUSH_SECONDS = float(os.environ.get('PROVIDER_METRICS_FLUSH_SECONDS', '10'))
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # lets a Prometheus scraper use 'Authorization: Bearer <token>'
+    
+    # Hiring manager feed cache settings (shared by all workers)
+    HIRING_MANAGER_CACHE_PATH = os.environ.get('HIRING_MANAGER_CACHE_PATH', os.path.join(DATA_DIR, 'hiring_managers.sqlite'))
+    HIRING_MANAGER_CACHE_TTL = float(os.environ.get('HIRING_MANAGER_CACHE_TTL', '3600'))
+    HIRING_MANAGER_REFRESH_LEASE = float(os.environ.get('HIRING_MANAGER_REFRESH_LEASE', '120'))
+    HIRING_MANAGER_FUZZY_THRESHOLD = float(os.environ.get('HIRING_MANAGER_FUZZY_THRESHOLD', '0.6'))  # 1 disables fuzzy matching
+    
+    # Near-duplicate job detection (estimated Jaccard similarity of title + company + description)
+    JOB_DEDUPE_SIMILARITY = float(os.environ.get('JOB_DEDUPE_SIMILARITY', '0.7'))  # above 1 keeps exact title:company matching only
+    
+    # Canonical job store (search results are persisted and full-text indexed)
+    JOB_STORE_ENABLED = os.environ.get('JOB_STORE_ENABLED', 'True').lower() in ('true', '1', 't')
+    JOB_STORE_MAX_AGE_DAYS = int(os.environ.get('JOB_STORE_MAX_AGE_DAYS', '30'))  # local searches ignore older jobs
+    
+    # Saved-search scheduler (run by saved_search_worker.py)
+    SAVED_SEARCH_INTERVAL_MINUTES = int(os.environ.get('SAVED_SEARCH_INTERVAL_MINUTES', '60'))
+    SAVED_SEARCH_POLL_SECONDS = int(os.environ.get('SAVED_SEARCH_POLL_SECONDS', '60'))
+    SAVED_SEARCH_MIN_SCORE = int(os.environ.get('SAVED_SEARCH_MIN_SCORE', '0'))  # matches below this score are not saved
+    SAVED_SEARCH_FIRST_RUN_MATCHES = int(os.environ.get('SAVED_SEARCH_FIRST_RUN_MATCHES', '50'))  # best jobs kept on a search's first run
+    
+    # Resume upload limits, enforced before any parsing (uploads over the spool size are copied to a temporary file)
+    RESUME_MAX_UPLOAD_BYTES = int(os.environ.get('RESUME_MAX_UPLOAD_BYTES', str(10 * 1024 * 1024)))
+    RESUME_MAX_PAGES = int(os.environ.get('RESUME_MAX_PAGES', '50'))  # PDFs only
+    RESUME_MAX_DOCX_EXPANDED_BYTES = int(os.environ.get('RESUME_MAX_DOCX_EXPANDED_BYTES', str(50 * 1024 * 1024)))
+    RESUME_SPOOL_MAX_MEMORY_BYTES = int(os.environ.get('RESUME_SPOOL_MAX_MEMORY_BYTES', str(1024 * 1024)))
+    RESUME_SPOOL_DIR = os.environ.get('RESUME_SPOOL_DIR', '')  # system temporary directory when empty
+    
+    # Resume parse cache (keyed by file content and parser version, shared by all workers)
+    RESUME_PARSE_CACHE_ENABLED = os.environ.get('RESUME_PARSE_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+    RESUME_PARSE_CACHE_PATH = os.environ.get('RESUME_PARSE_CACHE_PATH', os.path.join(DATA_DIR, 'resume_parse_cache.sqlite'))
+    RESUME_PARSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESUME_PARSE_CACHE_MAX_ENTRIES', '1000'))
+    
+    # PDFs with at least this many pages are extracted page-parallel in a process pool (1 worker disables)
+    RESUME_PDF_PARALLEL_MIN_PAGES = int(os.environ.get('RESUME_PDF_PARALLEL_MIN_PAGES', '8'))
+    RESUME_PDF_WORKERS = int(os.environ.get('RESUME_PDF_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+    # Bulk resume parsing (/api/resume-batches): uploads are kept here until their batch is parsed
+    RESUME_BATCH_DIR = os.environ.get('RESUME_BATCH_DIR', os.path.join(DATA_DIR, 'resume_batches'))
+    RESUME_BATCH_WORKERS = int(os.environ.get('RESUME_BATCH_WORKERS', str(min(4, os.cpu_count() or 1))))  # parser processes
+    RESUME_BATCH_CONCURRENCY = int(os.environ.get('RESUME_BATCH_CONCURRENCY', '2'))  # batches parsed at once per web worker
+    RESUME_BATCH_MAX_FILES = int(os.environ.get('RESUME_BATCH_MAX_FILES', '500'))
+    RESUME_BATCH_MAX_FILE_BYTES = int(os.environ.get('RESUME_BATCH_MAX_FILE_BYTES', str(RESUME_MAX_UPLOAD_BYTES)))
+    RESUME_BATCH_STALE_SECONDS = int(os.environ.get('RESUME_BATCH_STALE_SECONDS', '600'))  # batches whose worker stopped this long ago are requeued or failed
+    
     # Selenium/Chrome settings
     CHROME_DRIVER_PATH = os.environ.get('CHROME_DRIVER_PATH', '')
     HEADLESS_BROWSER = os.environ.get('HEADLESS_BROWSER', 'True').lower() in ('true', '1', 't')
@@ -70,9 +171,25 @@ class Config:
     SIMULATION_MODE = os.environ.get('SIMULATION_MODE', 'False').lower() in ('true', '1', 't')
     MAX_APPLICATIONS_PER_DAY = int(os.environ.get('MAX_APPLICATIONS_PER_DAY', '10'))
     
+    # Portal configs built by get_job_portal_configs, keyed by the RapidAPI key they were built with
+    _portal_configs = None
+    _portal_configs_key = None
+    
     @classmethod
     def get_job_portal_configs(cls):
-        """Returns a dictionary of configured job portals"""
+        """Returns a dictionary of configured job portals
+        
+        The dictionary is built once and reused; it is only rebuilt if the
+        RapidAPI key changes. Callers must treat it as read-only.
+        """
+        if cls._portal_configs is None or cls._portal_configs_key != cls.RAPIDAPI_KEY:
+            cls._portal_configs = cls._build_job_portal_configs()
+            cls._portal_configs_key = cls.RAPIDAPI_KEY
+        return cls._portal_configs
+    
+    @classmethod
+    def _build_job_portal_configs(cls):
+        """Build the dictionary of configured job portals"""
         portals = {}
         
         # RapidAPI
@@ -242,5 +359,23 @@ class Config:
             ]
             for portal in portal_list:
                 portals[portal] = {'enabled': False}
+        
+        if cls.PROVIDER_BASE_URL:
+            for portal in portals.values():
+                if 'url' in portal:
+                    portal['url'] = cls.provider_url(portal['url'])
                 
-        return portals
\ No newline at end of file
+        return portals
+    
+    @classmethod
+    def provider_url(cls, url):
+        """Point a provider URL at PROVIDER_BASE_URL when it is set
+        
+        'https://indeed46.p.rapidapi.com/job' becomes
+        '<PROVIDER_BASE_URL>/indeed46.p.rapidapi.com/job', so one local server
+        can stand in for every provider.
+        """
+        if not cls.PROVIDER_BASE_URL:
+            return url
+        parsed = urlparse(url)
+        return f"{cls.PROVIDER_BASE_URL}/{parsed.netloc}{parsed.path}"
@@ -132,6 +132,65 @@ def run_migrations():
             else:
                 print(f"Migration 5: {column} column already exists. Skipping.")
         
+        # Migration 6: Reference canonical jobs from application_history
+        if 'job_ref_id' not in app_column_names:
+            print("Migration 6: Adding job_ref_id column to application_history table...")
+            cursor.execute("ALTER TABLE application_history ADD COLUMN job_ref_id VARCHAR(36) REFERENCES job (id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_application_history_job_ref_id ON application_history (job_ref_id)")
+            conn.commit()
+            print("Migration 6: Added job_ref_id column successfully.")
+        else:
+            print("Migration 6: job_ref_id column already exists. Skipping.")
+        
+        # Migration 7: Structured posted date and salary columns on job
+        cursor.execute("PRAGMA table_info(job)")
+        job_column_names = [column[1] for column in cursor.fetchall()]
+        
+        structured_job_columns = [
+            ('posted_at', 'DATETIME'),
+            ('salary_min', 'FLOAT'),
+            ('salary_max', 'FLOAT'),
+            ('currency', 'VARCHAR(3)'),
+            ('period', 'VARCHAR(10)')
+        ]
+        
+        # The job table is created on first use, so there may be nothing to migrate yet
+        if job_column_names:
+            for column, data_type in structured_job_columns:
+                if column not in job_column_names:
+                    print(f"Migration 7: Adding {column} column to job table...")
+                    cursor.execute(f"ALTER TABLE job ADD COLUMN {column} {data_type}")
+                    conn.commit()
+                    print(f"Migration 7: Added {column} column successfully.")
+                else:
+                    print(f"Migration 7: {column} column already exists. Skipping.")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_job_posted_at ON job (posted_at)")
+            conn.commit()
+        else:
+            print("Migration 7: job table doesn't exist yet. Skipping.")
+
+        # Migration 8: Owner heartbeat and upload locations for resume batches
+        resume_batch_columns = [
+            ('resume_batch', 'owner', 'VARCHAR(128)'),
+            ('resume_batch', 'updated_at', 'DATETIME'),
+            ('resume_batch_item', 'source_path', 'VARCHAR(1024)'),
+            ('resume_batch_item', 'source_member', 'VARCHAR(1024)')
+        ]
+
+        for table, column, data_type in resume_batch_columns:
+            cursor.execute(f"PRAGMA table_info({table})")
+            table_column_names = [existing[1] for existing in cursor.fetchall()]
+            # The resume batch tables are created on first use, so there may be nothing to migrate yet
+            if not table_column_names:
+                print(f"Migration 8: {table} table doesn't exist yet. Skipping.")
+            elif column not in table_column_names:
+                print(f"Migration 8: Adding {column} column to {table} table...")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {data_type}")
+                conn.commit()
+                print(f"Migration 8: Added {column} column successfully.")
+            else:
+                print(f"Migration 8: {column} column already exists in {table}. Skipping.")
+
         # Create uploads directory if it doesn't exist
         uploads_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'uploads', 'profile_pictures')
         os.makedirs(uploads_dir, exist_ok=True)
@@ -1,11 +1,62 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import inspect, text
 import datetime
 import uuid
 
 db = SQLAlchemy()
 
+def add_missing_columns(model, names):
+    """Add columns that were added to a model after its table was created
+
+    Runs plain ALTER TABLE ... ADD COLUMN through SQLAlchemy, so it works on
+    SQLite and Postgres alike, then creates any index on those columns.
+    Safe to run from several workers at once.
+
+    Args:
+        model: Model class whose table may predate the columns
+        names: Names of the columns that may be missing
+
+    Returns:
+        list: Names of the columns added
+    """
+    engine = db.engine
+    table = model.__table__
+    if not inspect(engine).has_table(table.name):
+        return []
+
+    def existing_columns():
+        return {column['name'] for column in inspect(engine).get_columns(table.name)}
+
+    existing = existing_columns()
+    preparer = engine.dialect.identifier_preparer
+    added = []
+    for name in names:
+        if name in existing:
+            continue
+        column_type = table.c[name].type.compile(dialect=engine.dialect)
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    f'ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.quote(name)} {column_type}'
+                ))
+        except Exception:
+            # Another worker may have added it first
+            if name not in existing_columns():
+                raise
+            continue
+        added.append(name)
+
+    for index in table.indexes:
+        if any(column.name in names for column in index.columns):
+            try:
+                index.create(engine, checkfirst=True)
+            except Exception:
+                if index.name not in {existing['name'] for existing in inspect(engine).get_indexes(table.name)}:
+                    raise
+    return added
+
 class User(db.Model, UserMixin):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -215,18 +266,53 @@ class UserSettings(db.Model):
         self._rapidapi_key = self._encrypt(value) if value else None
 
 
+class Job(db.Model):
+    """Canonical job posting, stored once no matter how often it is found"""
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    fingerprint = db.Column(db.String(40), unique=True, nullable=False, index=True)  # Content hash (see job_store.job_fingerprint)
+    
+    # Posting details
+    external_id = db.Column(db.String(256), nullable=True)  # Provider's id for the posting
+    title = db.Column(db.String(256), nullable=False)
+    company = db.Column(db.String(256), nullable=False)
+    location = db.Column(db.String(256), nullable=True)
+    job_type = db.Column(db.String(100), nullable=True)
+    salary = db.Column(db.String(256), nullable=True)
+    posted_date = db.Column(db.String(100), nullable=True)
+    description = db.Column(db.Text, nullable=True)
+    url = db.Column(db.String(1024), nullable=True)
+    source = db.Column(db.String(100), nullable=True)
+    
+    # Structured fields parsed at ingest (see job_search.normalize)
+    posted_at = db.Column(db.DateTime, nullable=True, index=True)  # UTC
+    salary_min = db.Column(db.Float, nullable=True)
+    salary_max = db.Column(db.Float, nullable=True)
+    currency = db.Column(db.String(3), nullable=True)
+    period = db.Column(db.String(10), nullable=True)  # hour, day, week, month or year
+    
+    other_sources = db.Column(db.Text, nullable=True)  # JSON list of other providers listing the posting
+    
+    first_seen_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    last_seen_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, index=True)
+    
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+
 class ApplicationHistory(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=False)
     
     # Job details
+    job_ref_id = db.Column(db.String(36), db.ForeignKey('job.id'), nullable=True, index=True)  # Canonical job (holds the description)
+    job = db.relationship('Job')
     job_id = db.Column(db.String(100), nullable=True)
     job_url = db.Column(db.String(1024), nullable=False)
     position = db.Column(db.String(256), nullable=False)
     company = db.Column(db.String(256), nullable=False)
     location = db.Column(db.String(256), nullable=True)
     platform = db.Column(db.String(100), nullable=False)
-    description = db.Column(db.Text, nullable=True)
+    description = db.Column(db.Text, nullable=True)  # Only set for rows without a job_ref_id
     
     # Match details
     match_score = db.Column(db.Integer, nullable=True)  # 0-100 score indicating match quality
@@ -246,4 +332,100 @@ class ApplicationHistory(db.Model):
     notification_sent = db.Column(db.Boolean, default=False)
     
     created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
\ No newline at end of file
+    updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+class SavedSearch(db.Model):
+    """A search run periodically in the background for a user"""
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=False, index=True)
+    name = db.Column(db.String(256), nullable=True)
+    
+    # Search criteria
+    keywords = db.Column(db.Text, nullable=False)  # Comma-separated list of keywords
+    location = db.Column(db.String(256), nullable=True)
+    job_type = db.Column(db.String(100), nullable=True)
+    sites = db.Column(db.Text, nullable=True)  # Comma-separated list of job sites (all when empty)
+    
+    # Scheduling
+    is_active = db.Column(db.Boolean, default=True)
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    
+    def get_keywords_list(self):
+        """Get keywords as a list"""
+        if not self.keywords:
+            return []
+        return [keyword.strip() for keyword in self.keywords.split(',') if keyword.strip()]
+    
+    def get_sites_list(self):
+        """Get job sites as a list (empty means all sites)"""
+        if not self.sites:
+            return []
+        return [site.strip() for site in self.sites.split(',') if site.strip()]
+    
+    def to_criteria(self):
+        """Get the search criteria dict used by the job searcher"""
+        criteria = {
+            'keywords': self.get_keywords_list(),
+            'location': self.location or '',
+            'job_type': self.job_type or ''
+        }
+        if self.get_sites_list():
+            criteria['sites'] = self.get_sites_list()
+        return criteria
+
+
+class SavedSearchMatch(db.Model):
+    """A new job found by a saved search, scored for the search's user"""
+    __table_args__ = (db.UniqueConstraint('saved_search_id', 'job_ref_id'),)
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    saved_search_id = db.Column(db.String(36), db.ForeignKey('saved_search.id'), nullable=False, index=True)
+    job_ref_id = db.Column(db.String(36), db.ForeignKey('job.id'), nullable=False)
+    job = db.relationship('Job')
+    match_score = db.Column(db.Integer, nullable=True)
+    match_reasons = db.Column(db.Text, nullable=True)  # JSON string containing match reasons
+    seen = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow, index=True)
+
+
+class SavedSearchSeenJob(db.Model):
+    """Fingerprints of the postings a saved-search query has already returned"""
+    query_fingerprint = db.Column(db.String(40), primary_key=True)  # Shared by identical searches
+    job_fingerprint = db.Column(db.String(40), primary_key=True)
+    first_seen_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+
+
+class ResumeBatch(db.Model):
+    """Resumes uploaded together and parsed in the background"""
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(db.String(36), db.ForeignKey('user.id'), nullable=False, index=True)
+    status = db.Column(db.String(20), default='queued')  # queued, running, completed or failed
+    total = db.Column(db.Integer, default=0)  # Number of resumes in the batch
+    processed = db.Column(db.Integer, default=0)  # Resumes parsed or failed so far
+    failed = db.Column(db.Integer, default=0)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    owner = db.Column(db.String(128), nullable=True)  # Web worker parsing the batch (host:pid:token)
+    updated_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)  # Owner's last heartbeat, to spot abandoned batches
+
+
+class ResumeBatchItem(db.Model):
+    """One resume of a batch and its parse result"""
+    __table_args__ = (db.Index('ix_resume_batch_item_batch_position', 'batch_id', 'position'),)
+    
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    batch_id = db.Column(db.String(36), db.ForeignKey('resume_batch.id'), nullable=False)
+    position = db.Column(db.Integer, nullable=False)  # Upload order (zip members in archive order)
+    filename = db.Column(db.String(512), nullable=False)
+    source_path = db.Column(db.String(1024), nullable=True)  # Saved upload, removed once the batch is done
+    source_member = db.Column(db.String(1024), nullable=True)  # Member of the saved zip, if any
+    status = db.Column(db.String(20), default='queued')  # queued, parsed or failed
+    result = db.Column(db.Text, nullable=True)  # JSON string containing the parsed resume
+    error = db.Column(db.Text, nullable=True)
+    parsed_at = db.Column(db.DateTime, nullable=True)
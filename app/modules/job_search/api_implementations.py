@@ -1,1179 +1,448 @@
-import requests
 import logging
 import json
 import time
-from urllib.parse import urlencode
-from datetime import datetime, timedelta
+from urllib.parse import urlencode, urlparse
+from app.modules.job_search.http_client import http_get
+from app.modules.job_search.provider_requests import fetch_json
+from app.modules.job_search.json_decoding import loads
+from app.modules.job_search.normalize import normalize_job, parse_posted_at, format_posted_date
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Dictionary to store hiring manager data for jobs
-hiring_manager_cache = {}
+# Fields every adapter emits, with the value used when the provider omits them
+JOB_FIELD_DEFAULTS = {
+    'title': 'Unknown Position',
+    'company': 'Unknown Company',
+    'location': '',
+    'job_type': '',
+    'salary': '',
+    'posted_date': 'Recently',
+    'description': '',
+    'url': ''
+}
 
-def _search_indeed(config, criteria):
-    """Search for jobs using Indeed API via RapidAPI
-    
-    API: https://rapidapi.com/indeed46-indeed46-default/api/indeed46
-    """
-    logger.info("Searching Indeed for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'indeed46.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'country': 'US',
-        'sort': '-1',  # sort by relevance
-        'page_size': '20'
-    }
-    
-    if location:
-        querystring['location'] = location
-    
-    if keywords:
-        querystring['query'] = keywords
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://indeed46.p.rapidapi.com/job'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('items', []):
-            # Extract job details
-            job = {
-                'id': f"indeed-{item.get('job_id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company_name', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('job_type', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('posted_at', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'indeed'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Indeed API error: {str(e)}")
-        return []
+# Item keys used when an adapter doesn't override a field
+DEFAULT_FIELDS = {
+    'title': 'title',
+    'company': 'company',
+    'location': 'location',
+    'job_type': 'type',
+    'salary': 'salary',
+    'posted_date': 'date',
+    'description': 'description',
+    'url': 'url'
+}
 
-def _search_upwork(config, criteria):
-    """Search for jobs using Upwork API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/upwork-jobs
-    """
-    logger.info("Searching Upwork for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'upwork-jobs.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://upwork-jobs.p.rapidapi.com/jobs'),
-            headers=headers
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Check if job title matches keywords
-            if keywords and not any(keyword.lower() in item.get('title', '').lower() for keyword in keywords.split()):
-                continue
-                
-            # Format job
-            job = {
-                'id': f"upwork-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': 'Upwork Client',
-                'location': 'Remote',
-                'job_type': item.get('type', 'Contract'),
-                'salary': item.get('budget', {}).get('amount', ''),
-                'posted_date': _format_date(item.get('date_created', '')),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'upwork'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Upwork API error: {str(e)}")
-        return []
+class ProviderAdapter:
+    """Declarative description of a job search provider
 
-def _search_google_jobs(config, criteria):
-    """Search for jobs using Google Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/google-jobs-api
-    """
-    logger.info("Searching Google Jobs for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    job_type = criteria.get('job_type', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'google-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if job_type:
-        querystring['jobType'] = job_type
-    
-    if keywords:
-        querystring['include'] = keywords
-    
-    if location:
-        querystring['location'] = location
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://google-jobs-api.p.rapidapi.com/google-jobs/job-type'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"google-{hash(item.get('title', '') + item.get('company', ''))}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('jobType', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('posted', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'google'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Google Jobs API error: {str(e)}")
-        return []
+    Each adapter declares how criteria map onto the provider's request and
+    how items in the provider's response map onto our job fields, so every
+    provider shares the same request/parse code path.
 
-def _search_workday(config, criteria):
-    """Search for jobs using Workday Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/workday-jobs-api
+    Args:
+        name: Site key used in Config.get_job_portal_configs()
+        label: Human readable provider name used in logs
+        source: Value stored in each job's 'source' field
+        id_prefix: Prefix of each job's 'id'
+        url: Default endpoint URL (overridden by the portal config)
+        method: 'GET' (criteria sent as query params) or 'POST' (JSON body)
+        params: Static query parameters sent with every request
+        param_map: dict of query param -> (criterion, formatter or None)
+        criteria_defaults: Values used for criteria missing from the search
+        body_builder: Callable building the JSON body from criteria values
+        items_path: Keys leading to the list of items in the response
+        id_field: Item field holding the provider's job id, or None to hash
+            title and company
+        fields: dict of job field -> item key (or tuple of nested keys)
+        field_defaults: Per-field overrides of JOB_FIELD_DEFAULTS
+        constants: Job fields with a fixed value for this provider
+        transforms: dict of job field -> callable applied to the raw value
+        filter_keywords: Drop items whose title matches none of the keywords
+        filter_location: Drop items whose location doesn't contain the location
+        paging: (query param, first value, step) used to request later result
+            pages, e.g. ('offset', 0, 100) or ('page', 1, 1); None when the
+            provider returns a single page
+        stream: Stream large responses, keeping only the items (for feeds
+            that can be several MB)
+        salary_period: Pay period of salaries that don't state one, e.g.
+            'fixed' for project budgets (see normalize.parse_salary)
     """
-    logger.info("Searching Workday for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'workday-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if keywords:
-        querystring['title_filter'] = f'"{keywords}"'
-    
-    if location:
-        querystring['location_filter'] = f'"{location}"'
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://workday-jobs-api.p.rapidapi.com/active-ats-24h'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"workday-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Full-time',  # Default to full-time
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('posted_date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'workday'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Workday API error: {str(e)}")
-        return []
 
-def _search_glassdoor(config, criteria):
-    """Search for jobs using Glassdoor API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/glassdoor-jobs-scraper-api
-    """
-    logger.info("Searching Glassdoor for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'glassdoor-jobs-scraper-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', ''),
-        'Content-Type': 'application/json'
-    }
-    
-    # Prepare request data
-    payload = {
-        "scraper": {
-            "filters": {
-                "country": "us",
-                "keyword": keywords,
-                "location": location or "United States"
-            },
-            "maxRows": 20
+    def __init__(self, name, label, source, id_prefix, url, method='GET', params=None,
+                 param_map=None, criteria_defaults=None, body_builder=None, items_path=('jobs',),
+                 id_field='id', fields=None, field_defaults=None, constants=None,
+                 transforms=None, filter_keywords=False, filter_location=False, paging=None,
+                 stream=False, salary_period=None):
+        self.name = name
+        self.label = label
+        self.source = source
+        self.id_prefix = id_prefix
+        self.url = url
+        self.host = urlparse(url).netloc
+        self.method = method
+        self.params = params or {}
+        self.param_map = param_map or {}
+        self.criteria_defaults = criteria_defaults or {}
+        self.body_builder = body_builder
+        self.items_path = items_path
+        self.id_field = id_field
+        self.fields = dict(DEFAULT_FIELDS, **(fields or {}))
+        self.field_defaults = dict(JOB_FIELD_DEFAULTS, **(field_defaults or {}))
+        self.constants = constants or {}
+        self.transforms = transforms or {}
+        self.filter_keywords = filter_keywords
+        self.filter_location = filter_location
+        self.paging = paging
+        self.stream = stream
+        self.salary_period = salary_period
+
+        # How each job field is filled, worked out once instead of per item:
+        # (field, constant, item key path, transform, default)
+        self._field_plan = []
+        for field, default in self.field_defaults.items():
+            if field in self.constants:
+                self._field_plan.append((field, self.constants[field], None, None, default))
+            else:
+                path = self.fields[field]
+                path = (path,) if isinstance(path, str) else tuple(path)
+                self._field_plan.append((field, None, path, self.transforms.get(field), default))
+
+    def criteria_values(self, criteria):
+        """Extract the criteria values used to build the request"""
+        values = {
+            'keywords': ' '.join(criteria.get('keywords', [])),
+            'location': criteria.get('location', ''),
+            'job_type': criteria.get('job_type', '')
         }
-    }
-    
-    # Make the request
-    try:
-        response = requests.post(
-            config.get('url', 'https://glassdoor-jobs-scraper-api.p.rapidapi.com/api/job/wait'),
-            headers=headers,
-            json=payload
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('data', {}).get('jobs', []):
-            # Format job
-            job = {
-                'id': f"glassdoor-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('jobType', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('postedDate', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'glassdoor'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Glassdoor API error: {str(e)}")
-        return []
+        for criterion, default in self.criteria_defaults.items():
+            if criterion not in criteria:
+                values[criterion] = default
+        return values
 
-def _search_startup_jobs(config, criteria):
-    """Search for jobs using Startup Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/startup-jobs-api
-    """
-    logger.info("Searching Startup Jobs for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'startup-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'source': 'ycombinator'
-    }
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://startup-jobs-api.p.rapidapi.com/active-jb-7d'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Check if job title matches keywords
-            if keywords and not any(keyword.lower() in item.get('title', '').lower() for keyword in keywords.split()):
-                continue
-                
-            # Format job
-            job = {
-                'id': f"startup-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Full-time',  # Startups typically hire full-time
-                'salary': '',  # Startups typically don't list salary
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'startup'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Startup Jobs API error: {str(e)}")
-        return []
+    def build_request(self, config, criteria, page=0):
+        """Build the request for a page of search results
 
-def _search_job_search(config, criteria):
-    """Search for jobs using Job Search API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/job-search-api2
-    """
-    logger.info("Searching Job Search API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'job-search-api2.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if keywords:
-        querystring['title_filter'] = keywords
-        
-    if location:
-        querystring['location_filter'] = location
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://job-search-api2.p.rapidapi.com/active-ats-expired'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"jobsearch-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('job_type', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'jobsearch'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Job Search API error: {str(e)}")
-        return []
+        Returns:
+            tuple: (method, url, headers, params, json body)
+        """
+        values = self.criteria_values(criteria)
+        headers = {
+            'x-rapidapi-host': config.get('host', self.host),
+            'x-rapidapi-key': config.get('api_key', '')
+        }
 
-def _search_internships(config, criteria):
-    """Search for jobs using Internships API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/internships-api
-    """
-    logger.info("Searching Internships API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'internships-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://internships-api.p.rapidapi.com/active-jb-7d'),
-            headers=headers
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Check if job matches criteria
-            if keywords and not any(keyword.lower() in item.get('title', '').lower() for keyword in keywords.split()):
-                continue
-                
-            if location and location.lower() not in item.get('location', '').lower():
-                continue
-                
-            # Format job
-            job = {
-                'id': f"internship-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Internship',
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'internship'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Internships API error: {str(e)}")
-        return []
+        params = dict(self.params)
+        for param, (criterion, formatter) in self.param_map.items():
+            value = values.get(criterion)
+            if value:
+                params[param] = formatter(value) if formatter else value
+        if page and self.paging:
+            param, first, step = self.paging
+            params[param] = str(first + page * step)
 
-def _search_active_jobs(config, criteria):
-    """Search for jobs using Active Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/desolateventure/api/active-jobs-db
-    """
-    logger.info("Searching Active Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'active-jobs-db.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'offset': '0',
-        'description_type': 'text'
-    }
-    
-    if keywords:
-        querystring['title_filter'] = f'"{keywords}"'
-        
-    if location:
-        querystring['location_filter'] = f'"{location}"'
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://active-jobs-db.p.rapidapi.com/active-ats-1h'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"activejob-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('type', 'Full-time'),
-                'salary': item.get('salary', ''),
-                'posted_date': 'Today',  # Active jobs are posted within the last hour
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'activejobs'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Active Jobs API error: {str(e)}")
-        return []
+        body = None
+        if self.body_builder:
+            body = self.body_builder(values)
+            headers['Content-Type'] = 'application/json'
 
-def _search_indeed_api(config, criteria):
-    """Search for jobs using Indeed Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/indeed-jobs-api.p.rapidapi.com
-    """
-    logger.info("Searching Indeed Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'indeed-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'offset': '0'
-    }
-    
-    if keywords:
-        querystring['keyword'] = keywords
-        
-    if location:
-        querystring['location'] = location
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://indeed-jobs-api.p.rapidapi.com/indeed-us/'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"indeed-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('type', 'Full-time'),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date_posted', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'indeed-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Indeed Jobs API error: {str(e)}")
-        return []
+        return self.method, config.get('url', self.url), headers, params, body
 
-def _search_jobs_api(config, criteria):
-    """Search for jobs using Jobs API via RapidAPI
-    
-    API: https://rapidapi.com/jobs-api22.p.rapidapi.com
-    """
-    logger.info("Searching Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'jobs-api22.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if keywords:
-        querystring['skill'] = keywords
-        
-    if location:
-        querystring['locations'] = location
-    
-    # Optional parameters - defaults for better results
-    querystring['levels'] = 'Entry'
-    querystring['industry'] = 'Technology'
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://jobs-api22.p.rapidapi.com/tags'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"jobs-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('type', 'Full-time'),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date_posted', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'jobs-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Jobs API error: {str(e)}")
-        return []
+    def search(self, config, criteria, page=0):
+        """Query the provider for one result page and map it to job dicts
 
-def _search_linkedin_api(config, criteria):
-    """Search for jobs using LinkedIn API via RapidAPI
-    
-    API: https://rapidapi.com/linkedin-job-search-api.p.rapidapi.com
-    """
-    logger.info("Searching LinkedIn API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'linkedin-job-search-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'limit': '10',
-        'offset': '0'
-    }
-    
-    if keywords:
-        querystring['title_filter'] = f'"{keywords}"'
-        
-    if location:
-        querystring['location_filter'] = f'"{location}"'
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://linkedin-job-search-api.p.rapidapi.com/active-jb-7d'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"linkedin-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('type', 'Full-time'),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'linkedin-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"LinkedIn API error: {str(e)}")
-        return []
+        Raises:
+            requests.RequestException, ValueError: if the request or response fails
+        """
+        logger.info(f"Searching {self.label} for jobs" + (f" (page {page + 1})" if page else ""))
+        method, url, headers, params, body = self.build_request(config, criteria, page)
+        # Duplicate sites on the same endpoint share one request (see provider_requests)
+        data = fetch_json(self.name, method, url, headers, params, body,
+                          stream_items=self.items_path if self.stream else None)
+        return self.parse(data, criteria)
 
-def _search_linkedin_job_api(config, criteria):
-    """Search for jobs using LinkedIn Job API via RapidAPI
-    
-    API: https://rapidapi.com/linkedin-job-api.p.rapidapi.com
-    """
-    logger.info("Searching LinkedIn Job API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'linkedin-job-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'page': '1'
-    }
-    
-    if keywords:
-        querystring['keyword'] = keywords
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://linkedin-job-api.p.rapidapi.com/job/search'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('data', []):
-            # Format job
-            job = {
-                'id': f"linkedin-job-api-{item.get('jobId', '')}",
-                'title': item.get('jobTitle', 'Unknown Position'),
-                'company': item.get('companyName', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Full-time',  # Default if not provided
-                'salary': '',  # Not typically provided
-                'posted_date': item.get('postedAt', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('jobUrl', ''),
-                'source': 'linkedin-job-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"LinkedIn Job API error: {str(e)}")
-        return []
+    def iter_pages(self, fetch_page, max_pages):
+        """Lazily yield result pages, requesting each page only when asked for
 
-def _search_google_jobs_api(config, criteria):
-    """Search for jobs using Google Jobs API via RapidAPI (additional provider)
-    
-    API: https://rapidapi.com/google-jobs-api.p.rapidapi.com
-    """
-    logger.info("Searching Google Jobs API for jobs")
-    
-    # Extract criteria
-    job_type = criteria.get('job_type', 'Full-time')
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'google-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if job_type:
-        querystring['jobType'] = job_type
-        
-    if keywords:
-        querystring['include'] = keywords
-        
-    if location:
-        querystring['location'] = location
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://google-jobs-api.p.rapidapi.com/google-jobs/job-type'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"google-jobs-api-{hash(item.get('title', '') + item.get('company', ''))}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('jobType', 'Full-time'),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('posted', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'google-jobs-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Google Jobs API error: {str(e)}")
-        return []
+        Stops at the page limit, at an empty page, or at a page of jobs
+        already yielded (a provider ignoring the page parameter).
+
+        Args:
+            fetch_page: Callable taking a page number (0-based) and returning
+                that page's jobs, so callers can cache and rate limit each request
+            max_pages: Maximum number of pages (1 when the provider can't page)
+
+        Yields:
+            list: The new jobs of each page
+        """
+        seen_ids = set()
+        for page in range(max_pages if self.paging else 1):
+            new_jobs = [job for job in fetch_page(page) if job['id'] not in seen_ids]
+            if not new_jobs:
+                return
+            seen_ids.update(job['id'] for job in new_jobs)
+            yield new_jobs
+
+    def parse(self, data, criteria):
+        """Map a decoded provider response to job dicts"""
+        values = self.criteria_values(criteria)
+        title_words = [word.lower() for word in values['keywords'].split()] if self.filter_keywords else []
+        location = values['location'].lower() if self.filter_location else ''
 
-def _search_workday_jobs_api(config, criteria):
-    """Search for jobs using Workday Jobs API via RapidAPI (additional provider)
-    
-    API: https://rapidapi.com/workday-jobs-api.p.rapidapi.com
-    """
-    logger.info("Searching Workday Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'workday-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if keywords:
-        querystring['title_filter'] = f'"{keywords}"'
-        
-    if location:
-        querystring['location_filter'] = f'"{location}"'
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://workday-jobs-api.p.rapidapi.com/active-ats-24h'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
         jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"workday-jobs-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Full-time',  # Default to full-time
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('posted_date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'workday-jobs-api'
-            }
-            
-            jobs.append(job)
-        
+        for item in _dig(data, self.items_path) or []:
+            if title_words and not any(word in item.get('title', '').lower() for word in title_words):
+                continue
+            if location and location not in item.get('location', '').lower():
+                continue
+            jobs.append(self.map_item(item))
         return jobs
-    
-    except Exception as e:
-        logger.error(f"Workday Jobs API error: {str(e)}")
-        return []
 
-def _search_glassdoor_jobs_api(config, criteria):
-    """Search for jobs using Glassdoor Jobs API via RapidAPI (additional provider)
-    
-    API: https://rapidapi.com/glassdoor-jobs-scraper-api.p.rapidapi.com
-    """
-    logger.info("Searching Glassdoor Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'glassdoor-jobs-scraper-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', ''),
-        'Content-Type': 'application/json'
-    }
-    
-    # Prepare request data
-    payload = {
+    def map_item(self, item):
+        """Map a single provider item to a job dict"""
+        if self.id_field:
+            item_id = item.get(self.id_field, '')
+        else:
+            item_id = hash(item.get('title', '') + item.get('company', ''))
+
+        job = {'id': f"{self.id_prefix}-{item_id}"}
+        raw_posted = None
+        for field, constant, path, transform, default in self._field_plan:
+            if path is None:
+                job[field] = constant
+                continue
+            if len(path) == 1:
+                value = item.get(path[0])
+            else:
+                value = _dig(item, path)
+            if field == 'posted_date':
+                raw_posted = value
+            if transform is not None:
+                value = transform(value)
+            elif value is None:
+                value = default
+            job[field] = value
+        job['source'] = self.source
+        # Parse dates and salaries once here, so scoring and filtering compare numbers
+        return normalize_job(job, raw_posted, salary_period=self.salary_period)
+
+def _dig(data, path):
+    """Follow a key or tuple of keys into nested dicts, returning None when missing"""
+    if isinstance(path, str):
+        path = (path,)
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+def _quoted(value):
+    """Wrap a filter value in double quotes for exact-phrase matching"""
+    return f'"{value}"'
+
+def _glassdoor_payload(values):
+    """Build the Glassdoor scraper request body"""
+    return {
         "scraper": {
             "filters": {
                 "country": "us",
-                "keyword": keywords,
-                "location": location or "United States"
+                "keyword": values['keywords'],
+                "location": values['location'] or "United States"
             },
             "maxRows": 20
         }
     }
-    
-    # Make the request
-    try:
-        response = requests.post(
-            config.get('url', 'https://glassdoor-jobs-scraper-api.p.rapidapi.com/api/job/wait'),
-            headers=headers,
-            json=payload
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('data', {}).get('jobs', []):
-            # Format job
-            job = {
-                'id': f"glassdoor-jobs-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('jobType', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('postedDate', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'glassdoor-jobs-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Glassdoor Jobs API error: {str(e)}")
-        return []
 
-def _search_startup_jobs_api(config, criteria):
-    """Search for jobs using Startup Jobs API via RapidAPI (additional provider)
-    
-    API: https://rapidapi.com/startup-jobs-api.p.rapidapi.com
-    """
-    logger.info("Searching Startup Jobs API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'startup-jobs-api.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {
-        'source': 'ycombinator'
-    }
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://startup-jobs-api.p.rapidapi.com/active-jb-7d'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Check if job title matches keywords
-            if keywords and not any(keyword.lower() in item.get('title', '').lower() for keyword in keywords.split()):
-                continue
-                
-            # Format job
-            job = {
-                'id': f"startup-jobs-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': 'Full-time',  # Startups typically hire full-time
-                'salary': '',  # Startups typically don't list salary
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'startup-jobs-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Startup Jobs API error: {str(e)}")
-        return []
+def _build_registry():
+    """Build the provider registry (called once at import)"""
+    adapters = [
+        # API: https://rapidapi.com/indeed46-indeed46-default/api/indeed46
+        ProviderAdapter(
+            'indeed', 'Indeed', 'indeed', 'indeed',
+            url='https://indeed46.p.rapidapi.com/job',
+            params={'country': 'US', 'sort': '-1', 'page_size': '20'},
+            param_map={'location': ('location', None), 'query': ('keywords', None)},
+            items_path=('items',), id_field='job_id', paging=('offset', 0, 20),
+            fields={'company': 'company_name', 'job_type': 'job_type', 'posted_date': 'posted_at'}
+        ),
+        # API: https://rapidapi.com/desolateventure/api/upwork-jobs
+        ProviderAdapter(
+            'upwork', 'Upwork', 'upwork', 'upwork',
+            url='https://upwork-jobs.p.rapidapi.com/jobs',
+            fields={'salary': ('budget', 'amount'), 'posted_date': 'date_created'},
+            field_defaults={'job_type': 'Contract'},
+            constants={'company': 'Upwork Client', 'location': 'Remote'},
+            transforms={'posted_date': lambda value: _format_date(value or '')},
+            filter_keywords=True, salary_period='fixed'
+        ),
+        # API: https://rapidapi.com/desolateventure/api/google-jobs-api
+        ProviderAdapter(
+            'google', 'Google Jobs', 'google', 'google',
+            url='https://google-jobs-api.p.rapidapi.com/google-jobs/job-type',
+            param_map={'jobType': ('job_type', None), 'include': ('keywords', None),
+                       'location': ('location', None)},
+            id_field=None,
+            fields={'job_type': 'jobType', 'posted_date': 'posted'}
+        ),
+        # API: https://rapidapi.com/desolateventure/api/workday-jobs-api
+        ProviderAdapter(
+            'workday', 'Workday', 'workday', 'workday',
+            url='https://workday-jobs-api.p.rapidapi.com/active-ats-24h',
+            param_map={'title_filter': ('keywords', _quoted), 'location_filter': ('location', _quoted)},
+            fields={'posted_date': 'posted_date'},
+            constants={'job_type': 'Full-time'},
+            paging=('offset', 0, 100), stream=True
+        ),
+        # API: https://rapidapi.com/desolateventure/api/glassdoor-jobs-scraper-api
+        ProviderAdapter(
+            'glassdoor', 'Glassdoor', 'glassdoor', 'glassdoor',
+            url='https://glassdoor-jobs-scraper-api.p.rapidapi.com/api/job/wait',
+            method='POST', body_builder=_glassdoor_payload, items_path=('data', 'jobs'),
+            fields={'job_type': 'jobType', 'posted_date': 'postedDate'},
+            stream=True
+        ),
+        # API: https://rapidapi.com/desolateventure/api/startup-jobs-api
+        ProviderAdapter(
+            'startup', 'Startup Jobs', 'startup', 'startup',
+            url='https://startup-jobs-api.p.rapidapi.com/active-jb-7d',
+            params={'source': 'ycombinator'},
+            constants={'job_type': 'Full-time', 'salary': ''},
+            filter_keywords=True, paging=('offset', 0, 100)
+        ),
+        # API: https://rapidapi.com/desolateventure/api/job-search-api2
+        ProviderAdapter(
+            'job_search', 'Job Search API', 'jobsearch', 'jobsearch',
+            url='https://job-search-api2.p.rapidapi.com/active-ats-expired',
+            param_map={'title_filter': ('keywords', None), 'location_filter': ('location', None)},
+            fields={'job_type': 'job_type'},
+            paging=('offset', 0, 100)
+        ),
+        # API: https://rapidapi.com/desolateventure/api/internships-api
+        ProviderAdapter(
+            'internships', 'Internships API', 'internship', 'internship',
+            url='https://internships-api.p.rapidapi.com/active-jb-7d',
+            constants={'job_type': 'Internship'},
+            filter_keywords=True, filter_location=True, paging=('offset', 0, 100)
+        ),
+        # API: https://rapidapi.com/desolateventure/api/active-jobs-db
+        ProviderAdapter(
+            'active_jobs', 'Active Jobs API', 'activejobs', 'activejob',
+            url='https://active-jobs-db.p.rapidapi.com/active-ats-1h',
+            params={'offset': '0', 'description_type': 'text'},
+            param_map={'title_filter': ('keywords', _quoted), 'location_filter': ('location', _quoted)},
+            field_defaults={'job_type': 'Full-time'},
+            # Active jobs are posted within the last hour
+            constants={'posted_date': 'Today'},
+            paging=('offset', 0, 100), stream=True
+        ),
+        # API: https://rapidapi.com/indeed-jobs-api.p.rapidapi.com
+        ProviderAdapter(
+            'indeed_api', 'Indeed Jobs API', 'indeed-api', 'indeed-api',
+            url='https://indeed-jobs-api.p.rapidapi.com/indeed-us/',
+            params={'offset': '0'},
+            param_map={'keyword': ('keywords', None), 'location': ('location', None)},
+            fields={'posted_date': 'date_posted'},
+            field_defaults={'job_type': 'Full-time'},
+            paging=('offset', 0, 10)
+        ),
+        # API: https://rapidapi.com/jobs-api22.p.rapidapi.com
+        ProviderAdapter(
+            'jobs_api', 'Jobs API', 'jobs-api', 'jobs-api',
+            url='https://jobs-api22.p.rapidapi.com/tags',
+            params={'levels': 'Entry', 'industry': 'Technology'},
+            param_map={'skill': ('keywords', None), 'locations': ('location', None)},
+            fields={'posted_date': 'date_posted'},
+            field_defaults={'job_type': 'Full-time'}
+        ),
+        # API: https://rapidapi.com/linkedin-job-search-api.p.rapidapi.com
+        ProviderAdapter(
+            'linkedin_search', 'LinkedIn API', 'linkedin-api', 'linkedin-api',
+            url='https://linkedin-job-search-api.p.rapidapi.com/active-jb-7d',
+            params={'limit': '10', 'offset': '0'},
+            param_map={'title_filter': ('keywords', _quoted), 'location_filter': ('location', _quoted)},
+            field_defaults={'job_type': 'Full-time'},
+            paging=('offset', 0, 10)
+        ),
+        # API: https://rapidapi.com/linkedin-job-api.p.rapidapi.com
+        ProviderAdapter(
+            'linkedin_job', 'LinkedIn Job API', 'linkedin-job-api', 'linkedin-job-api',
+            url='https://linkedin-job-api.p.rapidapi.com/job/search',
+            params={'page': '1'},
+            param_map={'keyword': ('keywords', None)},
+            items_path=('data',), id_field='jobId',
+            fields={'title': 'jobTitle', 'company': 'companyName', 'posted_date': 'postedAt',
+                    'url': 'jobUrl'},
+            constants={'job_type': 'Full-time', 'salary': ''},
+            paging=('page', 1, 1)
+        ),
+        # API: https://rapidapi.com/google-jobs-api.p.rapidapi.com
+        ProviderAdapter(
+            'google_jobs', 'Google Jobs API', 'google-jobs-api', 'google-jobs-api',
+            url='https://google-jobs-api.p.rapidapi.com/google-jobs/job-type',
+            param_map={'jobType': ('job_type', None), 'include': ('keywords', None),
+                       'location': ('location', None)},
+            criteria_defaults={'job_type': 'Full-time'},
+            id_field=None,
+            fields={'job_type': 'jobType', 'posted_date': 'posted'},
+            field_defaults={'job_type': 'Full-time'}
+        ),
+        # API: https://rapidapi.com/workday-jobs-api.p.rapidapi.com
+        ProviderAdapter(
+            'workday_jobs', 'Workday Jobs API', 'workday-jobs-api', 'workday-jobs-api',
+            url='https://workday-jobs-api.p.rapidapi.com/active-ats-24h',
+            param_map={'title_filter': ('keywords', _quoted), 'location_filter': ('location', _quoted)},
+            fields={'posted_date': 'posted_date'},
+            constants={'job_type': 'Full-time'},
+            paging=('offset', 0, 100), stream=True
+        ),
+        # API: https://rapidapi.com/glassdoor-jobs-scraper-api.p.rapidapi.com
+        ProviderAdapter(
+            'glassdoor_jobs', 'Glassdoor Jobs API', 'glassdoor-jobs-api', 'glassdoor-jobs-api',
+            url='https://glassdoor-jobs-scraper-api.p.rapidapi.com/api/job/wait',
+            method='POST', body_builder=_glassdoor_payload, items_path=('data', 'jobs'),
+            fields={'job_type': 'jobType', 'posted_date': 'postedDate'},
+            stream=True
+        ),
+        # API: https://rapidapi.com/startup-jobs-api.p.rapidapi.com
+        ProviderAdapter(
+            'startup_jobs', 'Startup Jobs API', 'startup-jobs-api', 'startup-jobs-api',
+            url='https://startup-jobs-api.p.rapidapi.com/active-jb-7d',
+            params={'source': 'ycombinator'},
+            constants={'job_type': 'Full-time', 'salary': ''},
+            filter_keywords=True, paging=('offset', 0, 100)
+        ),
+        # API: https://rapidapi.com/job-search-api2.p.rapidapi.com
+        ProviderAdapter(
+            'job_search_api', 'Job Search API', 'job-search-api', 'job-search-api',
+            url='https://job-search-api2.p.rapidapi.com/active-ats-expired',
+            param_map={'title_filter': ('keywords', None), 'location_filter': ('location', None)},
+            fields={'job_type': 'job_type'},
+            paging=('offset', 0, 100)
+        ),
+    ]
+    return {adapter.name: adapter for adapter in adapters}
 
-def _search_job_search_api(config, criteria):
-    """Search for jobs using Job Search API via RapidAPI (additional provider)
-    
-    API: https://rapidapi.com/job-search-api2.p.rapidapi.com
-    """
-    logger.info("Searching Job Search API for jobs")
-    
-    # Extract criteria
-    keywords = ' '.join(criteria.get('keywords', []))
-    location = criteria.get('location', '')
-    
-    # Prepare headers
-    headers = {
-        'x-rapidapi-host': config.get('host', 'job-search-api2.p.rapidapi.com'),
-        'x-rapidapi-key': config.get('api_key', '')
-    }
-    
-    # Prepare parameters
-    querystring = {}
-    
-    if keywords:
-        querystring['title_filter'] = keywords
-        
-    if location:
-        querystring['location_filter'] = location
-    
-    # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://job-search-api2.p.rapidapi.com/active-ats-expired'),
-            headers=headers,
-            params=querystring
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        jobs = []
-        
-        for item in data.get('jobs', []):
-            # Format job
-            job = {
-                'id': f"job-search-api-{item.get('id', '')}",
-                'title': item.get('title', 'Unknown Position'),
-                'company': item.get('company', 'Unknown Company'),
-                'location': item.get('location', ''),
-                'job_type': item.get('job_type', ''),
-                'salary': item.get('salary', ''),
-                'posted_date': item.get('date', 'Recently'),
-                'description': item.get('description', ''),
-                'url': item.get('url', ''),
-                'source': 'job-search-api'
-            }
-            
-            jobs.append(job)
-        
-        return jobs
-    
-    except Exception as e:
-        logger.error(f"Job Search API error: {str(e)}")
-        return []
+# Provider adapters keyed by site, built once at import
+PROVIDERS = _build_registry()
+
+def get_provider(site):
+    """Get the adapter for a site, or None if the site has no search adapter"""
+    return PROVIDERS.get(site)
 
-def _fetch_hiring_manager_info(config, job_id=None):
-    """Fetch hiring manager information for a job
+def _download_hiring_managers(config):
+    """Download the hiring manager feed
     
     API: https://hiring-manager-api.p.rapidapi.com/recruitment-manager-24h
+    
+    Returns:
+        list: Manager dicts with name, title, email, phone and company
+        
+    Raises:
+        requests.RequestException, ValueError: if the request or response fails
     """
     logger.info("Fetching hiring manager information")
     
-    # If we already have hiring manager data cached and no specific job_id provided, return the cache
-    if not job_id and hiring_manager_cache:
-        return hiring_manager_cache
-    
     # Prepare headers
     headers = {
         'x-rapidapi-host': config.get('host', 'hiring-manager-api.p.rapidapi.com'),
@@ -1181,73 +450,29 @@ def _fetch_hiring_manager_info(config, job_id=None):
     }
     
     # Make the request
-    try:
-        response = requests.get(
-            config.get('url', 'https://hiring-manager-api.p.rapidapi.com/recruitment-manager-24h'),
-            headers=headers
-        )
-        
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
-        
-        # Store manager data by company name for easier lookup
-        managers_by_company = {}
-        
-        for manager in data.get('managers', []):
-            company = manager.get('company', '').lower()
-            if company:
-                if company not in managers_by_company:
-                    managers_by_company[company] = []
-                    
-                managers_by_company[company].append({
-                    'name': manager.get('name', ''),
-                    'title': manager.get('title', ''),
-                    'email': manager.get('email', ''),
-                    'phone': manager.get('phone', ''),
-                    'company': manager.get('company', '')
-                })
-        
-        # Update our cache
-        hiring_manager_cache = managers_by_company
-        
-        # If a specific job_id was requested, find that manager
-        if job_id:
-            # This would require additional logic to match a job_id to a company
-            # For demo purposes, we'll just return None
-            return None
-            
-        return managers_by_company
-    
-    except Exception as e:
-        logger.error(f"Hiring Manager API error: {str(e)}")
-        return {} if not job_id else None
+    response = http_get(
+        config.get('url', 'https://hiring-manager-api.p.rapidapi.com/recruitment-manager-24h'),
+        headers=headers
+    )
+    response.raise_for_status()
+    
+    # Parse the response
+    data = loads(response.content)
+    managers = []
+    for manager in data.get('managers', []):
+        if manager.get('company'):
+            managers.append({
+                'name': manager.get('name', ''),
+                'title': manager.get('title', ''),
+                'email': manager.get('email', ''),
+                'phone': manager.get('phone', ''),
+                'company': manager.get('company', '')
+            })
+    
+    return managers
 
 # Helper functions
 
 def _format_date(timestamp):
     """Format a timestamp to '3 days ago' format"""
-    if not timestamp:
-        return "Recently"
-    
-    try:
-        # Parse the timestamp (format depends on the API)
-        try:
-            post_date = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        except:
-            try:
-                post_date = datetime.fromtimestamp(int(timestamp) / 1000)
-            except:
-                return "Recently"
-        
-        days_diff = (datetime.now() - post_date).days
-        
-        if days_diff == 0:
-            return "Today"
-        elif days_diff == 1:
-            return "Yesterday"
-        else:
-            return f"{days_diff} days ago"
-    except:
-        return "Recently"
\ No newline at end of file
+    return format_posted_date(parse_posted_at(timestamp))
@@ -0,0 +1,285 @@
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from app.config import Config
+from app.modules.job_search.sqlite_store import get_connection
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def normalize_criteria(criteria):
+    """Reduce search criteria to the fields that change provider results
+
+    Keywords are lowercased, stripped and sorted so that "Python, Django" and
+    "django, python" share a cache entry.
+    """
+    keywords = criteria.get('keywords', []) or []
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    return {
+        'keywords': sorted({k.strip().lower() for k in keywords if k and k.strip()}),
+        'location': (criteria.get('location') or '').strip().lower(),
+        'job_type': (criteria.get('job_type') or '').strip().lower()
+    }
+
+def make_cache_key(provider, criteria, page=0):
+    """Build the cache key for a provider, a set of search criteria and a result page"""
+    normalized = json.dumps(normalize_criteria(criteria), sort_keys=True)
+    digest = hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+    # The first page keeps the unpaged key, so existing entries stay valid
+    return f"{provider}:{digest}:p{page}" if page else f"{provider}:{digest}"
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache backend (not shared between workers)
+
+    Values are stored serialized so callers can't mutate cached jobs.
+    """
+
+    name = 'memory'
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return json.loads(entry[0]), entry[1]
+
+    def set(self, key, value, stored_at):
+        serialized = json.dumps(value)
+        with self._lock:
+            self._entries[key] = (serialized, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, counter, provider):
+        with self._lock:
+            counter_key = (counter, provider)
+            self._counters[counter_key] = self._counters.get(counter_key, 0) + 1
+
+    def counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+    def size(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """LRU cache backend stored in a SQLite file shared by all workers"""
+
+    name = 'sqlite'
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        conn = get_connection(self.path)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS search_cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+            'stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_search_cache_accessed ON search_cache (accessed_at)')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS search_cache_stats ('
+            'counter TEXT NOT NULL, provider TEXT NOT NULL, value INTEGER NOT NULL, '
+            'PRIMARY KEY (counter, provider))'
+        )
+
+    def get(self, key):
+        conn = get_connection(self.path)
+        row = conn.execute('SELECT value, stored_at FROM search_cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        conn.execute('UPDATE search_cache SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        return json.loads(row[0]), row[1]
+
+    def set(self, key, value, stored_at):
+        conn = get_connection(self.path)
+        conn.execute(
+            'INSERT OR REPLACE INTO search_cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)',
+            (key, json.dumps(value), stored_at, time.time())
+        )
+        # Evict least recently used entries beyond the size bound
+        conn.execute(
+            'DELETE FROM search_cache WHERE key IN ('
+            'SELECT key FROM search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,)
+        )
+
+    def delete(self, key):
+        get_connection(self.path).execute('DELETE FROM search_cache WHERE key = ?', (key,))
+
+    def incr(self, counter, provider):
+        get_connection(self.path).execute(
+            'INSERT INTO search_cache_stats (counter, provider, value) VALUES (?, ?, 1) '
+            'ON CONFLICT (counter, provider) DO UPDATE SET value = value + 1',
+            (counter, provider)
+        )
+
+    def counters(self):
+        rows = get_connection(self.path).execute('SELECT counter, provider, value FROM search_cache_stats')
+        return {(counter, provider): value for counter, provider, value in rows}
+
+    def size(self):
+        return get_connection(self.path).execute('SELECT COUNT(*) FROM search_cache').fetchone()[0]
+
+
+class SearchCache:
+    """TTL cache for provider search results with stale-while-revalidate
+
+    Fresh entries are returned directly. Entries past their TTL but still
+    inside the stale window are returned immediately while a background
+    refresh fetches a new copy. Anything older is treated as a miss.
+    """
+
+    def __init__(self, backend, default_ttl, provider_ttls=None, stale_seconds=0):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.provider_ttls = provider_ttls or {}
+        self.stale_seconds = stale_seconds
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='search-cache')
+
+    def ttl_for(self, provider):
+        """Get the TTL in seconds for a provider"""
+        return self.provider_ttls.get(provider, self.default_ttl)
+
+    def get_or_fetch(self, provider, criteria, fetch, page=0):
+        """Return cached results for a provider query, fetching on a miss
+
+        Args:
+            provider: Provider (site) key
+            criteria: Search criteria
+            fetch: Callable returning the provider's job list; it should raise
+                on failure so errors are never cached
+            page: Result page (each page is cached separately)
+
+        Returns:
+            list: Job listings
+        """
+        key = make_cache_key(provider, criteria, page)
+        ttl = self.ttl_for(provider)
+
+        try:
+            entry = self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Search cache read error for {provider}: {str(e)}")
+            entry = None
+
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < ttl:
+                self._count('hits', provider)
+                return value
+            if age < ttl + self.stale_seconds:
+                self._count('stale_hits', provider)
+                self._schedule_refresh(key, provider, fetch)
+                return value
+
+        self._count('misses', provider)
+        value = fetch()
+        self._store(key, provider, value)
+        return value
+
+    def _store(self, key, provider, value):
+        try:
+            self.backend.set(key, value, time.time())
+        except Exception as e:
+            logger.error(f"Search cache write error for {provider}: {str(e)}")
+
+    def _schedule_refresh(self, key, provider, fetch):
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._refresh_executor.submit(self._refresh, key, provider, fetch)
+
+    def _refresh(self, key, provider, fetch):
+        try:
+            self._store(key, provider, fetch())
+            self._count('refreshes', provider)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {provider}: {str(e)}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def _count(self, counter, provider):
+        try:
+            self.backend.incr(counter, provider)
+        except Exception as e:
+            logger.error(f"Search cache stats error: {str(e)}")
+
+    def stats(self):
+        """Get hit/miss counts overall and per provider"""
+        totals = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0}
+        providers = {}
+        for (counter, provider), value in self.backend.counters().items():
+            totals[counter] = totals.get(counter, 0) + value
+            providers.setdefault(provider, {})[counter] = value
+
+        lookups = totals['hits'] + totals['stale_hits'] + totals['misses']
+        return {
+            'backend': self.backend.name,
+            'entries': self.backend.size(),
+            'totals': totals,
+            'hit_rate': round((totals['hits'] + totals['stale_hits']) / lookups, 4) if lookups else 0,
+            'providers': providers
+        }
+
+
+def _parse_provider_ttls(value):
+    """Parse 'provider=seconds,provider=seconds' into a dict"""
+    ttls = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            provider, seconds = item.split('=', 1)
+            try:
+                ttls[provider.strip()] = float(seconds)
+            except ValueError:
+                logger.warning(f"Ignoring invalid search cache TTL: {item}")
+    return ttls
+
+# Shared cache instance (created lazily)
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+def get_search_cache():
+    """Get the configured search cache, or None if caching is disabled"""
+    global _search_cache
+    if Config.SEARCH_CACHE_BACKEND == 'none':
+        return None
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                if Config.SEARCH_CACHE_BACKEND == 'sqlite':
+                    backend = SQLiteCacheBackend(Config.SEARCH_CACHE_PATH, Config.SEARCH_CACHE_MAX_ENTRIES)
+                else:
+                    backend = MemoryCacheBackend(Config.SEARCH_CACHE_MAX_ENTRIES)
+                _search_cache = SearchCache(
+                    backend,
+                    default_ttl=Config.SEARCH_CACHE_DEFAULT_TTL,
+                    provider_ttls=_parse_provider_ttls(Config.SEARCH_CACHE_TTLS),
+                    stale_seconds=Config.SEARCH_CACHE_STALE_SECONDS
+                )
+    return _search_cache
@@ -0,0 +1,140 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# Legal-form suffixes that don't identify a company ("Acme, Inc." == "Acme").
+# Descriptive words like "group" or "company" are kept: "Data Group" and
+# "Data Corp" are different employers.
+COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co',
+    'plc', 'llp', 'lp', 'gmbh', 'ag', 'sa', 'sas', 'srl', 'bv', 'nv', 'oy',
+    'ab', 'as', 'pty', 'pvt', 'pte', 'kk'
+}
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+def normalize_company_name(name):
+    """Normalize a company name to a join key
+
+    Folds case, accents and punctuation, drops a leading "the" and trailing
+    legal suffixes, then sorts the remaining tokens so word order doesn't
+    matter. "The Acme Co., Inc." and "acme" both become "acme".
+
+    Args:
+        name: Company name as given by a provider
+
+    Returns:
+        str: Normalized key ('' if nothing meaningful is left)
+    """
+    if not name:
+        return ''
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+    text = text.replace('&', ' and ')
+    tokens = _NON_ALNUM.sub(' ', text).split()
+
+    if len(tokens) > 1 and tokens[0] == 'the':
+        tokens = tokens[1:]
+    # Strip stacked suffixes ("Acme Co Ltd"), but never the whole name
+    while len(tokens) > 1 and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+
+    return ' '.join(sorted(tokens))
+
+def _trigrams(key):
+    """Get the set of character trigrams of a key, padded at word boundaries"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyIndex:
+    """Index of values by normalized company name with trigram fuzzy fallback
+
+    Exact lookups are a single dict access on the normalized key. When that
+    misses, a trigram inverted index finds the closest key by Jaccard
+    similarity. Only the rarer trigrams of a query are scanned, so fuzzy
+    lookups stay fast even with tens of thousands of companies.
+
+    Args:
+        fuzzy_threshold: Minimum trigram Jaccard similarity for a fuzzy match
+        max_posting_fraction: Trigrams found in more than this fraction of
+            keys are too common to narrow the search and are skipped
+        cache_size: Number of lookup results memoized
+    """
+
+    def __init__(self, fuzzy_threshold=0.6, max_posting_fraction=0.02, cache_size=4096):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_posting_fraction = max_posting_fraction
+        self.cache_size = cache_size
+        self._values = {}
+        self._grams = {}
+        self._postings = {}
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, name, value):
+        """Add a value under a company name (values for the same key are grouped)"""
+        key = normalize_company_name(name)
+        if not key:
+            return
+        if key not in self._values:
+            self._values[key] = []
+            grams = _trigrams(key)
+            self._grams[key] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(key)
+        self._values[key].append(value)
+        self._cache.clear()
+
+    def lookup(self, name, fuzzy=True):
+        """Get the values for a company name, or None if nothing matches"""
+        key = normalize_company_name(name)
+        if not key:
+            return None
+
+        values = self._values.get(key)
+        if values is not None or not fuzzy:
+            return values
+
+        with self._cache_lock:
+            cached = key in self._cache
+            if cached:
+                self._cache.move_to_end(key)
+                match = self._cache[key]
+        if not cached:
+            match = self._fuzzy_match(key)
+            with self._cache_lock:
+                self._cache[key] = match
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return self._values[match] if match else None
+
+    def _fuzzy_match(self, key):
+        """Find the indexed key most similar to `key` above the threshold"""
+        grams = _trigrams(key)
+        postings = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not postings:
+            return None
+
+        limit = max(50, int(len(self._values) * self.max_posting_fraction))
+        selective = [posting for posting in postings if len(posting) <= limit]
+        if not selective:
+            # Every trigram is common: fall back to the three narrowest lists
+            selective = sorted(postings, key=len)[:3]
+
+        hits = {}
+        for posting in selective:
+            for candidate in posting:
+                hits[candidate] = hits.get(candidate, 0) + 1
+
+        best_key, best_score = None, self.fuzzy_threshold
+        for candidate in sorted(hits, key=hits.get, reverse=True)[:20]:
+            candidate_grams = self._grams[candidate]
+            shared = len(grams & candidate_grams)
+            score = shared / (len(grams) + len(candidate_grams) - shared)
+            if score >= best_score:
+                best_key, best_score = candidate, score
+        return best_key
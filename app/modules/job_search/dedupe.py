@@ -0,0 +1,210 @@
+import re
+import zlib
+import logging
+from app.modules.job_search.company_index import normalize_company_name
+from app.modules.job_search.api_implementations import JOB_FIELD_DEFAULTS
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# MinHash signature size and LSH banding: 8 bands of 4 slots find pairs
+# above roughly 0.6 similarity, which are then checked against the threshold
+SIGNATURE_SIZE = 32
+BANDS = 8
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+
+# Only the start of a description is shingled: syndicated copies are often
+# truncated, and it bounds the cost per job
+DESCRIPTION_WORDS = 100
+
+# Minimum Jaccard similarity of two listings' title words to be the same
+# posting, however similar the rest is: a company's postings share its blurb,
+# so different roles there can look alike
+TITLE_SIMILARITY = 0.5
+
+# Most clusters a new job is compared against (guards against huge buckets)
+MAX_CANDIDATES = 50
+
+_WORD = re.compile(r'[a-z0-9]+')
+_HASH_BITS = 27
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_EMPTY = 1 << _HASH_BITS
+
+def _title_words(job):
+    return frozenset(_WORD.findall((job.get('title') or '').lower()))
+
+def title_similarity(first, second):
+    """Get the Jaccard similarity of two sets of title words (1.0 when both are empty)"""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+def _shingles(job):
+    """Get the word bigrams of a job's title, company and description start"""
+    words = _WORD.findall((job.get('title') or '').lower())
+    words.extend(normalize_company_name(job.get('company') or '').split())
+    words.extend(_WORD.findall((job.get('description') or '').lower())[:DESCRIPTION_WORDS])
+    if len(words) < 2:
+        return set(words)
+    return {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+def minhash_signature(shingles):
+    """Build a MinHash signature with one-permutation hashing
+
+    Each shingle is hashed once; the low bits pick one of SIGNATURE_SIZE bins
+    and the bin keeps the smallest remaining value. Empty bins borrow the
+    next filled bin's value (densification), so two signatures agree on a
+    slot with probability close to the Jaccard similarity of the shingles.
+
+    Args:
+        shingles: set of strings
+
+    Returns:
+        tuple: SIGNATURE_SIZE integers
+    """
+    signature = [_EMPTY] * SIGNATURE_SIZE
+    for shingle in shingles:
+        value = zlib.crc32(shingle.encode('utf-8'))
+        slot = value % SIGNATURE_SIZE
+        value = (value // SIGNATURE_SIZE) & _HASH_MASK
+        if value < signature[slot]:
+            signature[slot] = value
+
+    if _EMPTY in signature and shingles:
+        for slot in range(SIGNATURE_SIZE):
+            distance = 1
+            while signature[slot] == _EMPTY:
+                donor = signature[(slot + distance) % SIGNATURE_SIZE]
+                if donor < _EMPTY:
+                    signature[slot] = donor + (distance << _HASH_BITS) + _EMPTY
+                distance += 1
+    return tuple(signature)
+
+def estimate_similarity(first, second):
+    """Estimate the Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(first, second) if a == b) / SIGNATURE_SIZE
+
+def _richness(job):
+    """Rank how complete a job listing is (more filled fields, then longer description)"""
+    filled = 0
+    for field, value in job.items():
+        if field == 'other_sources':
+            continue
+        if value not in (None, '', [], {}) and value != JOB_FIELD_DEFAULTS.get(field):
+            filled += 1
+    return filled, len(job.get('description') or '')
+
+def _source_of(job):
+    return {'source': job.get('source', ''), 'id': job.get('id', ''), 'url': job.get('url', '')}
+
+
+class _Cluster:
+    """A group of listings for the same posting, represented by its richest copy"""
+
+    __slots__ = ('job', 'signature', 'title_words', 'sources')
+
+    def __init__(self, job, signature, title_words):
+        self.job = job
+        self.signature = signature
+        self.title_words = title_words
+        self.sources = []
+
+
+class NearDuplicateIndex:
+    """Groups job listings that are the same posting from different providers
+
+    Listings with the same title:company key are duplicates as before. Other
+    listings are compared by MinHash signature, and are only the same posting
+    when their titles are similar too (TITLE_SIMILARITY). LSH buckets keep the
+    comparisons to the few clusters sharing a band with the new listing, so
+    adding n jobs takes roughly linear time.
+
+    Args:
+        threshold: Minimum estimated similarity to treat two listings as the
+            same posting (above 1 disables near-duplicate matching)
+        keep_richest: Replace a cluster's kept copy when a more complete
+            listing arrives; turn off when the kept copy was already returned
+    """
+
+    def __init__(self, threshold=0.7, keep_richest=True):
+        self.threshold = threshold
+        self.keep_richest = keep_richest
+        self._clusters = []
+        self._keys = {}
+        self._buckets = {}
+
+    def __len__(self):
+        return len(self._clusters)
+
+    def add(self, job):
+        """Add a listing
+
+        Returns:
+            bool: True if it is a new posting, False if it joined a cluster
+        """
+        key = f"{job['title']}:{job['company']}"
+        cluster = self._keys.get(key)
+
+        signature = None
+        title_words = _title_words(job)
+        if cluster is None and self.threshold <= 1:
+            shingles = _shingles(job)
+            if shingles:
+                signature = minhash_signature(shingles)
+                cluster = self._find_similar(signature, title_words)
+
+        if cluster is None:
+            cluster = _Cluster(job, signature, title_words)
+            self._clusters.append(cluster)
+            self._keys[key] = cluster
+            if signature is not None:
+                for band in self._bands(signature):
+                    self._buckets.setdefault(band, []).append(cluster)
+            return True
+
+        self._keys.setdefault(key, cluster)
+        if self.keep_richest and _richness(job) > _richness(cluster.job):
+            cluster.sources.append(_source_of(cluster.job))
+            cluster.job = job
+        else:
+            cluster.sources.append(_source_of(job))
+        self._record_sources(cluster)
+        return False
+
+    def jobs(self):
+        """Get the kept listing of every cluster, in first-seen order"""
+        return [cluster.job for cluster in self._clusters]
+
+    def _bands(self, signature):
+        for band in range(BANDS):
+            start = band * ROWS_PER_BAND
+            yield (band,) + signature[start:start + ROWS_PER_BAND]
+
+    def _find_similar(self, signature, title_words):
+        """Find the most similar cluster above the threshold with a similar title, if any"""
+        candidates = {}
+        for band in self._bands(signature):
+            for cluster in self._buckets.get(band, ()):
+                candidates[id(cluster)] = cluster
+            if len(candidates) >= MAX_CANDIDATES:
+                break
+
+        best, best_similarity = None, self.threshold
+        for cluster in candidates.values():
+            if title_similarity(title_words, cluster.title_words) < TITLE_SIMILARITY:
+                continue
+            similarity = estimate_similarity(signature, cluster.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+        return best
+
+    def _record_sources(self, cluster):
+        """Store the other copies' sources on the kept listing"""
+        kept = cluster.job
+        seen = {(kept.get('source', ''), kept.get('id', ''))}
+        sources = []
+        for source in cluster.sources:
+            if (source['source'], source['id']) not in seen:
+                seen.add((source['source'], source['id']))
+                sources.append(source)
+        kept['other_sources'] = sources
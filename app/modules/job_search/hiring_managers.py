@@ -0,0 +1,154 @@
+import json
+import time
+import logging
+import threading
+from app.config import Config
+from app.modules.job_search.sqlite_store import get_connection
+from app.modules.job_search.company_index import CompanyIndex
+from app.modules.job_search.resilience import guarded_call
+from app.modules.job_search.api_implementations import _download_hiring_managers
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+class HiringManagerIndex:
+    """Lookup structure over the hiring manager feed, keyed by normalized company
+
+    "Acme, Inc." and "Acme Inc" share a key; near misses fall back to a
+    trigram similarity search.
+    """
+
+    def __init__(self, managers):
+        self.companies = CompanyIndex(fuzzy_threshold=Config.HIRING_MANAGER_FUZZY_THRESHOLD)
+        for manager in managers:
+            self.companies.add(manager.get('company', ''), manager)
+
+    def __len__(self):
+        return len(self.companies)
+
+    def lookup(self, company):
+        """Get the managers for a company, or None if there are none"""
+        return self.companies.lookup(company, fuzzy=Config.HIRING_MANAGER_FUZZY_THRESHOLD < 1)
+
+
+class _CacheState:
+    """The index this process currently holds"""
+
+    def __init__(self):
+        self.index = None
+        self.fetched_at = 0.0
+        self.lock = threading.Lock()
+        self.refreshing = False
+
+_state = _CacheState()
+_download_lock = threading.Lock()
+_initialized_paths = set()
+
+def _connection():
+    """Get the shared feed store, creating its table on first use"""
+    path = Config.HIRING_MANAGER_CACHE_PATH
+    conn = get_connection(path)
+    if path not in _initialized_paths:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS hiring_manager_feed ('
+            'id INTEGER PRIMARY KEY CHECK (id = 1), payload TEXT NOT NULL, '
+            'fetched_at REAL NOT NULL, refresh_started REAL NOT NULL DEFAULT 0)'
+        )
+        conn.execute('INSERT OR IGNORE INTO hiring_manager_feed (id, payload, fetched_at) VALUES (1, ?, 0)', ('[]',))
+        _initialized_paths.add(path)
+    return conn
+
+def _load_shared(newer_than):
+    """Load the shared feed if another worker stored a newer copy than ours"""
+    row = _connection().execute(
+        'SELECT payload, fetched_at FROM hiring_manager_feed WHERE id = 1 AND fetched_at > ?', (newer_than,)
+    ).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0]), row[1]
+
+def _claim_refresh(now):
+    """Claim the shared refresh lease so only one worker downloads the feed"""
+    cursor = _connection().execute(
+        'UPDATE hiring_manager_feed SET refresh_started = ? WHERE id = 1 AND refresh_started < ?',
+        (now, now - Config.HIRING_MANAGER_REFRESH_LEASE)
+    )
+    return cursor.rowcount == 1
+
+def _download_and_store(config):
+    """Download the feed, share it with other workers and install it locally"""
+    managers = guarded_call('hiring_manager', lambda: _download_hiring_managers(config))
+    fetched_at = time.time()
+    _connection().execute(
+        'UPDATE hiring_manager_feed SET payload = ?, fetched_at = ?, refresh_started = 0 WHERE id = 1',
+        (json.dumps(managers), fetched_at)
+    )
+    _install(managers, fetched_at)
+    logger.info(f"Hiring manager cache refreshed with {len(managers)} managers")
+
+def _install(managers, fetched_at):
+    """Build an index from the feed and make it this process's current index"""
+    index = HiringManagerIndex(managers)
+    with _state.lock:
+        if fetched_at >= _state.fetched_at:
+            _state.index = index
+            _state.fetched_at = fetched_at
+
+def _refresh_in_background(config):
+    """Refresh the feed on a background thread, at most once at a time per process"""
+    with _state.lock:
+        if _state.refreshing:
+            return
+        _state.refreshing = True
+
+    def run():
+        try:
+            if _claim_refresh(time.time()):
+                _download_and_store(config)
+        except Exception as e:
+            logger.error(f"Background hiring manager refresh failed: {str(e)}")
+        finally:
+            with _state.lock:
+                _state.refreshing = False
+
+    threading.Thread(target=run, name='hiring-manager-refresh', daemon=True).start()
+
+def get_hiring_manager_index(config):
+    """Get the hiring manager index, downloading the feed only when needed
+
+    A fresh in-process index is returned without any I/O. Once it is older
+    than HIRING_MANAGER_CACHE_TTL seconds, a newer copy stored by another worker is
+    picked up; failing that, one worker refreshes the feed in the background
+    while everyone keeps serving the current copy. The feed is only
+    downloaded in the request path when no copy exists at all.
+
+    Args:
+        config: Hiring manager portal config
+
+    Returns:
+        HiringManagerIndex: Index of managers (possibly empty)
+    """
+    now = time.time()
+    index, fetched_at = _state.index, _state.fetched_at
+    if index is not None and now - fetched_at < Config.HIRING_MANAGER_CACHE_TTL:
+        return index
+
+    try:
+        shared = _load_shared(fetched_at)
+        if shared is not None:
+            _install(*shared)
+            index, fetched_at = _state.index, _state.fetched_at
+
+        if index is None:
+            # Nothing cached anywhere yet: download once, in the foreground
+            with _download_lock:
+                if _state.index is None:
+                    _download_and_store(config)
+            return _state.index
+
+        if now - fetched_at >= Config.HIRING_MANAGER_CACHE_TTL:
+            _refresh_in_background(config)
+    except Exception as e:
+        logger.error(f"Error loading hiring manager cache: {str(e)}")
+
+    return index if index is not None else HiringManagerIndex([])
@@ -0,0 +1,67 @@
+import os
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from app.config import Config
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Process-wide session shared by all job search adapters
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Get the pooled HTTP session for the current process
+
+    The session keeps connections to each provider host alive between
+    searches. It is rebuilt after a fork so gunicorn workers never share
+    sockets with their parent.
+
+    Returns:
+        requests.Session: Shared session with pooled keep-alive connections
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _create_session()
+                _session_pid = pid
+    return _session
+
+def _create_session():
+    """Create a session with per-host connection pools and compression enabled"""
+    session = requests.Session()
+
+    # One pool per provider host, each holding up to HTTP_POOL_MAXSIZE connections
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+        max_retries=0
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    # Negotiate gzip/deflate, plus br when a brotli decoder is installed
+    session.headers.update(make_headers(accept_encoding=True, keep_alive=True))
+
+    logger.info(f"Created pooled HTTP session (pool_maxsize={Config.HTTP_POOL_MAXSIZE})")
+    return session
+
+def _default_timeout():
+    """Get the (connect, read) timeout applied when a caller doesn't set one"""
+    return (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+
+def http_get(url, **kwargs):
+    """Send a GET request through the shared session"""
+    kwargs.setdefault('timeout', _default_timeout())
+    return get_session().get(url, **kwargs)
+
+def http_post(url, **kwargs):
+    """Send a POST request through the shared session"""
+    kwargs.setdefault('timeout', _default_timeout())
+    return get_session().post(url, **kwargs)
@@ -0,0 +1,326 @@
+import re
+import json
+import uuid
+import hashlib
+import logging
+import datetime
+import threading
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app.models import db, Job, ApplicationHistory, add_missing_columns
+from app.modules.job_search.company_index import normalize_company_name
+from app.modules.job_search.normalize import parse_posted_at
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Job dict fields stored on the Job row (dict key -> column)
+STORED_FIELDS = {
+    'id': 'external_id',
+    'title': 'title',
+    'company': 'company',
+    'location': 'location',
+    'job_type': 'job_type',
+    'salary': 'salary',
+    'posted_date': 'posted_date',
+    'description': 'description',
+    'url': 'url',
+    'source': 'source'
+}
+
+# Column sizes, so long provider values are truncated instead of failing the insert
+_COLUMN_LIMITS = {
+    'external_id': 256, 'title': 256, 'company': 256, 'location': 256, 'job_type': 100,
+    'salary': 256, 'posted_date': 100, 'url': 1024, 'source': 100
+}
+
+# Structured fields from ingest, stored as numbers and short codes
+STRUCTURED_FIELDS = ('salary_min', 'salary_max', 'currency', 'period')
+
+# Columns added after the tables were first created (the same as Migrations 6
+# and 7 in app/migrate.py, but also for databases that script can't reach)
+_ADDED_COLUMNS = (
+    (Job, ('posted_at', 'salary_min', 'salary_max', 'currency', 'period')),
+    (ApplicationHistory, ('job_ref_id',))
+)
+
+_WHITESPACE = re.compile(r'\s+')
+
+def _clean(value):
+    """Lowercase and collapse whitespace for fingerprinting"""
+    return _WHITESPACE.sub(' ', str(value or '')).strip().lower()
+
+def job_fingerprint(job):
+    """Get the content fingerprint identifying a posting across searches
+
+    Built from the title, normalized company, location and description, so
+    the same posting found again (by any provider returning the same text)
+    maps to the same Job row.
+
+    Args:
+        job: Job dict
+
+    Returns:
+        str: SHA-1 hex digest
+    """
+    content = '\x1f'.join([
+        _clean(job.get('title')),
+        normalize_company_name(job.get('company') or ''),
+        _clean(job.get('location')),
+        _clean(job.get('description'))
+    ])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+# Full-text index state for the current database ('fts5', 'tsvector' or None)
+_fts_backend = None
+_ready_engines = set()
+_ready_lock = threading.Lock()
+
+def ensure_job_store():
+    """Create the job table, its new columns and its full-text index if missing
+
+    Runs once per engine, at startup and before the job table is used. Uses SQLite FTS5 (kept in sync by triggers) or a
+    generated Postgres tsvector column with a GIN index; without either,
+    searches fall back to LIKE matching.
+    """
+    global _fts_backend
+    engine = db.engine
+    if engine.url in _ready_engines:
+        return
+    with _ready_lock:
+        if engine.url in _ready_engines:
+            return
+
+        Job.__table__.create(engine, checkfirst=True)
+        for model, names in _ADDED_COLUMNS:
+            added = add_missing_columns(model, names)
+            if added:
+                logger.info(f"Added columns to {model.__tablename__}: {', '.join(added)}")
+
+        _fts_backend = None
+        try:
+            if engine.dialect.name == 'sqlite':
+                _create_sqlite_fts(engine)
+                _fts_backend = 'fts5'
+            elif engine.dialect.name == 'postgresql':
+                _create_postgres_tsvector(engine)
+                _fts_backend = 'tsvector'
+        except Exception as e:
+            logger.warning(f"Full-text index unavailable, falling back to LIKE search: {str(e)}")
+
+        _ready_engines.add(engine.url)
+
+def _create_sqlite_fts(engine):
+    with engine.begin() as conn:
+        exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'job_fts'")).fetchone()
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS job_fts USING fts5("
+            "title, company, description, content='job', content_rowid='rowid')"
+        ))
+        conn.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS job_fts_insert AFTER INSERT ON job BEGIN "
+            "INSERT INTO job_fts (rowid, title, company, description) "
+            "VALUES (new.rowid, new.title, new.company, new.description); END"
+        ))
+        conn.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS job_fts_delete AFTER DELETE ON job BEGIN "
+            "INSERT INTO job_fts (job_fts, rowid, title, company, description) "
+            "VALUES ('delete', old.rowid, old.title, old.company, old.description); END"
+        ))
+        conn.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS job_fts_update AFTER UPDATE OF title, company, description ON job BEGIN "
+            "INSERT INTO job_fts (job_fts, rowid, title, company, description) "
+            "VALUES ('delete', old.rowid, old.title, old.company, old.description); "
+            "INSERT INTO job_fts (rowid, title, company, description) "
+            "VALUES (new.rowid, new.title, new.company, new.description); END"
+        ))
+        if not exists:
+            # Index any jobs stored before the index existed
+            conn.execute(text("INSERT INTO job_fts (job_fts) VALUES ('rebuild')"))
+
+def _create_postgres_tsvector(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE job ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')) STORED"
+        ))
+        conn.execute(text('CREATE INDEX IF NOT EXISTS ix_job_search_vector ON job USING GIN (search_vector)'))
+
+def _column_values(job):
+    values = {}
+    for field, column in STORED_FIELDS.items():
+        value = job.get(field)
+        if value is None or value == '':
+            continue
+        value = str(value)
+        limit = _COLUMN_LIMITS.get(column)
+        values[column] = value[:limit] if limit else value
+
+    for field in STRUCTURED_FIELDS:
+        if job.get(field) is not None:
+            values[field] = job[field]
+    posted_at = parse_posted_at(job.get('posted_at'))
+    if posted_at is not None:
+        # Stored as naive UTC, like the other timestamps
+        values['posted_at'] = posted_at.replace(tzinfo=None)
+    return values
+
+def store_jobs(jobs):
+    """Upsert jobs into the canonical job table by fingerprint
+
+    New postings are inserted; known ones get last_seen_at bumped and any
+    empty columns filled in. Each job dict gets 'job_ref' (the Job id) and
+    'fingerprint' set.
+
+    Args:
+        jobs: list of job dicts
+
+    Returns:
+        dict: fingerprint -> Job id
+    """
+    if not jobs:
+        return {}
+    ensure_job_store()
+
+    try:
+        ids = _upsert_jobs(jobs)
+    except IntegrityError:
+        # Another worker inserted one of the postings first: retry as updates
+        ids = _upsert_jobs(jobs)
+
+    for job in jobs:
+        job['job_ref'] = ids[job['fingerprint']]
+    return ids
+
+def _upsert_jobs(jobs):
+    by_fingerprint = {}
+    for job in jobs:
+        fingerprint = job.get('fingerprint') or job_fingerprint(job)
+        job['fingerprint'] = fingerprint
+        by_fingerprint.setdefault(fingerprint, job)
+
+    now = datetime.datetime.utcnow()
+    existing = {
+        row.fingerprint: row
+        for row in Job.query.filter(Job.fingerprint.in_(list(by_fingerprint))).all()
+    }
+
+    for fingerprint, job in by_fingerprint.items():
+        values = _column_values(job)
+        other_sources = json.dumps(job['other_sources']) if job.get('other_sources') else None
+        row = existing.get(fingerprint)
+        if row is None:
+            values.setdefault('title', 'Unknown Position')
+            values.setdefault('company', 'Unknown Company')
+            row = Job(id=str(uuid.uuid4()), fingerprint=fingerprint, other_sources=other_sources,
+                      first_seen_at=now, last_seen_at=now, **values)
+            db.session.add(row)
+            existing[fingerprint] = row
+        else:
+            row.last_seen_at = now
+            for column, value in values.items():
+                if not getattr(row, column):
+                    setattr(row, column, value)
+            if other_sources and not row.other_sources:
+                row.other_sources = other_sources
+
+    # Read ids before committing, which expires every loaded row
+    ids = {fingerprint: row.id for fingerprint, row in existing.items()}
+    try:
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return ids
+
+def history_job_fields(job):
+    """Get the ApplicationHistory job reference fields for a job dict
+
+    Only a job_ref naming an existing Job row is linked; the description
+    then lives on that row. Anything else (e.g. a job sent by the client)
+    keeps its description on the history row and is never added to the
+    shared job store.
+    """
+    job_ref = job.get('job_ref')
+    if job_ref:
+        try:
+            ensure_job_store()
+            if db.session.get(Job, str(job_ref)) is not None:
+                return {'job_ref_id': job_ref, 'description': None}
+        except Exception as e:
+            logger.error(f"Could not look up job for application history: {str(e)}")
+    return {'job_ref_id': None, 'description': job.get('description', '')}
+
+def job_to_dict(row):
+    """Convert a Job row to the job dict format providers return"""
+    job = {field: getattr(row, column) or '' for field, column in STORED_FIELDS.items()}
+    job['id'] = row.external_id or row.id
+    job['job_ref'] = row.id
+    job['fingerprint'] = row.fingerprint
+    job['posted_at'] = row.posted_at.isoformat() + '+00:00' if row.posted_at else None
+    for field in STRUCTURED_FIELDS:
+        job[field] = getattr(row, field)
+    if row.other_sources:
+        job['other_sources'] = json.loads(row.other_sources)
+    return job
+
+def _fts5_query(keywords):
+    """Build an FTS5 query matching any keyword as a phrase"""
+    phrases = ['"' + keyword.replace('"', '""') + '"' for keyword in keywords]
+    return ' OR '.join(phrases)
+
+def _websearch_query(keywords):
+    """Build a websearch_to_tsquery query matching any keyword as a phrase"""
+    phrases = ['"' + keyword.replace('"', ' ') + '"' for keyword in keywords]
+    return ' or '.join(phrases)
+
+def search_stored_jobs(keywords, location=None, limit=200, max_age_days=30):
+    """Find stored jobs matching any keyword with the full-text index
+
+    Args:
+        keywords: list of keywords
+        location: optional location substring filter
+        limit: maximum number of jobs
+        max_age_days: only jobs seen by a search within this many days
+
+    Returns:
+        list: Job dicts, best text matches first
+    """
+    ensure_job_store()
+    keywords = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+    if not keywords:
+        return []
+
+    since = datetime.datetime.utcnow() - datetime.timedelta(days=max_age_days)
+
+    if _fts_backend == 'fts5':
+        sql = ('SELECT job.* FROM job_fts JOIN job ON job.rowid = job_fts.rowid '
+               'WHERE job_fts MATCH :match AND job.last_seen_at >= :since')
+        params = {'match': _fts5_query(keywords), 'since': since.strftime('%Y-%m-%d %H:%M:%S.%f'), 'limit': limit}
+        if location:
+            sql += ' AND job.location LIKE :location'
+            params['location'] = f"%{location}%"
+        sql += ' ORDER BY bm25(job_fts) LIMIT :limit'
+        rows = Job.query.from_statement(text(sql).bindparams(**params)).all()
+    else:
+        query = Job.query.filter(Job.last_seen_at >= since)
+        if location:
+            query = query.filter(Job.location.ilike(f"%{location}%"))
+        if _fts_backend == 'tsvector':
+            match = _websearch_query(keywords)
+            query = query.filter(
+                text("search_vector @@ websearch_to_tsquery('english', :match)").bindparams(match=match)
+            ).order_by(
+                text("ts_rank(search_vector, websearch_to_tsquery('english', :rank_match)) DESC").bindparams(
+                    rank_match=match
+                )
+            )
+        else:
+            conditions = [Job.title.ilike(f"%{keyword}%") | Job.description.ilike(f"%{keyword}%")
+                          for keyword in keywords]
+            query = query.filter(db.or_(*conditions)).order_by(Job.last_seen_at.desc())
+        rows = query.limit(limit).all()
+
+    return [job_to_dict(row) for row in rows]
@@ -0,0 +1,64 @@
+import json
+import logging
+
+# Optional fast decoders; the standard library is used when they are missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def loads(data):
+    """Decode a JSON document from bytes or text, with orjson when installed
+
+    Raises:
+        ValueError: if the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def streaming_available():
+    """Whether items can be streamed out of large responses
+
+    Only ijson's C backend is used: its pure Python backend is slower than
+    decoding the whole document.
+    """
+    return ijson is not None and ijson.backend in ('yajl2_c', 'yajl2_cffi')
+
+def iter_items(stream, items_path):
+    """Lazily yield the items of the list at items_path in a JSON stream
+
+    Only one item is held in memory at a time; the rest of the document is
+    skipped as it is read.
+
+    Args:
+        stream: File-like object returning bytes (e.g. response.raw)
+        items_path: Keys leading to the list of items, e.g. ('data', 'jobs')
+
+    Yields:
+        dict: Each item of the list
+
+    Raises:
+        ValueError: if the stream is not valid JSON
+    """
+    prefix = '.'.join(items_path) + '.item'
+    try:
+        # Floats instead of Decimals, as json.loads returns
+        yield from ijson.items(stream, prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON in streamed response: {str(e)}")
+
+def nest(items_path, items):
+    """Wrap items in the document shape items_path expects ({'data': {'jobs': items}})"""
+    document = items
+    for key in reversed(items_path):
+        document = {key: document}
+    return document
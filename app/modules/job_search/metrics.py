@@ -0,0 +1,225 @@
+import time
+import logging
+import threading
+import requests
+from collections import Counter
+from app.config import Config
+from app.modules.job_search.sqlite_store import get_connection
+from app.modules.job_search.resilience import ProviderUnavailableError
+from app.modules.job_search.api_implementations import PROVIDERS
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the provider latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Observations are counted in memory and added to the shared store every
+# PROVIDER_METRICS_FLUSH_SECONDS, so recording never waits on SQLite.
+# Keys are (metric, site, label).
+_pending = Counter()
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+_initialized_paths = set()
+
+# Job 'source' values mapped back to the site that returned them
+_sites_by_source = {adapter.source: adapter.name for adapter in PROVIDERS.values()}
+
+def _connection():
+    """Get the shared metrics store, creating its table on first use"""
+    path = Config.PROVIDER_METRICS_PATH
+    conn = get_connection(path)
+    if path not in _initialized_paths:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS provider_metrics ('
+            'metric TEXT NOT NULL, site TEXT NOT NULL, label TEXT NOT NULL, value REAL NOT NULL, '
+            'PRIMARY KEY (metric, site, label))'
+        )
+        _initialized_paths.add(path)
+    return conn
+
+def _add(values):
+    """Count observations, flushing them to the shared store when due
+
+    Args:
+        values: list of ((metric, site, label), amount)
+    """
+    if not Config.PROVIDER_METRICS_ENABLED:
+        return
+    with _pending_lock:
+        for key, amount in values:
+            _pending[key] += amount
+        due = time.monotonic() - _last_flush >= Config.PROVIDER_METRICS_FLUSH_SECONDS
+    if due:
+        flush()
+
+def flush():
+    """Add this process's pending observations to the shared store"""
+    global _pending, _last_flush
+    with _pending_lock:
+        pending, _pending = _pending, Counter()
+        _last_flush = time.monotonic()
+    if not pending:
+        return
+    try:
+        conn = _connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT INTO provider_metrics (metric, site, label, value) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (metric, site, label) DO UPDATE SET value = value + excluded.value',
+                [(metric, site, label, amount) for (metric, site, label), amount in pending.items()]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    except Exception as e:
+        # Metrics must never fail a search; these observations are lost
+        logger.error(f"Error saving provider metrics: {str(e)}")
+
+def status_label(error):
+    """Get the status a failed provider call is counted under"""
+    if isinstance(error, ProviderUnavailableError):
+        return 'skipped'
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return str(error.response.status_code)
+    if isinstance(error, requests.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.RequestException):
+        return 'connection_error'
+    if isinstance(error, ValueError):
+        return 'invalid_response'
+    return 'error'
+
+def observe_call(site, call):
+    """Run a provider call, recording its latency, status and items returned
+
+    Calls skipped by the rate limiter or circuit breaker are counted with
+    status 'skipped' but not timed.
+
+    Args:
+        site: Site key
+        call: Callable returning a list of jobs
+
+    Returns:
+        list: The call's jobs
+    """
+    start = time.monotonic()
+    try:
+        jobs = call()
+    except Exception as e:
+        status = status_label(e)
+        values = [(('requests', site, status), 1)]
+        if status != 'skipped':
+            values.extend(_latency_values(site, time.monotonic() - start))
+        _add(values)
+        raise
+    _add(_latency_values(site, time.monotonic() - start) + [
+        (('requests', site, '200'), 1),
+        (('items_returned', site, ''), len(jobs))
+    ])
+    return jobs
+
+def _latency_values(site, seconds):
+    bucket = next((str(bound) for bound in LATENCY_BUCKETS if seconds <= bound), '+Inf')
+    return [
+        (('latency_bucket', site, bucket), 1),
+        (('latency_sum', site, ''), seconds),
+        (('latency_count', site, ''), 1)
+    ]
+
+def _site_of(job):
+    return _sites_by_source.get(job.get('source'), job.get('source') or 'unknown')
+
+def record_unique_jobs(jobs):
+    """Count the jobs each site contributed after de-duplication"""
+    _add([(('items_unique', site, ''), count) for site, count in Counter(map(_site_of, jobs)).items()])
+
+def record_match_scores(jobs, scores):
+    """Add jobs' match scores to their site's mean match score
+
+    Args:
+        jobs: list of job dicts
+        scores: match score of each job, in the same order
+    """
+    totals = Counter()
+    counts = Counter()
+    for job, score in zip(jobs, scores):
+        site = _site_of(job)
+        totals[site] += score
+        counts[site] += 1
+    _add([(('score_sum', site, ''), total) for site, total in totals.items()] +
+         [(('score_count', site, ''), count) for site, count in counts.items()])
+
+def _read():
+    """Get every stored value as {metric: {(site, label): value}}"""
+    metrics = {}
+    for metric, site, label, value in _connection().execute(
+            'SELECT metric, site, label, value FROM provider_metrics ORDER BY site, label'):
+        metrics.setdefault(metric, {})[(site, label)] = value
+    return metrics
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+def render_prometheus():
+    """Render the provider metrics of all workers in Prometheus text format
+
+    This process's pending observations are flushed first; other workers'
+    last few seconds show up on their next flush.
+
+    Returns:
+        str: Metrics in the Prometheus text exposition format (0.0.4)
+    """
+    flush()
+    metrics = _read()
+    lines = []
+
+    def family(name, kind, help_text):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    family('job_provider_request_duration_seconds', 'histogram',
+           'Time taken by provider searches that reached the provider (cache hits excluded)')
+    buckets = metrics.get('latency_bucket', {})
+    latency_sums = metrics.get('latency_sum', {})
+    for (site, _), count in sorted(metrics.get('latency_count', {}).items()):
+        cumulative = 0
+        for bound in LATENCY_BUCKETS:
+            cumulative += buckets.get((site, str(bound)), 0)
+            lines.append(f'job_provider_request_duration_seconds_bucket{{provider="{site}",le="{bound}"}} '
+                         f'{_number(cumulative)}')
+        lines.append(f'job_provider_request_duration_seconds_bucket{{provider="{site}",le="+Inf"}} {_number(count)}')
+        lines.append(f'job_provider_request_duration_seconds_sum{{provider="{site}"}} '
+                     f'{_number(latency_sums.get((site, ""), 0))}')
+        lines.append(f'job_provider_request_duration_seconds_count{{provider="{site}"}} {_number(count)}')
+
+    family('job_provider_requests_total', 'counter',
+           'Provider searches by outcome: HTTP status, timeout, connection_error, invalid_response or skipped')
+    for (site, status), count in sorted(metrics.get('requests', {}).items()):
+        lines.append(f'job_provider_requests_total{{provider="{site}",status="{status}"}} {_number(count)}')
+
+    family('job_provider_items_returned_total', 'counter', 'Jobs returned by the provider')
+    for (site, _), count in sorted(metrics.get('items_returned', {}).items()):
+        lines.append(f'job_provider_items_returned_total{{provider="{site}"}} {_number(count)}')
+
+    family('job_provider_items_unique_total', 'counter', 'Jobs from the provider kept after de-duplication')
+    for (site, _), count in sorted(metrics.get('items_unique', {}).items()):
+        lines.append(f'job_provider_items_unique_total{{provider="{site}"}} {_number(count)}')
+
+    family('job_provider_match_score', 'summary', 'Match scores of the provider\'s jobs')
+    score_sums = metrics.get('score_sum', {})
+    score_means = []
+    for (site, _), count in sorted(metrics.get('score_count', {}).items()):
+        total = score_sums.get((site, ''), 0)
+        lines.append(f'job_provider_match_score_sum{{provider="{site}"}} {_number(total)}')
+        lines.append(f'job_provider_match_score_count{{provider="{site}"}} {_number(count)}')
+        score_means.append((site, total / count if count else 0))
+
+    family('job_provider_match_score_mean', 'gauge', 'Mean match score of the provider\'s jobs')
+    for site, mean in score_means:
+        lines.append(f'job_provider_match_score_mean{{provider="{site}"}} {round(mean, 2)}')
+
+    return '\n'.join(lines) + '\n'
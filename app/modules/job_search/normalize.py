@@ -0,0 +1,193 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+# Relative dates: "3 days ago", "30+ days ago", "5 hours ago", "2 weeks ago"
+_RELATIVE_DATE = re.compile(r'(\d+)\+?\s*(minute|min|hour|hr|day|week|month)s?\s+ago', re.IGNORECASE)
+_JUST_POSTED = re.compile(r'\b(today|just posted|just now)\b', re.IGNORECASE)
+_YESTERDAY = re.compile(r'\byesterday\b', re.IGNORECASE)
+_EPOCH = re.compile(r'^\d{9,13}$')
+
+_RELATIVE_UNITS = {
+    'minute': timedelta(minutes=1), 'min': timedelta(minutes=1),
+    'hour': timedelta(hours=1), 'hr': timedelta(hours=1),
+    'day': timedelta(days=1), 'week': timedelta(weeks=1), 'month': timedelta(days=30)
+}
+
+# Salary amounts: "$120,000", "120k", "45.50", "1.2k" (but not a "401k" plan)
+_SALARY_AMOUNT = re.compile(r'(?<![\w.])(?!401\(?k)(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*(k)?(?![a-z0-9])', re.IGNORECASE)
+_CURRENCY_SYMBOLS = {'$': 'USD', '£': 'GBP', '€': 'EUR', '₹': 'INR'}
+_CURRENCY = re.compile(r'([$£€₹])|\b(USD|EUR|GBP|CAD|AUD|INR|CHF)\b', re.IGNORECASE)
+_SALARY_PERIOD = re.compile(
+    r'\b(hour|hr|hourly|day|daily|week|weekly|month|mo|monthly|year|yr|annum|annual|annually|fixed)\b',
+    re.IGNORECASE
+)
+_PERIODS = {
+    'hour': 'hour', 'hr': 'hour', 'hourly': 'hour',
+    'day': 'day', 'daily': 'day',
+    'week': 'week', 'weekly': 'week',
+    'month': 'month', 'mo': 'month', 'monthly': 'month',
+    'year': 'year', 'yr': 'year', 'annum': 'year', 'annual': 'year', 'annually': 'year',
+    'fixed': 'fixed'
+}
+
+# Multipliers used to compare salaries quoted per hour/day/week/month with yearly ones
+# (a 'fixed' price for a whole project has none: it can't be compared)
+ANNUAL_FACTORS = {'hour': 2080, 'day': 260, 'week': 52, 'month': 12, 'year': 1}
+
+NO_SALARY = {'salary_min': None, 'salary_max': None, 'currency': None, 'period': None}
+
+def parse_posted_at(value, now=None):
+    """Parse a provider's posted date into an aware UTC datetime
+
+    Handles ISO 8601 strings, epoch seconds or milliseconds, RFC 2822 dates
+    and relative text such as "Today", "Yesterday" or "3 days ago" (relative
+    to `now`, so it should be parsed when the job is fetched).
+
+    Args:
+        value: Raw posted date (str, int or float)
+        now: Reference time for relative dates (defaults to the current time)
+
+    Returns:
+        datetime: UTC datetime, or None if the value can't be read
+    """
+    if value is None or value == '' or isinstance(value, bool):
+        return None
+    now = now or datetime.now(timezone.utc)
+
+    if isinstance(value, (int, float)):
+        return _from_epoch(value)
+    if not isinstance(value, str):
+        return None
+
+    text = value.strip()
+    if _EPOCH.match(text):
+        return _from_epoch(int(text))
+
+    relative = _RELATIVE_DATE.search(text)
+    if relative:
+        return now - int(relative.group(1)) * _RELATIVE_UNITS[relative.group(2).lower()]
+    if _YESTERDAY.search(text):
+        return now - timedelta(days=1)
+    if _JUST_POSTED.search(text):
+        return now
+
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError, IndexError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def _from_epoch(value):
+    try:
+        # Values this large are milliseconds
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+def parse_salary(value, default_period=None):
+    """Parse a salary into numeric bounds, currency and pay period
+
+    "$120k - $150k/yr" -> 120000, 150000, 'USD', 'year'. A bare number
+    (e.g. an Upwork budget) becomes both bounds.
+
+    Args:
+        value: Salary text or number
+        default_period: Period of amounts that don't state one (e.g. 'fixed'
+            for a provider's project budgets)
+
+    Returns:
+        dict: salary_min, salary_max, currency, period (None when unknown)
+    """
+    if isinstance(value, bool) or value is None:
+        return dict(NO_SALARY)
+    if isinstance(value, (int, float)):
+        amount = float(value)
+        return {'salary_min': amount, 'salary_max': amount, 'currency': None, 'period': default_period}
+    if not isinstance(value, str) or not value:
+        return dict(NO_SALARY)
+
+    amounts = []
+    for number, thousands in _SALARY_AMOUNT.findall(value):
+        amount = float(number.replace(',', ''))
+        amounts.append(amount * 1000 if thousands else amount)
+    if not amounts:
+        return dict(NO_SALARY)
+
+    currency = None
+    match = _CURRENCY.search(value)
+    if match:
+        currency = _CURRENCY_SYMBOLS[match.group(1)] if match.group(1) else match.group(2).upper()
+
+    period = default_period
+    match = _SALARY_PERIOD.search(value)
+    if match:
+        period = _PERIODS[match.group(1).lower()]
+
+    return {'salary_min': min(amounts), 'salary_max': max(amounts), 'currency': currency, 'period': period}
+
+def annual_salary(job):
+    """Get the top of a job's salary range per year, or None if unknown or not comparable
+
+    Amounts without a period are taken as yearly; fixed-price budgets give None.
+    """
+    top = job.get('salary_max')
+    if top is None:
+        top = job.get('salary_min')
+    factor = ANNUAL_FACTORS.get(job.get('period') or 'year')
+    if top is None or factor is None:
+        return None
+    return top * factor
+
+def posted_days_ago(posted_at, today=None):
+    """Get the number of calendar days (UTC) since an ISO posted_at, or None"""
+    if not posted_at:
+        return None
+    try:
+        posted = datetime.fromisoformat(posted_at)
+    except (TypeError, ValueError):
+        return None
+    if posted.tzinfo is not None:
+        posted = posted.astimezone(timezone.utc)
+    today = today or datetime.now(timezone.utc).date()
+    return max(0, (today - posted.date()).days)
+
+def format_posted_date(posted_at, now=None):
+    """Format a posted datetime as 'Today', 'Yesterday' or 'N days ago'"""
+    if posted_at is None:
+        return "Recently"
+    days_ago = ((now or datetime.now(timezone.utc)).date() - posted_at.date()).days
+    if days_ago <= 0:
+        return "Today"
+    if days_ago == 1:
+        return "Yesterday"
+    return f"{days_ago} days ago"
+
+def normalize_job(job, raw_posted=None, now=None, salary_period=None):
+    """Add structured posted_at and salary fields to a job dict
+
+    posted_at is stored as an ISO 8601 string so jobs stay JSON
+    serializable in the search cache; relative dates are resolved at ingest,
+    so recency doesn't drift while a result is cached.
+
+    Args:
+        job: Job dict (updated in place)
+        raw_posted: The provider's original posted date value, if any
+        now: Reference time for relative dates
+        salary_period: Period of salaries that don't state one (see parse_salary)
+
+    Returns:
+        dict: The same job dict
+    """
+    posted_at = parse_posted_at(raw_posted, now)
+    if posted_at is None:
+        posted_at = parse_posted_at(job.get('posted_date'), now)
+    job['posted_at'] = posted_at.isoformat() if posted_at else None
+    job.update(parse_salary(job.get('salary'), salary_period))
+    return job
@@ -0,0 +1,206 @@
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
+from app.config import Config
+from app.modules.job_search.http_client import http_get, http_post
+from app.modules.job_search.resilience import before_request, ProviderUnavailableError
+from app.modules.job_search.singleflight import SingleFlight
+from app.modules.job_search.json_decoding import loads, streaming_available, iter_items, nest
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Several sites are the same endpoint registered twice (e.g. google and
+# google_jobs). Identical requests in flight are sent once, and a response
+# is reused for identical requests made shortly after it arrived.
+_in_flight = SingleFlight()
+_recent = {}
+_recent_lock = threading.Lock()
+
+# Recent latencies of successful requests per endpoint, used for the hedge delay
+_latencies = {}
+_latency_lock = threading.Lock()
+
+_stats = {'requests': 0, 'shared': 0, 'hedged': 0, 'hedge_wins': 0}
+_stats_lock = threading.Lock()
+
+# Requests run here when they may be hedged (created lazily per process)
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.JOB_SEARCH_MAX_WORKERS,
+                    thread_name_prefix='provider-request'
+                )
+    return _executor
+
+def _count(counter):
+    with _stats_lock:
+        _stats[counter] += 1
+
+def request_key(method, url, headers, params, body):
+    """Hash everything that decides a provider's response (the API key included)"""
+    request = {
+        'method': method,
+        'url': url,
+        'key': headers.get('x-rapidapi-key', ''),
+        'params': params or {},
+        'body': body
+    }
+    return hashlib.sha1(json.dumps(request, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def fetch_json(provider, method, url, headers, params=None, body=None, stream_items=None):
+    """Send a provider request and decode its JSON response
+
+    Identical requests (same endpoint, params, body and API key) share one
+    HTTP call, whether they are in flight at the same time or arrive within
+    PROVIDER_REQUEST_SHARE_SECONDS of the response. With
+    PROVIDER_HEDGING_ENABLED, a request still running after the endpoint's
+    recent p95 latency gets one duplicate and the first response wins.
+
+    Responses are decoded with orjson when it is installed. With
+    stream_items, a response larger than PROVIDER_STREAM_MIN_BYTES (or of
+    unknown size) is read incrementally and only the items list is kept:
+    the raw body and the rest of the document are never held in memory.
+
+    The decoded response is shared between callers and must not be modified.
+
+    Args:
+        provider: Site key, used to rate limit hedged requests
+        method: 'GET' or 'POST'
+        url: Endpoint URL
+        headers: Request headers
+        params: Query parameters
+        body: JSON body for POST requests
+        stream_items: Keys leading to the items list, to stream large
+            responses (the result then only holds that list)
+
+    Raises:
+        requests.RequestException, ValueError: if the request or response fails
+    """
+    key = request_key(method, url, headers, params, body)
+    if stream_items and streaming_available():
+        key += ':' + '.'.join(stream_items)
+    else:
+        stream_items = None
+    now = time.monotonic()
+    with _recent_lock:
+        recent = _recent.get(key)
+        if recent is not None and recent[0] > now:
+            _count('shared')
+            return recent[1]
+
+    def send():
+        stream = stream_items is not None
+        if method == 'POST':
+            response = http_post(url, headers=headers, params=params, json=body, stream=stream)
+        else:
+            response = http_get(url, headers=headers, params=params, stream=stream)
+        try:
+            response.raise_for_status()
+            if stream and _is_large(response):
+                response.raw.decode_content = True
+                return nest(stream_items, list(iter_items(response.raw, stream_items)))
+            return loads(response.content)
+        finally:
+            response.close()
+
+    sent = []
+
+    def call():
+        sent.append(True)
+        return _send_hedged(provider, f"{method} {url}", send)
+
+    data = _in_flight.do(key, call, copy_result=False)
+    if sent:
+        _remember(key, data)
+    else:
+        _count('shared')
+    return data
+
+def _is_large(response):
+    """Whether a response is big enough (or of unknown size) to be worth streaming"""
+    try:
+        return int(response.headers.get('Content-Length', '')) >= Config.PROVIDER_STREAM_MIN_BYTES
+    except ValueError:
+        return True
+
+def _remember(key, data):
+    if Config.PROVIDER_REQUEST_SHARE_SECONDS <= 0:
+        return
+    now = time.monotonic()
+    with _recent_lock:
+        for expired in [k for k, (expires, _) in _recent.items() if expires <= now]:
+            del _recent[expired]
+        _recent[key] = (now + Config.PROVIDER_REQUEST_SHARE_SECONDS, data)
+
+def _timed(endpoint, send):
+    start = time.monotonic()
+    result = send()
+    with _latency_lock:
+        samples = _latencies.get(endpoint)
+        if samples is None:
+            samples = _latencies[endpoint] = deque(maxlen=Config.PROVIDER_HEDGE_SAMPLES)
+        samples.append(time.monotonic() - start)
+    _count('requests')
+    return result
+
+def hedge_delay(endpoint):
+    """Get how long to wait before hedging a request, or None to not hedge
+
+    The delay is the endpoint's recent p95 latency (at least
+    PROVIDER_HEDGE_MIN_DELAY_SECONDS), once enough requests were timed.
+    """
+    if not Config.PROVIDER_HEDGING_ENABLED:
+        return None
+    with _latency_lock:
+        samples = sorted(_latencies.get(endpoint) or ())
+    if len(samples) < Config.PROVIDER_HEDGE_MIN_SAMPLES:
+        return None
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return max(p95, Config.PROVIDER_HEDGE_MIN_DELAY_SECONDS)
+
+def _send_hedged(provider, endpoint, send):
+    delay = hedge_delay(endpoint)
+    if delay is None:
+        return _timed(endpoint, send)
+
+    executor = _get_executor()
+    primary = executor.submit(_timed, endpoint, send)
+    try:
+        return primary.result(timeout=delay)
+    except FuturesTimeoutError:
+        pass
+
+    try:
+        # The duplicate is a real request, so it needs a rate limit token too
+        before_request(provider)
+    except ProviderUnavailableError:
+        return primary.result()
+
+    _count('hedged')
+    logger.info(f"Hedging {endpoint} after {delay:.2f}s")
+    hedge = executor.submit(_timed, endpoint, send)
+    done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+    first = primary if primary in done else hedge
+    if first.exception() is not None:
+        # Whichever finished first failed: wait for the other one
+        first = hedge if first is primary else primary
+    result = first.result()
+    if first is hedge:
+        _count('hedge_wins')
+    return result
+
+def get_request_stats():
+    """Get counts of provider requests sent, shared between sites and hedged"""
+    with _stats_lock:
+        return dict(_stats)
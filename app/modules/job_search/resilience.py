@@ -0,0 +1,270 @@
+import time
+import logging
+import requests
+from app.config import Config
+from app.modules.job_search.sqlite_store import get_connection
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Circuit breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class ProviderUnavailableError(Exception):
+    """Raised when a provider is skipped by its circuit breaker or rate limiter"""
+
+# Providers this process has seen open, mapped to when their cooldown ends.
+# Lets an open breaker be rejected without touching the shared store.
+_open_until = {}
+
+_initialized_paths = set()
+
+def _connection():
+    """Get the shared state store, creating its tables on first use"""
+    path = Config.PROVIDER_STATE_PATH
+    conn = get_connection(path)
+    if path not in _initialized_paths:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS provider_breaker ('
+            'provider TEXT PRIMARY KEY, state TEXT NOT NULL, failures INTEGER NOT NULL, '
+            'open_until REAL NOT NULL, probe_started REAL NOT NULL)'
+        )
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS provider_tokens ('
+            'provider TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)'
+        )
+        _initialized_paths.add(path)
+    return conn
+
+def _parse_provider_rates(value):
+    """Parse 'provider=rate,provider=rate' into a dict of floats"""
+    rates = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            provider, rate = item.split('=', 1)
+            try:
+                rates[provider.strip()] = float(rate)
+            except ValueError:
+                logger.warning(f"Ignoring invalid provider rate limit: {item}")
+    return rates
+
+_provider_rates = None
+
+def _rate_for(provider):
+    """Get the (requests per second, burst) limit for a provider"""
+    global _provider_rates
+    if _provider_rates is None:
+        _provider_rates = _parse_provider_rates(Config.PROVIDER_RATE_LIMITS)
+    rate = _provider_rates.get(provider, Config.PROVIDER_RATE_LIMIT_DEFAULT)
+    return rate, max(1.0, Config.PROVIDER_RATE_BURST)
+
+def before_request(provider):
+    """Check the circuit breaker and take a rate limit token for a provider
+
+    Returns:
+        float: When the half-open probe this request claimed started, or None
+            when the circuit is closed. A claimed probe must end with
+            record_success, record_failure or release_probe.
+
+    Raises:
+        ProviderUnavailableError: if the breaker is open or no token is available
+    """
+    now = time.time()
+
+    # Fast path: this process already knows the breaker is open. Other
+    # threads may drop the expired entry at the same time, hence pop.
+    open_until = _open_until.get(provider)
+    if open_until is not None:
+        if now < open_until:
+            raise ProviderUnavailableError(f"Circuit open for {provider}")
+        _open_until.pop(provider, None)
+
+    allowed = _allow_by_breaker(provider, now)
+    if not allowed:
+        raise ProviderUnavailableError(f"Circuit open for {provider}")
+    probe = now if allowed == HALF_OPEN else None
+    if not _take_token(provider, now):
+        if probe is not None:
+            release_probe(provider, probe)
+        raise ProviderUnavailableError(f"Rate limit reached for {provider}")
+    return probe
+
+def _allow_by_breaker(provider, now):
+    """Check the shared breaker state, claiming the half-open probe if due
+
+    Returns:
+        CLOSED if the request may go ahead, HALF_OPEN if it won the probe,
+        or None if it must be skipped
+    """
+    conn = _connection()
+    row = conn.execute(
+        'SELECT state, open_until, probe_started FROM provider_breaker WHERE provider = ?', (provider,)
+    ).fetchone()
+    if row is None or row[0] == CLOSED:
+        return CLOSED
+
+    state, open_until, probe_started = row
+    if state == OPEN and now < open_until:
+        _open_until[provider] = open_until
+        return None
+    if state == HALF_OPEN and now - probe_started < Config.BREAKER_PROBE_TIMEOUT:
+        # Another worker is already probing the provider
+        return None
+
+    # Cooldown over (or a previous probe stalled): exactly one caller wins the probe
+    cursor = conn.execute(
+        'UPDATE provider_breaker SET state = ?, probe_started = ? '
+        'WHERE provider = ? AND state = ? AND probe_started = ?',
+        (HALF_OPEN, now, provider, state, probe_started)
+    )
+    if cursor.rowcount == 1:
+        logger.info(f"Circuit half-open for {provider}, sending probe request")
+        return HALF_OPEN
+    return None
+
+def release_probe(provider, probe_started):
+    """Give up a half-open probe that ended without a verdict
+
+    The circuit goes back to open with its cooldown already over, so the
+    next request probes the provider instead of waiting for
+    BREAKER_PROBE_TIMEOUT.
+    """
+    _connection().execute(
+        'UPDATE provider_breaker SET state = ?, probe_started = 0 '
+        'WHERE provider = ? AND state = ? AND probe_started = ?',
+        (OPEN, provider, HALF_OPEN, probe_started)
+    )
+
+def _take_token(provider, now):
+    """Take one token from the provider's shared token bucket"""
+    rate, burst = _rate_for(provider)
+    if rate <= 0:
+        return True
+
+    conn = _connection()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        row = conn.execute(
+            'SELECT tokens, updated_at FROM provider_tokens WHERE provider = ?', (provider,)
+        ).fetchone()
+        tokens = burst if row is None else min(burst, row[0] + (now - row[1]) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        conn.execute(
+            'INSERT OR REPLACE INTO provider_tokens (provider, tokens, updated_at) VALUES (?, ?, ?)',
+            (provider, tokens, now)
+        )
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    return allowed
+
+def record_success(provider):
+    """Close the provider's circuit after a successful request"""
+    _open_until.pop(provider, None)
+    conn = _connection()
+    row = conn.execute('SELECT state, failures FROM provider_breaker WHERE provider = ?', (provider,)).fetchone()
+    # Only write when there is something to reset, so healthy providers cost a single read
+    if row is not None and (row[0] != CLOSED or row[1] != 0):
+        conn.execute(
+            'UPDATE provider_breaker SET state = ?, failures = 0, open_until = 0, probe_started = 0 '
+            'WHERE provider = ?',
+            (CLOSED, provider)
+        )
+        if row[0] != CLOSED:
+            logger.info(f"Circuit closed for {provider}")
+
+def record_failure(provider, retry_after=None):
+    """Count a failed request and open the circuit once the threshold is hit
+
+    Args:
+        provider: Provider (site) key
+        retry_after: Seconds the provider asked us to wait (from Retry-After)
+    """
+    now = time.time()
+    conn = _connection()
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        row = conn.execute(
+            'SELECT state, failures, open_until FROM provider_breaker WHERE provider = ?', (provider,)
+        ).fetchone()
+        state, failures, open_until = row if row else (CLOSED, 0, 0)
+        failures += 1
+
+        # A failed probe reopens immediately; otherwise wait for the threshold
+        if state == HALF_OPEN or failures >= Config.BREAKER_FAILURE_THRESHOLD or retry_after:
+            state = OPEN
+            open_until = now + max(Config.BREAKER_COOLDOWN_SECONDS, retry_after or 0)
+            _open_until[provider] = open_until
+            logger.warning(f"Circuit opened for {provider} until {time.ctime(open_until)}")
+
+        conn.execute(
+            'INSERT OR REPLACE INTO provider_breaker (provider, state, failures, open_until, probe_started) '
+            'VALUES (?, ?, ?, ?, 0)',
+            (provider, state, failures, open_until)
+        )
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+def is_provider_failure(error):
+    """Check whether an error means the provider is unhealthy (429, 5xx, timeout, connection)"""
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+def _retry_after(error):
+    """Get the Retry-After seconds from a 429 response, if any"""
+    response = getattr(error, 'response', None)
+    if response is None or response.status_code != 429:
+        return None
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+def guarded_call(provider, call):
+    """Run a provider request behind its rate limiter and circuit breaker
+
+    Args:
+        provider: Provider (site) key
+        call: Callable performing the request
+
+    Raises:
+        ProviderUnavailableError: if the provider is skipped
+    """
+    probe = before_request(provider)
+    succeeded = False
+    try:
+        result = call()
+        succeeded = True
+    except Exception as e:
+        if is_provider_failure(e):
+            record_failure(provider, _retry_after(e))
+            probe = None
+        raise
+    finally:
+        if succeeded:
+            record_success(provider)
+        elif probe is not None:
+            # Failed for a reason that says nothing about the provider's health
+            release_probe(provider, probe)
+    return result
+
+def get_breaker_states():
+    """Get the shared breaker state of every provider that has failed"""
+    rows = _connection().execute(
+        'SELECT provider, state, failures, open_until FROM provider_breaker'
+    ).fetchall()
+    return {
+        provider: {'state': state, 'failures': failures, 'open_until': open_until or None}
+        for provider, state, failures, open_until in rows
+    }
@@ -0,0 +1,209 @@
+import json
+import time
+import heapq
+import logging
+import datetime
+import threading
+from sqlalchemy.exc import IntegrityError
+from app.config import Config
+from app.models import db, User, SavedSearch, SavedSearchMatch, SavedSearchSeenJob
+from app.modules.job_search.searcher import collect_jobs, get_user_preferences, query_fingerprint
+from app.modules.job_search.job_store import ensure_job_store, store_jobs
+from app.modules.job_search.scoring import evaluate_jobs
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+_ready_engines = set()
+_ready_lock = threading.Lock()
+
+def ensure_saved_search_tables():
+    """Create the saved-search tables (and the job store they reference) if missing"""
+    engine = db.engine
+    if engine.url in _ready_engines:
+        return
+    with _ready_lock:
+        if engine.url in _ready_engines:
+            return
+        ensure_job_store()
+        for model in (SavedSearch, SavedSearchMatch, SavedSearchSeenJob):
+            model.__table__.create(engine, checkfirst=True)
+        _ready_engines.add(engine.url)
+
+def build_default_saved_searches(user):
+    """Create saved searches from a user's job titles and preferred locations
+
+    One search per job title and location ('Remote' for remote-only users),
+    so users with the same title and location share one provider query.
+    Searches the user already has are skipped.
+
+    Args:
+        user: User
+
+    Returns:
+        list: The SavedSearch rows created
+    """
+    ensure_saved_search_tables()
+    locations = ['Remote'] if user.remote_only else (user.get_preferred_locations_list() or [''])
+    existing = {
+        (search.keywords.strip().lower(), (search.location or '').strip().lower())
+        for search in SavedSearch.query.filter_by(user_id=user.id).all()
+    }
+
+    created = []
+    for title in user.get_job_titles_list():
+        for location in locations:
+            if not title or (title.lower(), location.lower()) in existing:
+                continue
+            search = SavedSearch(
+                user_id=user.id,
+                name=f"{title} ({location})" if location else title,
+                keywords=title,
+                location=location
+            )
+            db.session.add(search)
+            existing.add((title.lower(), location.lower()))
+            created.append(search)
+
+    db.session.commit()
+    return created
+
+def _claim(search, now):
+    """Mark a due search as started; False if another worker claimed it first"""
+    query = SavedSearch.query.filter(SavedSearch.id == search.id)
+    if search.last_run_at is None:
+        query = query.filter(SavedSearch.last_run_at.is_(None))
+    else:
+        query = query.filter(SavedSearch.last_run_at == search.last_run_at)
+    return query.update({'last_run_at': now}, synchronize_session=False) == 1
+
+def run_due_searches():
+    """Run every saved search that is due, one provider query per unique search
+
+    Due searches are grouped by query fingerprint, so identical searches of
+    different users are fetched once. Only postings the query hasn't returned
+    before are scored, separately for each user in the group. A search's
+    first run scores everything it finds instead.
+
+    Must be called inside an app context.
+
+    Returns:
+        dict: Counts of searches run, unique queries, new jobs and matches saved
+    """
+    ensure_saved_search_tables()
+    now = datetime.datetime.utcnow()
+    due_before = now - datetime.timedelta(minutes=Config.SAVED_SEARCH_INTERVAL_MINUTES)
+
+    due = SavedSearch.query.filter(
+        SavedSearch.is_active.is_(True),
+        db.or_(SavedSearch.last_run_at.is_(None), SavedSearch.last_run_at <= due_before)
+    ).all()
+
+    groups = {}
+    for search in due:
+        first_run = search.last_run_at is None
+        if not _claim(search, now):
+            continue
+        criteria = search.to_criteria()
+        if not criteria['keywords']:
+            continue
+        group = groups.setdefault(query_fingerprint(criteria), (criteria, []))
+        group[1].append((search.id, first_run))
+    db.session.commit()
+
+    stats = {'searches': sum(len(members) for _, members in groups.values()), 'queries': len(groups),
+             'new_jobs': 0, 'matches': 0}
+    for fingerprint, (criteria, members) in groups.items():
+        try:
+            new_jobs, matches = _run_query(fingerprint, criteria, members)
+            stats['new_jobs'] += new_jobs
+            stats['matches'] += matches
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Saved search query {fingerprint[:12]} failed: {str(e)}")
+            SavedSearch.query.filter(SavedSearch.id.in_([search_id for search_id, _ in members])).update(
+                {'last_error': str(e)}, synchronize_session=False
+            )
+            db.session.commit()
+
+    if groups:
+        logger.info(f"Ran {stats['searches']} saved searches as {stats['queries']} queries: "
+                    f"{stats['new_jobs']} new jobs, {stats['matches']} matches")
+    return stats
+
+def _run_query(fingerprint, criteria, members):
+    """Fetch one query, find postings it hasn't returned before and score them per search
+
+    Returns:
+        tuple: (number of new postings, number of matches saved)
+    """
+    jobs = collect_jobs(dict(criteria))
+    if any('job_ref' not in job for job in jobs):
+        store_jobs(jobs)
+
+    fingerprints = [job['fingerprint'] for job in jobs]
+    seen = set()
+    for start in range(0, len(fingerprints), 500):
+        rows = db.session.query(SavedSearchSeenJob.job_fingerprint).filter(
+            SavedSearchSeenJob.query_fingerprint == fingerprint,
+            SavedSearchSeenJob.job_fingerprint.in_(fingerprints[start:start + 500])
+        ).all()
+        seen.update(row[0] for row in rows)
+
+    # Searches are claimed one by one, so another worker may be running this
+    # query for other users' searches right now. A posting is new only to the
+    # run whose seen row is actually inserted.
+    new_jobs = []
+    for job in jobs:
+        if job['fingerprint'] in seen:
+            continue
+        try:
+            with db.session.begin_nested():
+                db.session.add(SavedSearchSeenJob(query_fingerprint=fingerprint, job_fingerprint=job['fingerprint']))
+        except IntegrityError:
+            continue
+        new_jobs.append(job)
+
+    matches = 0
+    for search_id, first_run in members:
+        search = db.session.get(SavedSearch, search_id)
+        candidates = jobs if first_run else new_jobs
+        if search is None or not candidates:
+            continue
+        user = db.session.get(User, search.user_id)
+        factors = evaluate_jobs(candidates, criteria['keywords'], get_user_preferences(user) if user else None)
+
+        scored = [(job_factors.score(), index) for index, job_factors in enumerate(factors)]
+        scored = [(score, index) for score, index in scored if score >= Config.SAVED_SEARCH_MIN_SCORE]
+        if first_run:
+            scored = heapq.nlargest(Config.SAVED_SEARCH_FIRST_RUN_MATCHES, scored)
+
+        for score, index in scored:
+            db.session.add(SavedSearchMatch(
+                saved_search_id=search_id,
+                job_ref_id=candidates[index]['job_ref'],
+                match_score=score,
+                match_reasons=json.dumps(factors[index].reasons())
+            ))
+        search.last_error = None
+        matches += len(scored)
+
+    db.session.commit()
+    return len(new_jobs), matches
+
+def run_forever(app):
+    """Run due saved searches every SAVED_SEARCH_POLL_SECONDS until stopped
+
+    Args:
+        app: Flask app (each pass runs in its own app context)
+    """
+    logger.info(f"Saved search scheduler started (every {Config.SAVED_SEARCH_POLL_SECONDS}s)")
+    while True:
+        with app.app_context():
+            try:
+                run_due_searches()
+            except Exception as e:
+                logger.error(f"Saved search scheduler pass failed: {str(e)}")
+            finally:
+                db.session.remove()
+        time.sleep(Config.SAVED_SEARCH_POLL_SECONDS)
@@ -0,0 +1,303 @@
+import logging
+from datetime import datetime, timezone
+from collections import Counter
+from app.modules.job_search.normalize import annual_salary, posted_days_ago
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Characters rewritten before salary numbers are read ('$120k' -> ' 120000 ')
+_SALARY_TRANSLATION = str.maketrans({'$': ' ', ',': '', 'k': '000 '})
+
+class KeywordMatcher:
+    """Finds which search keywords occur in a text, prepared once per search
+
+    Keywords are lowercased and de-duplicated up front and tried longest
+    first. Like the output sets of an Aho-Corasick automaton, each keyword
+    knows the shorter keywords it contains, so when "javascript" is found
+    "java" is counted without searching for it again. Each remaining check is
+    a C-level substring search over the already lowercased text, which beat
+    a Python-level automaton scan for the handful of keywords a search has.
+
+    Args:
+        keywords: Search keywords (duplicates count once per occurrence,
+            matching the per-keyword scoring)
+    """
+
+    def __init__(self, keywords):
+        lowered = [keyword.lower() for keyword in keywords]
+        self._weights = Counter(keyword for keyword in lowered if keyword)
+        # An empty keyword is contained in every text
+        self._always = len(lowered) - sum(self._weights.values())
+
+        self._patterns = sorted(self._weights, key=len, reverse=True)
+        self._contains = {
+            pattern: [other for other in self._patterns if other in pattern] for pattern in self._patterns
+        }
+        # Usually no keyword contains another and none repeats: just count hits
+        self._independent = all(
+            len(self._contains[pattern]) == 1 and self._weights[pattern] == 1 for pattern in self._patterns
+        )
+
+    def count(self, text):
+        """Count the keywords that occur in an already lowercased text"""
+        if not text:
+            return self._always
+        if self._independent:
+            return self._always + sum(pattern in text for pattern in self._patterns)
+
+        found = set()
+        for pattern in self._patterns:
+            if pattern not in found and pattern in text:
+                found.update(self._contains[pattern])
+        return self._always + sum(self._weights[keyword] for keyword in found)
+
+
+class ScoringContext:
+    """Everything about a search that scoring needs, prepared once per batch
+
+    Titles, locations, posted dates and salaries repeat a lot across a result
+    list, so what is derived from each distinct value is memoized for the
+    batch.
+
+    Args:
+        keywords: Search keywords
+        user_preferences: Optional preferences dict (see searcher.get_user_preferences)
+    """
+
+    def __init__(self, keywords, user_preferences=None):
+        self.matcher = KeywordMatcher(keywords)
+        self.user_preferences = user_preferences
+        self.remote_only = False
+        self.preferred_locations = []
+        self.min_salary = None
+        if user_preferences:
+            self.remote_only = user_preferences['remote_only']
+            self.preferred_locations = [
+                (location, location.lower()) for location in user_preferences['preferred_locations'] or []
+            ]
+            self.min_salary = user_preferences['min_salary']
+        self.today = datetime.now(timezone.utc).date()
+        self._titles = {}
+        self._recency = {}
+        self._posted_at = {}
+        self._locations = {}
+        self._salaries = {}
+
+    def title_matches(self, title):
+        matches = self._titles.get(title)
+        if matches is None:
+            matches = self._titles[title] = self.matcher.count(title.lower())
+        return matches
+
+    def recency(self, posted_date):
+        if not isinstance(posted_date, str):
+            return None, None
+        recency = self._recency.get(posted_date)
+        if recency is None:
+            recency = self._recency[posted_date] = _parse_recency(posted_date)
+        return recency
+
+    def recency_at(self, posted_at):
+        """Get the recency of an ISO posted_at, counted in calendar days (UTC)"""
+        recency = self._posted_at.get(posted_at)
+        if recency is None:
+            days_ago = posted_days_ago(posted_at, self.today)
+            if days_ago is None or days_ago > 7:
+                recency = (None, None)
+            elif days_ago == 0:
+                recency = ('today', None)
+            elif days_ago == 1:
+                recency = ('yesterday', None)
+            else:
+                recency = ('days', days_ago)
+            self._posted_at[posted_at] = recency
+        return recency
+
+    def location_match(self, location):
+        """Get (remote match, matching preferred location or None)"""
+        match = self._locations.get(location)
+        if match is None:
+            lowered = location.lower()
+            match = (False, None)
+            if self.remote_only:
+                match = ('remote' in lowered, None)
+            else:
+                for original, preferred in self.preferred_locations:
+                    if preferred in lowered:
+                        match = (False, original)
+                        break
+            self._locations[location] = match
+        return match
+
+    def salary_match(self, salary):
+        match = self._salaries.get(salary)
+        if match is None:
+            highest = _max_salary_number(salary)
+            match = self._salaries[salary] = highest is not None and highest >= self.min_salary
+        return match
+
+
+class MatchFactors:
+    """The facts a match score is built from, kept so reasons can be built later"""
+
+    __slots__ = ('title_matches', 'desc_matches', 'posted', 'days_ago', 'location_match',
+                 'remote_match', 'salary_match')
+
+    def __init__(self):
+        self.title_matches = 0
+        self.desc_matches = 0
+        self.posted = None  # 'today', 'yesterday' or 'days'
+        self.days_ago = None
+        self.location_match = None
+        self.remote_match = False
+        self.salary_match = False
+
+    def score(self):
+        """Calculate the 0-100 match score"""
+        score = 0
+        if self.title_matches:
+            score += min(40, 20 + (self.title_matches * 5))
+        if self.desc_matches:
+            score += min(20, self.desc_matches * 3)
+        score += self._recency_score()
+        if self.remote_match or self.location_match is not None:
+            score += 15
+        if self.salary_match:
+            score += 10
+        return max(0, min(100, score))
+
+    def _recency_score(self):
+        if self.posted == 'today':
+            return 15
+        if self.posted == 'yesterday':
+            return 10
+        if self.posted == 'days':
+            return max(0, 10 - self.days_ago)
+        return 0
+
+    def reasons(self):
+        """Build the human readable reasons behind the score"""
+        reasons = []
+        if self.title_matches:
+            title_score = min(40, 20 + (self.title_matches * 5))
+            reasons.append(f"Title matches {self.title_matches} keyword(s): +{title_score} points")
+        if self.desc_matches:
+            desc_score = min(20, self.desc_matches * 3)
+            reasons.append(f"Description matches {self.desc_matches} keyword(s): +{desc_score} points")
+        if self.posted == 'today':
+            reasons.append("Job posted today: +15 points")
+        elif self.posted == 'yesterday':
+            reasons.append("Job posted yesterday: +10 points")
+        elif self.posted == 'days':
+            reasons.append(f"Job posted {self.days_ago} days ago: +{self._recency_score()} points")
+        if self.remote_match:
+            reasons.append("Remote job matches preference: +15 points")
+        elif self.location_match is not None:
+            reasons.append(f"Location {self.location_match} matches preference: +15 points")
+        if self.salary_match:
+            reasons.append("Salary meets minimum requirement: +10 points")
+        return reasons
+
+
+def evaluate_job(job, context):
+    """Work out the match factors for one job
+
+    Every job field is lowercased at most once, and the description is the
+    only field searched per job; everything else is memoized by value.
+    Structured posted_at and salary fields from ingest are preferred over
+    the display strings.
+    """
+    factors = MatchFactors()
+    factors.title_matches = context.title_matches(job['title'])
+    factors.desc_matches = context.matcher.count(job['description'].lower())
+    if job.get('posted_at'):
+        factors.posted, factors.days_ago = context.recency_at(job['posted_at'])
+    else:
+        factors.posted, factors.days_ago = context.recency(job.get('posted_date'))
+
+    if context.user_preferences:
+        factors.remote_match, factors.location_match = context.location_match(job['location'])
+        if context.min_salary:
+            annual = annual_salary(job)
+            if annual is not None:
+                factors.salary_match = annual >= context.min_salary
+            elif job.get('salary') and job.get('period') is None:
+                # Jobs that weren't normalized at ingest (e.g. older cache entries);
+                # a known period without a yearly amount (a fixed price) isn't compared
+                factors.salary_match = context.salary_match(job['salary'])
+
+    return factors
+
+def _parse_recency(posted_date):
+    """Read 'Today', 'Yesterday' or 'N days ago' from a posted date string
+
+    Returns:
+        tuple: ('today' | 'yesterday' | 'days' | None, days ago or None)
+    """
+    lowered = posted_date.lower()
+    if 'today' in lowered:
+        return 'today', None
+    if 'yesterday' in lowered:
+        return 'yesterday', None
+    parts = posted_date.split(None, 1)
+    if parts and parts[0].isdigit():
+        days_ago = int(parts[0])
+        if days_ago <= 7:
+            return 'days', days_ago
+    return None, None
+
+def _max_salary_number(salary):
+    """Get the largest number in a free-text salary, or None"""
+    if not isinstance(salary, str):
+        return None
+    highest = None
+    for word in salary.lower().translate(_SALARY_TRANSLATION).split():
+        if word.isdigit():
+            number = int(word)
+        elif word.replace('.', '').isdigit():
+            try:
+                number = float(word)
+            except ValueError:
+                # '1.2.3' - the salary can't be read reliably
+                return None
+        else:
+            continue
+        if highest is None or number > highest:
+            highest = number
+    return highest
+
+def evaluate_jobs(jobs, keywords, user_preferences=None):
+    """Work out the match factors for a whole list of jobs
+
+    Use this when only some jobs will need reasons: call score() on every
+    factor set and reasons() only on the ones that are returned.
+
+    Args:
+        jobs: list of job dicts
+        keywords: Search keywords
+        user_preferences: Optional user preferences dict
+
+    Returns:
+        list: MatchFactors in job order
+    """
+    context = ScoringContext(keywords, user_preferences)
+    return [evaluate_job(job, context) for job in jobs]
+
+def score_jobs(jobs, keywords, user_preferences=None, with_reasons=True):
+    """Score a whole list of jobs against keywords and user preferences
+
+    Args:
+        jobs: list of job dicts
+        keywords: Search keywords
+        user_preferences: Optional user preferences dict
+        with_reasons: Build reason strings too (skip when only ranking)
+
+    Returns:
+        list: (score, reasons) tuples in job order; reasons is None when
+            with_reasons is False
+    """
+    return [
+        (factors.score(), factors.reasons() if with_reasons else None)
+        for factors in evaluate_jobs(jobs, keywords, user_preferences)
+    ]
@@ -1,16 +1,26 @@
+import json
 import time
+import heapq
+import base64
+import hashlib
 import logging
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, TimeoutError as FuturesTimeoutError
+from flask import has_app_context
 from flask_login import current_user
 from app.config import Config
-from app.modules.job_search.api_implementations import (
-    _search_indeed, _search_upwork, _search_google_jobs, _search_workday,
-    _search_glassdoor, _search_startup_jobs, _search_job_search,
-    _search_internships, _search_active_jobs,
-    _search_indeed_api, _search_jobs_api, _search_linkedin_api, 
-    _search_linkedin_job_api, _search_google_jobs_api, _search_workday_jobs_api,
-    _search_glassdoor_jobs_api, _search_startup_jobs_api, _search_job_search_api,
-    _fetch_hiring_manager_info
-)
+from app.modules.job_search.cache import get_search_cache, normalize_criteria, make_cache_key
+from app.modules.job_search.resilience import guarded_call, ProviderUnavailableError
+from app.modules.job_search.api_implementations import get_provider
+from app.modules.job_search.hiring_managers import get_hiring_manager_index
+from app.modules.job_search.scoring import score_jobs, evaluate_jobs
+from app.modules.job_search.dedupe import NearDuplicateIndex
+from app.modules.job_search.singleflight import SingleFlight
+from app.modules.job_search.provider_requests import get_request_stats
+from app.modules.job_search.job_store import store_jobs, search_stored_jobs
+from app.modules.job_search.normalize import annual_salary, posted_days_ago
+from app.modules.job_search.metrics import observe_call, record_unique_jobs, record_match_scores
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -38,9 +48,32 @@ JOB_SITES = {
     'hiring_manager': 'Hiring Manager API'
 }
 
-def search_jobs(criteria):
+# Shared thread pool used to query providers concurrently (created lazily per process)
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    """Get the process-wide thread pool used for provider fan-out"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.JOB_SEARCH_MAX_WORKERS,
+                    thread_name_prefix='job-search'
+                )
+    return _executor
+
+def search_jobs(criteria, metadata=None, limit=None, offset=0, cursor=None):
     """Search for jobs matching the given criteria
     
+    Without a limit every job is returned, sorted by match score. With a
+    limit only one page is ranked out of the results: the top offset+limit
+    jobs are picked with a heap instead of sorting everything, and match
+    reasons and hiring manager info are only added to the returned jobs.
+    Providers are paged deeper until there are offset+limit well-scoring
+    jobs or the page budget runs out (see collect_jobs).
+    
     Args:
         criteria: dict containing search parameters like:
             - keywords: list of keywords to search for
@@ -48,9 +81,210 @@ def search_jobs(criteria):
             - job_type: full-time, part-time, etc.
             - sites: list of job sites to search
             - user_id: user ID for personalized search
+            - deadline: optional per-search deadline in seconds, at most
+              JOB_SEARCH_MAX_DEADLINE_SECONDS
+            - local_only: answer from the stored job table without
+              calling any provider
+            - posted_within_days: optional, drop jobs posted longer ago
+            - min_salary: optional yearly minimum, drop jobs paying less
+        metadata: optional dict that is filled with details about the search,
+            e.g. which sites missed the deadline, and next_cursor in top-K mode
+        limit: optional page size (enables top-K mode)
+        offset: number of top jobs to skip in top-K mode
+        cursor: next_cursor from a previous page; overrides offset
             
     Returns:
         list: Job listings matching the criteria with match scores
+        
+    Raises:
+        ValueError: if limit, offset, cursor or a filter is invalid
+    """
+    # Validate up front so a bad cursor fails before any provider is called
+    _prepare_search(criteria)
+    if cursor:
+        offset = _decode_cursor(cursor, criteria)
+    if limit is not None and (limit < 1 or offset < 0):
+        raise ValueError("limit must be positive and offset not negative")
+    
+    # Later pages collect the first page's result set again; count it once
+    first_page = offset == 0
+    unique_jobs = collect_jobs(criteria, metadata, wanted=offset + limit if limit is not None else 0,
+                               record_metrics=first_page)
+    if not unique_jobs:
+        return []
+    
+    if limit is not None:
+        page = _select_top_jobs(unique_jobs, criteria, limit, offset, record_scores=first_page)
+        if metadata is not None:
+            next_offset = offset + len(page)
+            metadata['total_jobs'] = len(unique_jobs)
+            metadata['offset'] = offset
+            metadata['limit'] = limit
+            metadata['next_cursor'] = (
+                _encode_cursor(next_offset, criteria) if next_offset < len(unique_jobs) else None
+            )
+        return _enhance_with_hiring_manager_info(page)
+    
+    # Add match scores to jobs
+    jobs_with_scores = _add_match_scores(unique_jobs, criteria)
+    
+    # Enhance job listings with hiring manager info if available
+    enhanced_jobs = _enhance_with_hiring_manager_info(jobs_with_scores)
+    
+    # Sort jobs by match score
+    sorted_jobs = sorted(enhanced_jobs, key=lambda x: x['match_score'], reverse=True)
+    
+    return sorted_jobs
+    
+def collect_jobs(criteria, metadata=None, wanted=0, record_metrics=True):
+    """Fetch, de-duplicate and store the jobs for a search, without scoring them
+    
+    The first result page of every site is fetched. When `wanted` is set,
+    further pages are pulled from sites that have them until there are that
+    many jobs scoring at least JOB_SEARCH_GOOD_SCORE, at most
+    JOB_SEARCH_PAGE_BUDGET extra pages per search, within the deadline.
+    
+    Every unique job is stored, but only the ones passing the
+    posted_within_days and min_salary filters are returned.
+    
+    Args:
+        criteria: dict of search parameters (see search_jobs)
+        metadata: optional dict filled with details about the search
+        wanted: number of well-scoring jobs the caller needs (0: first pages only)
+        record_metrics: count the unique jobs in the provider metrics (off
+            for later pages of a search that was already counted)
+    
+    Returns:
+        list: Unique job listings, each tagged with its job_ref when stored
+    """
+    site_names, deadline = _prepare_search(criteria)
+    
+    local_only = bool(criteria.get('local_only'))
+    extra_pages = 0
+    if local_only:
+        site_names = []
+        timed_out, elapsed = [], 0.0
+        unique_jobs = _remove_duplicate_jobs(_search_local(criteria))
+    else:
+        # Collect the first page of all specified sites concurrently
+        pages = {site: _site_pages(site, criteria) for site in site_names}
+        results, timed_out, elapsed = _fan_out(pages, deadline)
+        
+        all_jobs = []
+        for site in site_names:
+            all_jobs.extend(results.get(site, []))
+        
+        # Remove duplicates (same posting from several providers)
+        dedupe_index = NearDuplicateIndex(Config.JOB_DEDUPE_SIMILARITY)
+        first_jobs = _remove_duplicate_jobs(all_jobs, dedupe_index)
+        if wanted and elapsed < deadline:
+            # Only sites that answered with jobs can have more pages
+            more_pages = {site: pages[site] for site in site_names if results.get(site)}
+            extra_pages, extra_elapsed = _fetch_more_pages(
+                more_pages, dedupe_index, first_jobs, criteria, wanted, deadline - elapsed
+            )
+            elapsed += extra_elapsed
+        unique_jobs = dedupe_index.jobs()
+        if record_metrics:
+            record_unique_jobs(unique_jobs)
+    
+    if metadata is not None:
+        metadata['sites_searched'] = site_names
+        metadata['timed_out_sites'] = timed_out
+        metadata['deadline_seconds'] = deadline
+        metadata['elapsed_seconds'] = round(elapsed, 3)
+        metadata['extra_pages'] = extra_pages
+    
+    # If no jobs found, return empty list
+    if not unique_jobs:
+        logger.info("No jobs found through API search")
+        return []
+    
+    if not local_only:
+        _persist_jobs(unique_jobs)
+    
+    return _filter_jobs(unique_jobs, criteria)
+
+def iter_search_jobs(criteria, metadata=None):
+    """Search for jobs, yielding scored results as each site responds
+    
+    Each batch is de-duplicated against every job already yielded, scored and
+    enhanced with hiring manager info, so the first results arrive as soon as
+    the fastest site answers. Batches are not sorted across sites.
+    
+    Args:
+        criteria: dict of search parameters (see search_jobs)
+        metadata: optional dict filled in once the search has finished
+        
+    Returns:
+        generator: yields (site, list of new scored jobs from that site)
+        
+    Raises:
+        ValueError: if the criteria are invalid (raised here, before the
+            first result is requested)
+    """
+    start_time = time.monotonic()
+    site_names, deadline = _prepare_search(criteria)
+    return _iter_site_jobs(criteria, metadata, site_names, deadline, start_time)
+
+def _iter_site_jobs(criteria, metadata, site_names, deadline, start_time):
+    """Yield (site, scored jobs) as each site responds (see iter_search_jobs)"""
+    user_preferences = get_user_preferences()
+    
+    executor = _get_executor()
+    futures = {executor.submit(_search_site, site, criteria): site for site in site_names}
+    # Jobs already streamed can't be swapped for a richer copy
+    dedupe_index = NearDuplicateIndex(Config.JOB_DEDUPE_SIMILARITY, keep_richest=False)
+    finished = set()
+    
+    try:
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                site = futures[future]
+                finished.add(site)
+                try:
+                    site_jobs = future.result()
+                except Exception as e:
+                    logger.error(f"Error searching {site}: {str(e)}")
+                    continue
+            
+                new_jobs = _remove_duplicate_jobs(site_jobs, dedupe_index)
+                if not new_jobs:
+                    continue
+                record_unique_jobs(new_jobs)
+                _persist_jobs(new_jobs)
+                new_jobs = _filter_jobs(new_jobs, criteria)
+                if not new_jobs:
+                    continue
+            
+                jobs_with_scores = _add_match_scores(new_jobs, criteria, user_preferences)
+                enhanced_jobs = _enhance_with_hiring_manager_info(jobs_with_scores)
+                yield site, sorted(enhanced_jobs, key=lambda x: x['match_score'], reverse=True)
+        except FuturesTimeoutError:
+            pass
+    finally:
+        # Also runs when the generator is closed early (a streaming client
+        # disconnected), so sites still queued in the shared pool don't hold
+        # threads; calls already running finish in the background
+        for future in futures:
+            future.cancel()
+    
+    timed_out = [site for site in site_names if site not in finished]
+    if timed_out:
+        logger.warning(f"Job search deadline of {deadline}s exceeded by: {', '.join(timed_out)}")
+    
+    if metadata is not None:
+        metadata['sites_searched'] = site_names
+        metadata['timed_out_sites'] = timed_out
+        metadata['deadline_seconds'] = deadline
+        metadata['elapsed_seconds'] = round(time.monotonic() - start_time, 3)
+        metadata['total_jobs'] = len(dedupe_index)
+
+def _prepare_search(criteria):
+    """Validate criteria and work out which sites to search
+    
+    Returns:
+        tuple: (list of site keys, deadline in seconds)
     """
     # Validate input
     if 'keywords' not in criteria:
@@ -63,32 +297,138 @@ def search_jobs(criteria):
     # Default to all available sites if none specified
     sites = criteria.get('sites', list(JOB_SITES.keys()))
     
-    # Collect jobs from all specified sites
-    all_jobs = []
+    site_names = []
     for site in sites:
-        if site.lower() in JOB_SITES:
-            site_jobs = _search_site(site.lower(), criteria)
-            all_jobs.extend(site_jobs)
+        if site.lower() in JOB_SITES and site.lower() not in site_names:
+            site_names.append(site.lower())
     
-    # If no jobs found, return empty list
-    if not all_jobs:
-        logger.info("No jobs found through API search")
-        return []
+    # Optional filters, compared with the structured fields parsed at ingest
+    for field, cast in (('posted_within_days', int), ('min_salary', float)):
+        if criteria.get(field) in (None, ''):
+            criteria.pop(field, None)
+            continue
+        try:
+            criteria[field] = cast(criteria[field])
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} must be a number")
+    
+    deadline = criteria.get('deadline')
+    if deadline in (None, ''):
+        deadline = Config.JOB_SEARCH_DEADLINE_SECONDS
+    else:
+        try:
+            deadline = float(deadline)
+        except (TypeError, ValueError):
+            raise ValueError("deadline must be a number")
+        if not deadline > 0:
+            raise ValueError("deadline must be positive")
+    # A client may shorten a search but not hold provider threads for longer
+    deadline = min(deadline, Config.JOB_SEARCH_MAX_DEADLINE_SECONDS)
+    return site_names, deadline
+
+def _fan_out(pages, deadline):
+    """Fetch the next page of all sites concurrently and wait at most `deadline` seconds
     
-    # Remove duplicates (based on job title and company)
-    unique_jobs = _remove_duplicate_jobs(all_jobs)
+    Args:
+        pages: dict of site key -> page generator (see _site_pages)
+        deadline: maximum number of seconds to wait for all sites
+        
+    Returns:
+        tuple: (dict of site -> jobs, list of sites that missed the deadline,
+                elapsed seconds)
+    """
+    start_time = time.monotonic()
+    if not pages:
+        return {}, [], 0.0
     
-    # Add match scores to jobs
-    jobs_with_scores = _add_match_scores(unique_jobs, criteria)
+    executor = _get_executor()
+    futures = {executor.submit(next, site_pages, []): site for site, site_pages in pages.items()}
+    done, not_done = wait(futures, timeout=deadline)
     
-    # Enhance job listings with hiring manager info if available
-    enhanced_jobs = _enhance_with_hiring_manager_info(jobs_with_scores)
+    results = {}
+    for future in done:
+        site = futures[future]
+        try:
+            results[site] = future.result()
+        except Exception as e:
+            logger.error(f"Error searching {site}: {str(e)}")
+            results[site] = []
     
-    # Sort jobs by match score
-    sorted_jobs = sorted(enhanced_jobs, key=lambda x: x['match_score'], reverse=True)
+    # Providers that missed the deadline are dropped; their threads finish in the background
+    timed_out = [futures[future] for future in not_done]
+    for future in not_done:
+        future.cancel()
+    if timed_out:
+        logger.warning(f"Job search deadline of {deadline}s exceeded by: {', '.join(timed_out)}")
     
-    return sorted_jobs
+    return results, timed_out, time.monotonic() - start_time
+
+def _fetch_more_pages(pages, dedupe_index, jobs, criteria, wanted, time_left):
+    """Page deeper into the sites until there are enough well-scoring jobs
     
+    Runs in rounds: each round asks every site that still has pages for one
+    more, concurrently, and stops once `wanted` unique jobs score at least
+    JOB_SEARCH_GOOD_SCORE, the page budget is spent, every site is
+    exhausted or time runs out.
+    
+    Args:
+        pages: dict of site key -> page generator whose first page was consumed
+        dedupe_index: NearDuplicateIndex holding the jobs found so far
+        jobs: the unique jobs found so far
+        criteria: search criteria
+        wanted: number of well-scoring jobs needed
+        time_left: seconds left before the search deadline
+        
+    Returns:
+        tuple: (number of extra pages requested, elapsed seconds)
+    """
+    start_time = time.monotonic()
+    keywords = criteria.get('keywords', [])
+    user_preferences = get_user_preferences()
+    
+    def count_good(new_jobs):
+        # Jobs the filters will drop don't count towards the page
+        scores = score_jobs(_filter_jobs(new_jobs, criteria), keywords, user_preferences, with_reasons=False)
+        return sum(1 for score, _ in scores if score >= Config.JOB_SEARCH_GOOD_SCORE)
+    
+    good = count_good(jobs)
+    budget = Config.JOB_SEARCH_PAGE_BUDGET
+    active = [site for site in pages if getattr(get_provider(site), 'paging', None)]
+    requested = 0
+    executor = _get_executor()
+    
+    while active and good < wanted and requested < budget:
+        remaining = time_left - (time.monotonic() - start_time)
+        if remaining <= 0:
+            break
+        round_sites = active[:budget - requested]
+        requested += len(round_sites)
+        futures = {executor.submit(next, pages[site], None): site for site in round_sites}
+        done, not_done = wait(futures, timeout=remaining)
+        
+        finished = set()
+        for future in not_done:
+            future.cancel()
+            finished.add(futures[future])
+        for future in done:
+            site = futures[future]
+            try:
+                page = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching more {site} results: {str(e)}")
+                page = None
+            if not page:
+                finished.add(site)
+                continue
+            good += count_good(_remove_duplicate_jobs(page, dedupe_index))
+        
+        # Sites left out of this round by the budget go first next time
+        active = [site for site in active[len(round_sites):] + round_sites if site not in finished]
+    
+    if requested:
+        logger.info(f"Fetched {requested} extra result pages: {good} well-scoring jobs of {wanted} wanted")
+    return requested, time.monotonic() - start_time
+
 def _enhance_with_hiring_manager_info(jobs):
     """Enhance job listings with hiring manager information if available"""
     # Fetch hiring manager information from API
@@ -98,18 +438,17 @@ def _enhance_with_hiring_manager_info(jobs):
         
         # Check if hiring manager API is configured
         if 'hiring_manager' in portal_configs and portal_configs['hiring_manager']['enabled']:
-            logger.info("Fetching hiring manager information to enhance job listings")
-            
-            # Get hiring manager data
-            hiring_manager_data = _fetch_hiring_manager_info(portal_configs['hiring_manager'])
+            # Get hiring manager data (cached and shared between workers)
+            hiring_manager_index = get_hiring_manager_index(portal_configs['hiring_manager'])
             
-            if hiring_manager_data:
+            if hiring_manager_index:
                 # For each job, try to find matching hiring manager data
                 for job in jobs:
                     company_name = job.get('company', '').lower()
-                    if company_name in hiring_manager_data:
+                    managers = hiring_manager_index.lookup(company_name)
+                    if managers:
                         # Pick the first hiring manager for the company
-                        manager = hiring_manager_data[company_name][0]
+                        manager = managers[0]
                         
                         # Add hiring manager info to job
                         job['hiring_manager'] = {
@@ -131,204 +470,242 @@ def _enhance_with_hiring_manager_info(jobs):
     
     return jobs
 
-def _search_site(site, criteria):
-    """Search a specific job site"""
-    # Get portal configurations
-    portal_configs = Config.get_job_portal_configs()
+# Identical provider queries in flight in this process (shared across users)
+_in_flight = SingleFlight()
+
+def get_coalescing_stats():
+    """Get how many provider queries this process ran and coalesced, and its shared and hedged requests"""
+    stats = _in_flight.stats()
+    stats['requests'] = get_request_stats()
+    return stats
+
+def _site_pages(site, criteria):
+    """Lazily fetch a site's result pages, one provider request per page asked for
     
-    # Skip web scraping, only use API
+    Yields:
+        list: The jobs of each page (a single page for sites that can't page)
+    """
+    provider = get_provider(site)
+    if provider is None:
+        jobs = _search_site(site, criteria)
+        if jobs:
+            yield jobs
+        return
+    yield from provider.iter_pages(lambda page: _search_site(site, criteria, page), Config.JOB_SEARCH_MAX_PAGES)
+
+def _search_site(site, criteria, page=0):
+    """Search a specific job site, serving repeated queries from the cache
     
-    # Try API if available and enabled
-    if site in portal_configs and portal_configs[site]['enabled']:
-        try:
-            # Use the appropriate API method based on the site
-            if site == 'indeed':
-                return _search_indeed(portal_configs[site], criteria)
-            elif site == 'upwork':
-                return _search_upwork(portal_configs[site], criteria)
-            elif site == 'google':
-                return _search_google_jobs(portal_configs[site], criteria)
-            elif site == 'workday':
-                return _search_workday(portal_configs[site], criteria)
-            elif site == 'glassdoor':
-                return _search_glassdoor(portal_configs[site], criteria)
-            elif site == 'startup':
-                return _search_startup_jobs(portal_configs[site], criteria)
-            elif site == 'job_search':
-                return _search_job_search(portal_configs[site], criteria)
-            elif site == 'internships':
-                return _search_internships(portal_configs[site], criteria)
-            elif site == 'active_jobs':
-                return _search_active_jobs(portal_configs[site], criteria)
-            # New APIs
-            elif site == 'indeed_api':
-                return _search_indeed_api(portal_configs[site], criteria)
-            elif site == 'jobs_api':
-                return _search_jobs_api(portal_configs[site], criteria)
-            elif site == 'linkedin_search':
-                return _search_linkedin_api(portal_configs[site], criteria)
-            elif site == 'linkedin_job':
-                return _search_linkedin_job_api(portal_configs[site], criteria)
-            elif site == 'google_jobs':
-                return _search_google_jobs_api(portal_configs[site], criteria)
-            elif site == 'workday_jobs':
-                return _search_workday_jobs_api(portal_configs[site], criteria)
-            elif site == 'glassdoor_jobs':
-                return _search_glassdoor_jobs_api(portal_configs[site], criteria)
-            elif site == 'startup_jobs':
-                return _search_startup_jobs_api(portal_configs[site], criteria)
-            elif site == 'job_search_api':
-                return _search_job_search_api(portal_configs[site], criteria)
-            elif site == 'hiring_manager':
-                # Special case - hiring manager API doesn't directly search for jobs
-                # It's used to supplement job data with hiring manager information
-                logger.info("Hiring Manager API is used to supplement job information, not for direct job search")
-                hiring_manager_data = _fetch_hiring_manager_info(portal_configs[site])
-                return []
-            else:
-                logger.warning(f"No implementation for {site} API")
-                return []
-        except Exception as e:
-            logger.error(f"Error searching {site} API: {str(e)}")
-            return []
-    else:
+    Concurrent identical queries (same site, normalized criteria and page)
+    share one cache lookup and provider call; every caller gets its own copy
+    of the result.
+    """
+    # Get portal configuration
+    portal_config = Config.get_job_portal_configs().get(site)
+    
+    # Skip web scraping, only use API
+    if not portal_config or not portal_config['enabled']:
         logger.info(f"API not configured for {site}")
         return []
+    
+    if site == 'hiring_manager':
+        # Special case - hiring manager API doesn't directly search for jobs
+        # It's used to supplement job data with hiring manager information, so
+        # just warm the shared cache while the other sites are searched
+        logger.info("Hiring Manager API is used to supplement job information, not for direct job search")
+        get_hiring_manager_index(portal_config)
+        return []
+    
+    provider = get_provider(site)
+    if provider is None:
+        logger.warning(f"No implementation for {site} API")
+        return []
+    
+    def fetch():
+        # Cache hits never reach the provider, so they don't use rate limit tokens
+        # and aren't counted in the provider metrics
+        return observe_call(site, lambda: guarded_call(site, lambda: provider.search(portal_config, criteria, page)))
+    
+    def lookup():
+        search_cache = get_search_cache()
+        if search_cache is None:
+            return fetch()
+        return search_cache.get_or_fetch(site, criteria, fetch, page)
+    
+    try:
+        return _in_flight.do(make_cache_key(site, criteria, page), lookup)
+    except ProviderUnavailableError as e:
+        logger.warning(f"Skipping {site}: {str(e)}")
+        return []
+    except Exception as e:
+        logger.error(f"Error searching {site} API: {str(e)}")
+        return []
 
 
-def _remove_duplicate_jobs(jobs):
-    """Remove duplicate job listings based on title and company"""
-    unique_jobs = []
-    seen_jobs = set()
+def _persist_jobs(jobs):
+    """Save jobs to the canonical job store, tagging each with its job_ref
     
-    for job in jobs:
-        # Create a unique identifier for each job
-        job_key = f"{job['title']}:{job['company']}"
-        
-        if job_key not in seen_jobs:
-            seen_jobs.add(job_key)
-            unique_jobs.append(job)
+    Failures are logged and never fail the search.
+    """
+    if not Config.JOB_STORE_ENABLED or not jobs or not has_app_context():
+        return
+    try:
+        store_jobs(jobs)
+    except Exception as e:
+        logger.error(f"Error storing jobs: {str(e)}")
+
+def _search_local(criteria):
+    """Find stored jobs for the criteria with the full-text index"""
+    if not has_app_context():
+        return []
+    keywords = criteria.get('keywords', [])
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    try:
+        return search_stored_jobs(
+            keywords,
+            location=criteria.get('location'),
+            max_age_days=Config.JOB_STORE_MAX_AGE_DAYS
+        )
+    except Exception as e:
+        logger.error(f"Error searching stored jobs: {str(e)}")
+        return []
+
+def _remove_duplicate_jobs(jobs, dedupe_index=None):
+    """Remove duplicate job listings, including near-duplicates across providers
+    
+    The same posting syndicated through several providers often differs
+    slightly in title, company or description. Listings are grouped by
+    MinHash similarity (see dedupe.NearDuplicateIndex); the richest copy is
+    kept and the others are listed in its other_sources.
     
-    return unique_jobs
+    Args:
+        jobs: list of job listings
+        dedupe_index: optional NearDuplicateIndex, updated in place so
+            de-duplication can continue across batches; only the new
+            postings of this batch are returned
+    """
+    if dedupe_index is None:
+        dedupe_index = NearDuplicateIndex(Config.JOB_DEDUPE_SIMILARITY)
+        for job in jobs:
+            dedupe_index.add(job)
+        return dedupe_index.jobs()
+    
+    return [job for job in jobs if dedupe_index.add(job)]
 
-def _add_match_scores(jobs, criteria):
+def _filter_jobs(jobs, criteria):
+    """Drop jobs outside the posted_within_days and min_salary filters
+    
+    Jobs whose posted date or salary is unknown, or whose pay can't be
+    compared with a yearly minimum (fixed-price budgets), are kept.
+    """
+    max_days = criteria.get('posted_within_days')
+    min_salary = criteria.get('min_salary')
+    if max_days is None and not min_salary:
+        return jobs
+    
+    today = datetime.now(timezone.utc).date()
+    filtered = []
+    for job in jobs:
+        if max_days is not None:
+            days_ago = posted_days_ago(job.get('posted_at'), today)
+            if days_ago is not None and days_ago > max_days:
+                continue
+        if min_salary:
+            annual = annual_salary(job)
+            if annual is not None and annual < min_salary:
+                continue
+        filtered.append(job)
+    return filtered
+
+def _add_match_scores(jobs, criteria, user_preferences=None):
     """Add match scores to jobs based on user preferences"""
     keywords = criteria.get('keywords', [])
     
     # Get user preferences if available
-    user_preferences = _get_user_preferences()
+    if user_preferences is None:
+        user_preferences = get_user_preferences()
     
-    for job in jobs:
-        score, reasons = _calculate_match_score(job, keywords, user_preferences)
+    scored = score_jobs(jobs, keywords, user_preferences)
+    for job, (score, reasons) in zip(jobs, scored):
         job['match_score'] = score
         job['match_reasons'] = reasons
+    record_match_scores(jobs, [score for score, _ in scored])
     
     return jobs
 
-def _get_user_preferences():
-    """Get the current user's job preferences"""
-    if current_user and current_user.is_authenticated:
-        return {
-            'job_titles': current_user.get_job_titles_list(),
-            'min_salary': current_user.min_salary,
-            'max_commute_distance': current_user.max_commute_distance,
-            'preferred_locations': current_user.get_preferred_locations_list(),
-            'remote_only': current_user.remote_only
-        }
-    return None
-
-def _calculate_match_score(job, keywords, user_preferences=None):
-    """Calculate a match score (0-100) for a job based on keywords and user preferences"""
-    score = 0
-    reasons = []
-    
-    # Basic keyword matching
-    keyword_title_matches = 0
-    for keyword in keywords:
-        if keyword.lower() in job['title'].lower():
-            keyword_title_matches += 1
-            
-    if keyword_title_matches > 0:
-        title_score = min(40, 20 + (keyword_title_matches * 5))
-        score += title_score
-        reasons.append(f"Title matches {keyword_title_matches} keyword(s): +{title_score} points")
-    
-    # Description keyword matching
-    keyword_desc_matches = 0
-    for keyword in keywords:
-        if keyword.lower() in job['description'].lower():
-            keyword_desc_matches += 1
-            
-    if keyword_desc_matches > 0:
-        desc_score = min(20, keyword_desc_matches * 3)
-        score += desc_score
-        reasons.append(f"Description matches {keyword_desc_matches} keyword(s): +{desc_score} points")
+def _select_top_jobs(jobs, criteria, limit, offset=0, user_preferences=None, record_scores=True):
+    """Pick one page of the best matching jobs without sorting all of them
     
-    # Recency bonus
-    recency_score = 0
-    try:
-        if 'Today' in job['posted_date'] or 'today' in job['posted_date'].lower():
-            recency_score = 15
-            reasons.append("Job posted today: +15 points")
-        elif 'Yesterday' in job['posted_date'] or 'yesterday' in job['posted_date'].lower():
-            recency_score = 10
-            reasons.append("Job posted yesterday: +10 points")
-        else:
-            days_text = job['posted_date'].split()[0]
-            if days_text.isdigit():
-                days_ago = int(days_text)
-                if days_ago <= 7:
-                    recency_score = max(0, 10 - days_ago)
-                    reasons.append(f"Job posted {days_ago} days ago: +{recency_score} points")
-    except (ValueError, IndexError, AttributeError):
-        pass
-        
-    score += recency_score
+    Every job is scored, but only the top offset+limit are selected (heap
+    selection, same order as a stable sort) and only the returned page gets
+    match reasons built. Scores go to the provider metrics only when
+    record_scores is set, so paging doesn't count the same jobs again.
     
-    # If user preferences are available, incorporate them
-    if user_preferences:
-        # Location matching
-        location_score = 0
-        is_remote = 'remote' in job['location'].lower()
-        
-        if user_preferences['remote_only'] and is_remote:
-            location_score = 15
-            reasons.append("Remote job matches preference: +15 points")
-        elif not user_preferences['remote_only']:
-            # Check preferred locations
-            if user_preferences['preferred_locations']:
-                for location in user_preferences['preferred_locations']:
-                    if location.lower() in job['location'].lower():
-                        location_score = 15
-                        reasons.append(f"Location {location} matches preference: +15 points")
-                        break
-        
-        score += location_score
-        
-        # Salary matching
-        if user_preferences['min_salary'] and 'salary' in job and job['salary']:
-            # Extract salary from text with simple heuristics
-            try:
-                salary_text = job['salary'].lower()
-                # Try to find numbers in the text
-                numbers = []
-                for word in salary_text.replace('$', ' ').replace(',', '').replace('k', '000 ').split():
-                    if word.isdigit():
-                        numbers.append(int(word))
-                    elif word.replace('.', '').isdigit():
-                        numbers.append(float(word))
-                
-                if numbers:
-                    # Use the largest number as an approximation
-                    if max(numbers) >= user_preferences['min_salary']:
-                        salary_score = 10
-                        reasons.append(f"Salary meets minimum requirement: +10 points")
-                        score += salary_score
-            except Exception as e:
-                logger.error(f"Error parsing salary: {str(e)}")
+    Returns:
+        list: Jobs ranked offset..offset+limit, with match scores and reasons
+    """
+    if user_preferences is None:
+        user_preferences = get_user_preferences()
     
-    # Ensure score is within 0-100
-    score = max(0, min(100, score))
+    factors = evaluate_jobs(jobs, criteria.get('keywords', []), user_preferences)
+    scores = [job_factors.score() for job_factors in factors]
+    if record_scores:
+        record_match_scores(jobs, scores)
+    top = heapq.nlargest(offset + limit, range(len(jobs)), key=scores.__getitem__)
     
-    return score, reasons
+    page = []
+    for index in top[offset:]:
+        job = jobs[index]
+        job['match_score'] = scores[index]
+        job['match_reasons'] = factors[index].reasons()
+        page.append(job)
+    return page
 
+def query_fingerprint(criteria):
+    """Hash of the criteria that decide which jobs a search returns
+    
+    Keywords, location, job type, sites and filters are normalized, so
+    equivalent searches by different users share a fingerprint.
+    """
+    query = normalize_criteria(criteria)
+    query['sites'] = sorted(site.lower() for site in criteria.get('sites') or [])
+    for field in ('posted_within_days', 'min_salary'):
+        if criteria.get(field) is not None:
+            query[field] = criteria[field]
+    return hashlib.sha1(json.dumps(query, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _encode_cursor(offset, criteria):
+    """Build the opaque cursor for the page starting at offset"""
+    payload = json.dumps({'offset': offset, 'query': query_fingerprint(criteria)[:12]})
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+def _decode_cursor(cursor, criteria):
+    """Get the offset from a cursor, checking it belongs to the same search
+    
+    Raises:
+        ValueError: if the cursor is malformed or from a different search
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        offset = int(payload['offset'])
+        query = payload['query']
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if query != query_fingerprint(criteria)[:12] or offset < 0:
+        raise ValueError("Cursor does not match this search")
+    return offset
+
+def get_user_preferences(user=None):
+    """Get a user's job preferences (the current user by default)"""
+    if user is None and current_user and current_user.is_authenticated:
+        user = current_user
+    if user is not None:
+        return {
+            'job_titles': user.get_job_titles_list(),
+            'min_salary': user.min_salary,
+            'max_commute_distance': user.max_commute_distance,
+            'preferred_locations': user.get_preferred_locations_list(),
+            'remote_only': user.remote_only
+        }
+    return None
@@ -0,0 +1,76 @@
+import copy
+import threading
+
+class _Call:
+    """One in-flight call and the threads waiting for it"""
+
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait and receive the same result (or exception). Results are
+    deep-copied for every caller when shared, since job dicts get mutated by
+    scoring and enrichment afterwards.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, copy_result=True):
+        """Run fn for key, or wait for the identical call already in flight
+
+        Args:
+            key: Hashable key identifying identical calls
+            fn: Callable with no arguments
+            copy_result: Deep-copy a shared result for each caller; pass
+                False when callers only read it
+
+        Returns:
+            The result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result) if copy_result else call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.event.set()
+
+        # Waiters copy the result, so the leader must not hand out the original
+        return copy.deepcopy(call.result) if shared and copy_result else call.result
+
+    def stats(self):
+        """Get the number of executed and coalesced calls, and calls in flight"""
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
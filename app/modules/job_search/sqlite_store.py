@@ -0,0 +1,39 @@
+import os
+import sqlite3
+import threading
+
+# Per-thread connections, keyed by database path
+_local = threading.local()
+
+def get_connection(path):
+    """Get a SQLite connection for the current thread and process
+
+    The same file can be opened by every gunicorn worker, which makes it a
+    cheap way to share small pieces of state (caches, breaker state) between
+    processes on one host. Connections use WAL mode and autocommit so readers
+    never block writers.
+
+    Args:
+        path: Path to the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Open connection
+    """
+    pid = os.getpid()
+    connections = getattr(_local, 'connections', None)
+    if connections is None or getattr(_local, 'pid', None) != pid:
+        # Never reuse a connection inherited across a fork
+        connections = {}
+        _local.connections = connections
+        _local.pid = pid
+
+    conn = connections.get(path)
+    if conn is None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        connections[path] = conn
+    return conn
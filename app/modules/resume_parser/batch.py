@@ -0,0 +1,445 @@
+import io
+import os
+import json
+import time
+import uuid
+import shutil
+import socket
+import logging
+import zipfile
+import datetime
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from flask import current_app
+from sqlalchemy import func
+from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
+from app.config import Config
+from app.models import db, ResumeBatch, ResumeBatchItem, add_missing_columns
+from app.modules.resume_parser import parser
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+# Batch statuses that still have a worker parsing them
+ACTIVE_STATUSES = ('queued', 'running')
+
+# Columns added after the tables were first created (Migration 8 in app/migrate.py for SQLite)
+_ADDED_COLUMNS = (
+    (ResumeBatch, ('owner', 'updated_at')),
+    (ResumeBatchItem, ('source_path', 'source_member'))
+)
+
+_ready_engines = set()
+_ready_lock = threading.Lock()
+
+# Threads running batches, and the processes they parse resumes in (both created lazily per process)
+_batch_executor = None
+_parse_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+# This process's owner token and the batches it owns, kept alive by a heartbeat thread
+_owner = None
+_owner_pid = None
+_owned_batches = set()
+_heartbeat_pid = None
+_owner_lock = threading.Lock()
+
+def ensure_resume_batch_tables():
+    """Create the resume batch tables if missing"""
+    engine = db.engine
+    if engine.url in _ready_engines:
+        return
+    with _ready_lock:
+        if engine.url in _ready_engines:
+            return
+        for model in (ResumeBatch, ResumeBatchItem):
+            model.__table__.create(engine, checkfirst=True)
+        for model, names in _ADDED_COLUMNS:
+            add_missing_columns(model, names)
+        _ready_engines.add(engine.url)
+
+def create_batch(user_id, files):
+    """Save uploaded resumes and queue them for parsing in the background
+
+    Each upload may be a PDF, a DOCX or a zip of them. Uploads are saved to
+    RESUME_BATCH_DIR and zips are not extracted: their members are read one
+    at a time when parsed. Files that can't be parsed (wrong format, larger
+    than RESUME_BATCH_MAX_FILE_BYTES) fail on their own without failing the
+    batch; zip members that aren't resumes are skipped.
+
+    The batch is owned and parsed by this web worker. If the worker stops
+    first, the next poll of the batch recovers it (see recover_stale_batch).
+
+    Args:
+        user_id: ID of the user the batch belongs to
+        files: list of uploaded files from request.files
+
+    Returns:
+        ResumeBatch: The queued batch
+
+    Raises:
+        ValueError: If the upload has no resumes or more than RESUME_BATCH_MAX_FILES
+    """
+    ensure_resume_batch_tables()
+    batch = ResumeBatch(user_id=user_id, owner=_owner_token())
+    db.session.add(batch)
+    db.session.flush()
+
+    batch_dir = os.path.join(Config.RESUME_BATCH_DIR, batch.id)
+    os.makedirs(batch_dir, exist_ok=True)
+    try:
+        items = _save_uploads(batch, files, batch_dir)
+        if not items:
+            raise ValueError('No PDF or DOCX resumes found in the upload')
+        if len(items) > Config.RESUME_BATCH_MAX_FILES:
+            raise ValueError(f'Too many resumes in one batch ({len(items)}, the limit is {Config.RESUME_BATCH_MAX_FILES})')
+
+        batch.total = len(items)
+        batch.processed = batch.failed = sum(1 for item in items if item.status == 'failed')
+        queued = batch.processed < batch.total
+        if not queued:
+            batch.status = 'completed'
+            batch.finished_at = datetime.datetime.utcnow()
+        db.session.add_all(items)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        shutil.rmtree(batch_dir, ignore_errors=True)
+        raise
+
+    if queued:
+        _submit_batch(current_app._get_current_object(), batch.id)
+    else:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+    logger.info(f"Queued resume batch {batch.id} with {batch.total} resumes ({batch.failed} rejected)")
+    return batch
+
+def _save_uploads(batch, files, batch_dir):
+    """Save uploads to disk and list the resumes in them
+
+    Returns:
+        list: ResumeBatchItem rows, queued ones pointing at their saved upload
+    """
+    items = []
+
+    def add_item(filename, error=None, path=None, member=None):
+        item = ResumeBatchItem(id=str(uuid.uuid4()), batch_id=batch.id, position=len(items), filename=filename[:512],
+                               source_path=path, source_member=member)
+        if error:
+            item.status = 'failed'
+            item.error = error
+        items.append(item)
+        return item
+
+    for index, file in enumerate(files):
+        filename = secure_filename(file.filename) or f'upload-{index}'
+        file_ext = os.path.splitext(filename)[1].lower()
+        if file_ext != '.zip' and file_ext not in RESUME_EXTENSIONS:
+            add_item(file.filename, f'Unsupported file format: {file_ext}')
+            continue
+
+        # Werkzeug has already spooled the upload to a temporary file; this copies it in chunks
+        path = os.path.join(batch_dir, f'{index}-{filename}')
+        file.save(path)
+
+        if file_ext != '.zip':
+            if os.path.getsize(path) > Config.RESUME_BATCH_MAX_FILE_BYTES:
+                add_item(file.filename, 'File is too large')
+                os.remove(path)
+            else:
+                add_item(file.filename, path=path)
+            continue
+
+        try:
+            with zipfile.ZipFile(path) as archive:
+                members = archive.infolist()
+        except zipfile.BadZipFile:
+            add_item(file.filename, 'Not a valid zip file')
+            continue
+        for member in members:
+            basename = os.path.basename(member.filename)
+            if (member.is_dir() or member.filename.startswith('__MACOSX/') or basename.startswith('.')
+                    or os.path.splitext(basename)[1].lower() not in RESUME_EXTENSIONS):
+                continue
+            if len(items) > Config.RESUME_BATCH_MAX_FILES:
+                # Already over the limit; stop listing members of huge archives
+                break
+            if member.file_size > Config.RESUME_BATCH_MAX_FILE_BYTES:
+                add_item(member.filename, 'File is too large')
+            else:
+                add_item(member.filename, path=path, member=member.filename)
+    return items
+
+def _get_batch_executor():
+    _ensure_executors()
+    return _batch_executor
+
+def _get_parse_executor():
+    _ensure_executors()
+    return _parse_executor
+
+def _ensure_executors():
+    """Create this process's batch threads and parser processes (never shared across a fork)"""
+    global _batch_executor, _parse_executor, _executor_pid
+    pid = os.getpid()
+    if _executor_pid == pid and _parse_executor is not None:
+        return
+    with _executor_lock:
+        if _executor_pid != pid:
+            _batch_executor = ThreadPoolExecutor(max_workers=Config.RESUME_BATCH_CONCURRENCY,
+                                                 thread_name_prefix='resume-batch')
+            _parse_executor = None
+            _executor_pid = pid
+        if _parse_executor is None:
+            # Forking a multi-threaded web worker can deadlock, so parsers
+            # start from a clean server process instead
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _parse_executor = ProcessPoolExecutor(max_workers=Config.RESUME_BATCH_WORKERS, mp_context=context,
+                                                  initializer=_init_parse_worker)
+
+def _owner_token():
+    """Get the token marking batches owned by this process (the random part tells reused pids apart)"""
+    global _owner, _owner_pid
+    pid = os.getpid()
+    with _owner_lock:
+        if _owner_pid != pid:
+            _owner = f'{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}'[:128]
+            _owner_pid = pid
+        return _owner
+
+def _submit_batch(app, batch_id):
+    """Queue a batch this process owns, keeping up its heartbeat until it's done"""
+    global _heartbeat_pid
+    pid = os.getpid()
+    with _owner_lock:
+        if _heartbeat_pid != pid:
+            # Batches listed before a fork belong to the parent
+            _owned_batches.clear()
+            threading.Thread(target=_heartbeat, args=(app,), name='resume-batch-heartbeat', daemon=True).start()
+            _heartbeat_pid = pid
+        _owned_batches.add(batch_id)
+    _get_batch_executor().submit(_run_batch, app, batch_id)
+
+def _heartbeat(app):
+    """Bump updated_at of the batches this process owns, queued or running (runs in a daemon thread)
+
+    Batches waiting behind others in the batch threads make no progress of
+    their own; the heartbeat tells pollers their owner is still alive.
+    """
+    interval = max(1, Config.RESUME_BATCH_STALE_SECONDS / 4)
+    while True:
+        time.sleep(interval)
+        with _owner_lock:
+            batch_ids = list(_owned_batches)
+        if not batch_ids:
+            continue
+        with app.app_context():
+            try:
+                ResumeBatch.query.filter(ResumeBatch.id.in_(batch_ids), ResumeBatch.owner == _owner_token()).update(
+                    {'updated_at': datetime.datetime.utcnow()}, synchronize_session=False)
+                db.session.commit()
+            except Exception as e:
+                logger.warning(f"Resume batch heartbeat failed: {str(e)}")
+                db.session.rollback()
+            finally:
+                db.session.remove()
+
+def _run_batch(app, batch_id):
+    """Parse a batch's queued resumes, recording each result as it finishes (runs in a batch thread)"""
+    with app.app_context():
+        try:
+            _parse_batch(batch_id)
+        except Exception as e:
+            logger.error(f"Resume batch {batch_id} failed: {str(e)}")
+            db.session.rollback()
+            _fail_batch(batch_id, str(e))
+        finally:
+            with _owner_lock:
+                _owned_batches.discard(batch_id)
+            db.session.remove()
+
+def _parse_batch(batch_id):
+    """Parse a batch's queued resumes in the process pool, a few at a time
+
+    At most two resumes per parser process are in flight, so neither the
+    queue nor the finished-but-unrecorded results grow with the batch.
+    Results are only recorded for resumes still queued, so a batch that was
+    recovered while this worker was still on it isn't counted twice.
+    """
+    global _parse_executor
+    now = datetime.datetime.utcnow()
+    started = ResumeBatch.query.filter(
+        ResumeBatch.id == batch_id, ResumeBatch.owner == _owner_token(), ResumeBatch.status.in_(ACTIVE_STATUSES)
+    ).update({
+        'status': 'running',
+        'started_at': func.coalesce(ResumeBatch.started_at, now),
+        'updated_at': now
+    }, synchronize_session=False) == 1
+    db.session.commit()
+    if not started:
+        # Recovered by another worker or failed while it waited in the queue
+        return
+
+    sources = iter(db.session.query(
+        ResumeBatchItem.id, ResumeBatchItem.source_path, ResumeBatchItem.source_member, ResumeBatchItem.filename
+    ).filter_by(batch_id=batch_id, status='queued').order_by(ResumeBatchItem.position).all())
+
+    window = max(1, Config.RESUME_BATCH_WORKERS * 2)
+    pending = {}
+    while True:
+        for item_id, path, member, filename in sources:
+            pending[_get_parse_executor().submit(_parse_source, path, member, filename)] = item_id
+            if len(pending) >= window:
+                break
+        if not pending:
+            break
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item_id = pending.pop(future)
+            values = {'status': 'parsed', 'parsed_at': datetime.datetime.utcnow()}
+            try:
+                values['result'] = json.dumps(future.result())
+            except BrokenProcessPool:
+                # A crashed parser breaks the whole pool: the resumes in flight fail, the rest get a new pool
+                with _executor_lock:
+                    _parse_executor = None
+                values.update(status='failed', error='Parser process crashed')
+            except Exception as e:
+                values.update(status='failed', error=str(e))
+            _record_item(batch_id, item_id, values)
+        db.session.commit()
+
+    _finish_batch(batch_id)
+
+def _record_item(batch_id, item_id, values):
+    """Store a queued resume's result and count it as processed"""
+    recorded = ResumeBatchItem.query.filter_by(id=item_id, status='queued').update(
+        values, synchronize_session=False) == 1
+    counts = {'updated_at': datetime.datetime.utcnow()}
+    if recorded:
+        counts['processed'] = ResumeBatch.processed + 1
+        if values['status'] == 'failed':
+            counts['failed'] = ResumeBatch.failed + 1
+    ResumeBatch.query.filter_by(id=batch_id).update(counts, synchronize_session=False)
+
+def _finish_batch(batch_id):
+    """Mark a running batch completed once no resumes are queued, and remove its uploads"""
+    if ResumeBatchItem.query.filter_by(batch_id=batch_id, status='queued').count():
+        return
+    now = datetime.datetime.utcnow()
+    # Conditional, so a batch failed in the meantime stays failed
+    finished = ResumeBatch.query.filter_by(id=batch_id, status='running').update(
+        {'status': 'completed', 'finished_at': now, 'updated_at': now}, synchronize_session=False) == 1
+    db.session.commit()
+    if finished:
+        batch = db.session.get(ResumeBatch, batch_id)
+        logger.info(f"Resume batch {batch_id} completed: {batch.processed - batch.failed} parsed, {batch.failed} failed")
+    shutil.rmtree(os.path.join(Config.RESUME_BATCH_DIR, batch_id), ignore_errors=True)
+
+def _fail_batch(batch_id, error):
+    """Fail a queued or running batch and its remaining resumes, and remove its uploads"""
+    now = datetime.datetime.utcnow()
+    failed = ResumeBatch.query.filter(ResumeBatch.id == batch_id, ResumeBatch.status.in_(ACTIVE_STATUSES)).update(
+        {'status': 'failed', 'error': error, 'finished_at': now, 'updated_at': now}, synchronize_session=False) == 1
+    if failed:
+        remaining = ResumeBatchItem.query.filter_by(batch_id=batch_id, status='queued').update(
+            {'status': 'failed', 'error': error, 'parsed_at': now}, synchronize_session=False)
+        ResumeBatch.query.filter_by(id=batch_id).update({
+            'processed': ResumeBatch.processed + remaining,
+            'failed': ResumeBatch.failed + remaining
+        }, synchronize_session=False)
+    db.session.commit()
+    shutil.rmtree(os.path.join(Config.RESUME_BATCH_DIR, batch_id), ignore_errors=True)
+
+def recover_stale_batch(batch):
+    """Requeue or fail a batch whose owner stopped, going by its heartbeat
+
+    A batch is parsed by the web worker that accepted it, which bumps its
+    updated_at while it is queued or running. If that worker is restarted
+    or recycled the heartbeat stops, and after RESUME_BATCH_STALE_SECONDS
+    the batch is taken over: its uploads are only on the owner's host, so
+    when they are here the remaining resumes are requeued in this worker,
+    otherwise they fail. Only one of the workers polling a stale batch
+    takes it over.
+
+    Args:
+        batch: ResumeBatch
+
+    Returns:
+        ResumeBatch: The batch, refreshed if it was recovered
+    """
+    if batch.status not in ACTIVE_STATUSES:
+        return batch
+    now = datetime.datetime.utcnow()
+    last_heartbeat = batch.updated_at
+    if last_heartbeat and now - last_heartbeat < datetime.timedelta(seconds=Config.RESUME_BATCH_STALE_SECONDS):
+        return batch
+
+    # Batches from before the heartbeat have no updated_at
+    unchanged = (ResumeBatch.updated_at == last_heartbeat if last_heartbeat is not None
+                 else ResumeBatch.updated_at.is_(None))
+    uploads_here = os.path.isdir(os.path.join(Config.RESUME_BATCH_DIR, batch.id))
+    previous_owner = batch.owner
+    claim = {'owner': _owner_token(), 'updated_at': now}
+    if uploads_here:
+        claim['status'] = 'queued'
+    claimed = ResumeBatch.query.filter(
+        ResumeBatch.id == batch.id, ResumeBatch.status.in_(ACTIVE_STATUSES), unchanged
+    ).update(claim, synchronize_session=False) == 1
+    db.session.commit()
+    if claimed:
+        if uploads_here:
+            logger.warning(f"Resume batch {batch.id} lost its worker ({previous_owner}), requeueing it")
+            _submit_batch(current_app._get_current_object(), batch.id)
+        else:
+            logger.warning(f"Resume batch {batch.id} lost its worker ({previous_owner}) and its uploads are gone")
+            _fail_batch(batch.id, 'Stopped before all resumes were parsed; please upload them again')
+    db.session.refresh(batch)
+    return batch
+
+def _init_parse_worker():
+    # Batch parsers already use every worker process; long PDFs are extracted in order
+    Config.RESUME_PDF_WORKERS = 1
+
+def _parse_source(path, member, filename):
+    """Parse a saved upload or one member of a saved zip (runs in a parser process)"""
+    if member is None:
+        with open(path, 'rb') as stream:
+            return parser.parse_resume(FileStorage(stream, filename=filename))
+    with zipfile.ZipFile(path) as archive:
+        # Reading stops at the member's listed size, which was checked against the limit
+        data = archive.read(member)
+    return parser.parse_resume(FileStorage(io.BytesIO(data), filename=filename))
+
+def batch_to_dict(batch):
+    """Get a batch's progress as a dict"""
+    return {
+        'id': batch.id,
+        'status': batch.status,
+        'total': batch.total,
+        'processed': batch.processed,
+        'failed': batch.failed,
+        'progress': round(100 * batch.processed / batch.total) if batch.total else 100,
+        'error': batch.error,
+        'created_at': batch.created_at.isoformat() if batch.created_at else None,
+        'started_at': batch.started_at.isoformat() if batch.started_at else None,
+        'finished_at': batch.finished_at.isoformat() if batch.finished_at else None
+    }
+
+def item_to_dict(item):
+    """Get a batch item's status and parsed resume as a dict"""
+    return {
+        'position': item.position,
+        'filename': item.filename,
+        'status': item.status,
+        'error': item.error,
+        'data': json.loads(item.result) if item.result else None
+    }
@@ -0,0 +1,65 @@
+import json
+import time
+import logging
+from app.config import Config
+from app.modules.job_search.sqlite_store import get_connection
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+_initialized_paths = set()
+
+def _connection():
+    """Get the shared parse cache, creating its table on first use"""
+    path = Config.RESUME_PARSE_CACHE_PATH
+    conn = get_connection(path)
+    if path not in _initialized_paths:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS resume_parse_cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+            'stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS ix_resume_parse_cache_accessed ON resume_parse_cache (accessed_at)')
+        _initialized_paths.add(path)
+    return conn
+
+def make_key(digest, file_ext, parser_version):
+    """Build the cache key for a file's content, format and parser version"""
+    return f"{parser_version}:{file_ext}:{digest}"
+
+def get(key):
+    """Get a cached parse result, or None
+
+    Every call returns a new copy, so callers may modify it.
+    """
+    if not Config.RESUME_PARSE_CACHE_ENABLED:
+        return None
+    try:
+        conn = _connection()
+        row = conn.execute('SELECT value FROM resume_parse_cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        conn.execute('UPDATE resume_parse_cache SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        return json.loads(row[0])
+    except Exception as e:
+        logger.error(f"Resume parse cache read error: {str(e)}")
+        return None
+
+def put(key, parsed_data):
+    """Cache a parse result, evicting the least recently used beyond the size bound"""
+    if not Config.RESUME_PARSE_CACHE_ENABLED:
+        return
+    try:
+        now = time.time()
+        conn = _connection()
+        conn.execute(
+            'INSERT OR REPLACE INTO resume_parse_cache (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)',
+            (key, json.dumps(parsed_data), now, now)
+        )
+        conn.execute(
+            'DELETE FROM resume_parse_cache WHERE key IN ('
+            'SELECT key FROM resume_parse_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+            (Config.RESUME_PARSE_CACHE_MAX_ENTRIES,)
+        )
+    except Exception as e:
+        logger.error(f"Resume parse cache write error: {str(e)}")
@@ -1,22 +1,162 @@
+import io
 import os
 import PyPDF2
 import docx
 import re
 import json
+import mmap
+import hashlib
+import logging
+import tempfile
+import zipfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from werkzeug.utils import secure_filename
+from app.config import Config
+from app.modules.resume_parser import parse_cache
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Bump whenever a change here alters the parsed output, so cached results are not reused
+PARSER_VERSION = '3'
+
+# Uploads are copied (and hashed) in chunks of this many bytes
+_SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# Numbered list items such as "1." or "12."
+_NUMBERED_BULLET = re.compile(r'^\s*\d+\.')
+
+# Section headers, by kind. A header starts a line and may be qualified by
+# one of _SECTION_QUALIFIERS ("Professional Experience"). Upper case headers
+# may be followed by text on the same line; title case ones must end the line
+# or be followed by a colon ("Skills: Python, SQL"), so "Experience with
+# Python" in a sentence isn't a header. Text after the header on its line is
+# the first line of the section.
+_SECTION_MARKERS = {
+    'education': ('EDUCATION', 'ACADEMIC BACKGROUND'),
+    'experience': ('WORK EXPERIENCE', 'EXPERIENCE', 'WORK HISTORY', 'EMPLOYMENT'),
+    'skills': ('TECHNICAL SKILLS', 'SKILLS'),
+    # Other sections only mark where the sections above end
+    'other': ('SUMMARY', 'OBJECTIVE', 'PROJECTS', 'CERTIFICATIONS', 'AWARDS', 'PUBLICATIONS',
+              'LANGUAGES', 'INTERESTS', 'REFERENCES', 'VOLUNTEER EXPERIENCE')
+}
+
+_SECTION_QUALIFIERS = ('PROFESSIONAL', 'RELEVANT', 'WORK', 'TECHNICAL', 'CORE', 'KEY', 'ACADEMIC',
+                       'CAREER', 'EMPLOYMENT', 'ADDITIONAL')
+
+def _header_pattern(kind, markers):
+    upper = '|'.join(re.escape(marker) for marker in markers)
+    title = '|'.join(re.escape(marker.title()) for marker in markers)
+    upper_qualifier = '|'.join(_SECTION_QUALIFIERS)
+    title_qualifier = '|'.join(qualifier.title() for qualifier in _SECTION_QUALIFIERS)
+    return (rf'(?P<{kind}>(?:(?:{upper_qualifier})[ \t]+)?(?:{upper})\b'
+            rf'|(?:(?:{title_qualifier})[ \t]+)?(?:{title})(?=[ \t]*(?::|$)))')
+
+# 'other' is tried first so "VOLUNTEER EXPERIENCE" isn't read as experience
+_SECTION_HEADER = re.compile(
+    r'^[ \t]*(?:' + '|'.join(
+        _header_pattern(kind, _SECTION_MARKERS[kind]) for kind in ('other', 'education', 'experience', 'skills')
+    ) + r')[ \t]*:?',
+    re.MULTILINE
+)
+
+# Matches only start where a match can start (a word's first character; a '+',
+# '(' or digit), so a search doesn't re-scan every suffix of every word
+_EMAIL = re.compile(r'(?<![\w.-])[\w.-]+@[\w.-]+\.[a-zA-Z]{2,}')
+_PHONE = re.compile(r'(?=[+(\d])(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+_DEGREE = re.compile(r'Bachelor|Master|Ph\.D|MBA|B\.S\.|M\.S\.|B\.A\.|M\.A\.')
+_EXPERIENCE_DATE = re.compile(r'(\b\d{1,2}/\d{1,2}\b|\b\d{4}\b|\bPresent\b|\bCurrent\b)')
+
+# Skills looked for when the skills section isn't a bulleted or comma separated list
+_COMMON_SKILLS = ['Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'Excel',
+                  'Word', 'PowerPoint', 'Communication', 'Leadership', 'Project Management',
+                  'Agile', 'Scrum', 'Marketing', 'Sales', 'Customer Service', 'HTML', 'CSS',
+                  'Machine Learning', 'Data Analysis', 'Statistics', 'Research', 'Writing']
+
+# Process pool for extracting long PDFs (created lazily per process)
+_pdf_executor = None
+_pdf_executor_pid = None
+_pdf_executor_lock = threading.Lock()
+
+class ResumeTooLargeError(ValueError):
+    """Raised when a resume is over the configured size or page limit"""
 
 def parse_resume(file):
     """Extract information from a resume file (PDF or DOCX)
     
+    The upload is first copied to memory, or to a temporary file once it is
+    over RESUME_SPOOL_MAX_MEMORY_BYTES, and rejected as soon as it is over
+    RESUME_MAX_UPLOAD_BYTES. PDFs over RESUME_MAX_PAGES pages are rejected
+    before any text is extracted.
+    
+    Results are cached by the SHA-256 of the file's bytes and PARSER_VERSION,
+    so re-uploading the same file skips text extraction and parsing.
+    
     Args:
         file: A file object from request.files
         
     Returns:
         dict: Structured resume data
+        
+    Raises:
+        ResumeTooLargeError: If the file is over a size or page limit
     """
     filename = secure_filename(file.filename)
     file_ext = os.path.splitext(filename)[1].lower()
+    if file_ext not in ('.pdf', '.docx'):
+        raise ValueError(f'Unsupported file format: {file_ext}')
     
+    spool, digest = _spool_upload(file)
+    try:
+        cache_key = parse_cache.make_key(digest, file_ext, PARSER_VERSION)
+        parsed_data = parse_cache.get(cache_key)
+        if parsed_data is not None:
+            logger.info(f"Resume parse cache hit for {filename}")
+            return parsed_data
+        
+        parsed_data = _parse_file(spool, file_ext)
+    finally:
+        spool.close()
+    parse_cache.put(cache_key, parsed_data)
+    return parsed_data
+
+def _spool_upload(file):
+    """Copy an upload to memory, or to a temporary file past RESUME_SPOOL_MAX_MEMORY_BYTES
+    
+    Copying stops as soon as the upload is over RESUME_MAX_UPLOAD_BYTES, so
+    an oversized upload is never read in full.
+    
+    Returns:
+        tuple: (rewound io.BytesIO or named temporary file, SHA-256 hex digest of the bytes)
+    """
+    spool = io.BytesIO()
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        file.seek(0)
+        for chunk in iter(lambda: file.read(_SPOOL_CHUNK_SIZE), b''):
+            size += len(chunk)
+            if size > Config.RESUME_MAX_UPLOAD_BYTES:
+                raise ResumeTooLargeError(f'File is too large (the limit is {Config.RESUME_MAX_UPLOAD_BYTES} bytes)')
+            if isinstance(spool, io.BytesIO) and size > Config.RESUME_SPOOL_MAX_MEMORY_BYTES:
+                # Named, so parallel PDF workers can map the same file
+                spilled = tempfile.NamedTemporaryFile(prefix='resume-', dir=Config.RESUME_SPOOL_DIR or None)
+                spilled.write(spool.getbuffer())
+                spool = spilled
+            spool.write(chunk)
+            digest.update(chunk)
+        spool.flush()
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    return spool, digest.hexdigest()
+
+def _parse_file(file, file_ext):
+    """Extract the text of a PDF or DOCX file and parse it"""
     if file_ext == '.pdf':
         text, formatted_text = _extract_text_from_pdf(file)
     elif file_ext == '.docx':
@@ -36,81 +176,173 @@ def parse_resume(file):
 def _extract_text_from_pdf(file):
     """Extract text from a PDF file
     
+    A PDF spooled to disk is memory-mapped, so its bytes are paged in by the
+    OS as the reader needs them rather than copied into the worker. Long
+    PDFs (at least RESUME_PDF_PARALLEL_MIN_PAGES pages) are split into page
+    ranges that are extracted and structured in a process pool.
+    
+    Args:
+        file: io.BytesIO or named temporary file from _spool_upload
+    
     Returns:
         tuple: (plain text, formatted text with preserved structure)
     """
-    reader = PyPDF2.PdfReader(file)
-    plain_text = ''
+    if isinstance(file, io.BytesIO):
+        pages = _extract_pdf_pages(file, file.getvalue)
+    else:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            pages = _extract_pdf_pages(mapped, lambda: file.name)
+    
     formatted_text = []
+    for _, page_sections in pages:
+        formatted_text.extend(page_sections)
+    return ''.join(page_text for page_text, _ in pages), formatted_text
+
+def _extract_pdf_pages(stream, pdf_source):
+    """Extract and structure a PDF's pages, checking the page limit first
     
-    for page in reader.pages:
-        page_text = page.extract_text()
-        plain_text += page_text
-        
-        # Process text to preserve structure
-        page_sections = []
-        current_section = []
-        for line in page_text.split('\n'):
-            # Detect if line is a bullet point
-            is_bullet = line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*')
-            is_bullet = is_bullet or re.match(r'^\s*\d+\.', line.strip()) is not None  # Numbered bullets
-            
-            # If empty line, start a new paragraph
-            if not line.strip():
-                if current_section:
-                    page_sections.append({
-                        'type': 'paragraph',
-                        'content': '\n'.join(current_section)
-                    })
-                    current_section = []
-            # If bullet point, add as a list item
-            elif is_bullet:
-                # If we were in a paragraph, finish it
-                if current_section and not current_section[0].strip().startswith(('•', '-', '*')) and not re.match(r'^\s*\d+\.', current_section[0].strip()):
-                    page_sections.append({
-                        'type': 'paragraph',
-                        'content': '\n'.join(current_section)
-                    })
-                    current_section = []
-                    
-                # Start a new bullet point or add to existing bullet list
-                if not current_section:
-                    current_section.append(line)
-                elif current_section[0].strip().startswith(('•', '-', '*')) or re.match(r'^\s*\d+\.', current_section[0].strip()):
-                    current_section.append(line)
-                else:
-                    page_sections.append({
-                        'type': 'paragraph',
-                        'content': '\n'.join(current_section)
-                    })
-                    current_section = [line]
-            else:
-                # Regular paragraph line
-                current_section.append(line)
-                
-        # Add any remaining content
-        if current_section:
-            if current_section[0].strip().startswith(('•', '-', '*')) or re.match(r'^\s*\d+\.', current_section[0].strip()):
+    Args:
+        stream: Seekable stream (or mmap) of the PDF
+        pdf_source: Callable returning the PDF's bytes or path for pool workers
+    
+    Returns:
+        list: (page text, page sections) for every page, in order
+    """
+    reader = PyPDF2.PdfReader(stream)
+    page_count = len(reader.pages)
+    if page_count > Config.RESUME_MAX_PAGES:
+        raise ResumeTooLargeError(f'PDF has too many pages ({page_count}, the limit is {Config.RESUME_MAX_PAGES})')
+    
+    if Config.RESUME_PDF_WORKERS > 1 and page_count >= Config.RESUME_PDF_PARALLEL_MIN_PAGES:
+        try:
+            return _extract_pages_in_parallel(pdf_source(), page_count)
+        except Exception as e:
+            logger.warning(f"Parallel PDF extraction failed, extracting pages in order: {str(e)}")
+    return [_extract_page(page) for page in reader.pages]
+
+def _extract_pages_in_parallel(pdf, page_count):
+    """Extract and structure a PDF's pages in the process pool
+    
+    Each worker opens the PDF once and handles a contiguous range of pages.
+    
+    Args:
+        pdf: The PDF's bytes, or the path of a file each worker maps
+        page_count: Number of pages in the PDF
+    
+    Returns:
+        list: (page text, page sections) for every page, in order
+    """
+    global _pdf_executor
+    executor = _get_pdf_executor()
+    workers = min(Config.RESUME_PDF_WORKERS, page_count)
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    try:
+        futures = [
+            executor.submit(_extract_page_range, pdf, start, stop)
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+    except BrokenProcessPool:
+        # A crashed worker breaks the whole pool: start a new one next time
+        _pdf_executor = None
+        raise
+    return pages
+
+def _get_pdf_executor():
+    """Get this process's PDF extraction pool (created lazily, never shared across a fork)"""
+    global _pdf_executor, _pdf_executor_pid
+    pid = os.getpid()
+    if _pdf_executor is None or _pdf_executor_pid != pid:
+        with _pdf_executor_lock:
+            if _pdf_executor is None or _pdf_executor_pid != pid:
+                # Forking a multi-threaded web worker can deadlock, so workers
+                # start from a clean server process instead
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                _pdf_executor = ProcessPoolExecutor(max_workers=Config.RESUME_PDF_WORKERS, mp_context=context)
+                _pdf_executor_pid = pid
+    return _pdf_executor
+
+def _extract_page_range(pdf, start, stop):
+    """Extract and structure pages start..stop-1 of a PDF given as bytes or a path (runs in a pool worker)"""
+    if isinstance(pdf, bytes):
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf))
+        return [_extract_page(reader.pages[index]) for index in range(start, stop)]
+    with open(pdf, 'rb') as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        reader = PyPDF2.PdfReader(mapped)
+        return [_extract_page(reader.pages[index]) for index in range(start, stop)]
+
+def _extract_page(page):
+    """Extract a page's text and split it into paragraphs and bullet lists
+    
+    Returns:
+        tuple: (page text, list of sections)
+    """
+    page_text = page.extract_text()
+    return page_text, _structure_page(page_text)
+
+def _is_bullet(line):
+    """Check whether a line starts with a bullet or a list number"""
+    line = line.strip()
+    return line.startswith(('•', '-', '*')) or _NUMBERED_BULLET.match(line) is not None
+
+def _structure_page(page_text):
+    """Split a page's text into paragraphs and bullet lists"""
+    page_sections = []
+    current_section = []
+    for line in page_text.split('\n'):
+        # If empty line, start a new paragraph
+        if not line.strip():
+            if current_section:
                 page_sections.append({
-                    'type': 'bullet_list',
-                    'items': current_section
+                    'type': 'paragraph',
+                    'content': '\n'.join(current_section)
                 })
-            else:
+                current_section = []
+        # If bullet point, add as a list item
+        elif _is_bullet(line):
+            # If we were in a paragraph, finish it
+            if current_section and not _is_bullet(current_section[0]):
                 page_sections.append({
                     'type': 'paragraph',
                     'content': '\n'.join(current_section)
                 })
-            
-        formatted_text.extend(page_sections)
+                current_section = []
+            current_section.append(line)
+        else:
+            # Regular paragraph line
+            current_section.append(line)
     
-    return plain_text, formatted_text
+    # Add any remaining content
+    if current_section:
+        if _is_bullet(current_section[0]):
+            page_sections.append({
+                'type': 'bullet_list',
+                'items': current_section
+            })
+        else:
+            page_sections.append({
+                'type': 'paragraph',
+                'content': '\n'.join(current_section)
+            })
+    return page_sections
 
 def _extract_text_from_docx(file):
     """Extract text from a DOCX file
     
+    DOCX files are zip archives, so one that would expand to more than
+    RESUME_MAX_DOCX_EXPANDED_BYTES is rejected before it is opened.
+    
     Returns:
         tuple: (plain text, formatted text with preserved structure)
     """
+    with zipfile.ZipFile(file) as archive:
+        expanded_size = sum(member.file_size for member in archive.infolist())
+    if expanded_size > Config.RESUME_MAX_DOCX_EXPANDED_BYTES:
+        raise ResumeTooLargeError(f'DOCX file is too large when expanded (the limit is {Config.RESUME_MAX_DOCX_EXPANDED_BYTES} bytes)')
+    file.seek(0)
     doc = docx.Document(file)
     plain_text = ''
     formatted_text = []
@@ -189,24 +421,48 @@ def _extract_text_from_docx(file):
     return plain_text, formatted_text
 
 def _parse_resume_text(text):
-    """Parse resume text into structured data"""
+    """Parse resume text into structured data
+    
+    The text is segmented once (see _iter_sections) and each extractor only
+    reads its own section, so parsing is linear in the resume's length.
+    """
+    sections = {}
+    for kind, start, end in _iter_sections(text):
+        # The first section of each kind is used
+        if kind != 'other' and kind not in sections:
+            sections[kind] = text[start:end]
+            if len(sections) == 3:
+                break
+    
     data = {
         'contact_info': _extract_contact_info(text),
-        'education': _extract_education(text),
-        'experience': _extract_experience(text),
-        'skills': _extract_skills(text)
+        'education': _extract_education(sections.get('education')),
+        'experience': _extract_experience(sections.get('experience')),
+        'skills': _extract_skills(sections.get('skills'), text)
     }
     
     return data
 
+def _iter_sections(text):
+    """Find every section header in one pass over the text
+    
+    Yields:
+        tuple: (kind, start, end) - the section kind ('education',
+            'experience', 'skills' or 'other') and the span of its body, which
+            runs from the end of its header to the start of the next header
+    """
+    previous = None
+    for match in _SECTION_HEADER.finditer(text):
+        if previous is not None:
+            yield previous.lastgroup, previous.end(), match.start()
+        previous = match
+    if previous is not None:
+        yield previous.lastgroup, previous.end(), len(text)
+
 def _extract_contact_info(text):
     """Extract contact information from text"""
-    # Simple patterns for contact info
-    email_pattern = r'[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}'
-    phone_pattern = r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'
-    
-    email = re.search(email_pattern, text)
-    phone = re.search(phone_pattern, text)
+    email = _EMAIL.search(text)
+    phone = _PHONE.search(text)
     
     contact_info = {}
     if email:
@@ -216,88 +472,40 @@ def _extract_contact_info(text):
     
     # Extract name (simplified approach - might need refinement)
     # Assuming name is at the beginning of the resume
-    first_lines = text.split('\n')[:3]
+    first_lines = text.split('\n', 3)[:3]
     for line in first_lines:
         # Check if line is not email, phone, or very short
-        if not re.search(email_pattern, line) and not re.search(phone_pattern, line) and len(line.strip()) > 3:
+        if not _EMAIL.search(line) and not _PHONE.search(line) and len(line.strip()) > 3:
             contact_info['name'] = line.strip()
             break
     
     return contact_info
 
-def _extract_education(text):
-    """Extract education information from text"""
-    education = []
-    
-    # Common education section markers
-    edu_markers = ['EDUCATION', 'Education', 'ACADEMIC BACKGROUND', 'Academic Background']
-    
-    # Find education section using markers
-    edu_section = None
-    for marker in edu_markers:
-        if marker in text:
-            parts = text.split(marker, 1)
-            if len(parts) > 1:
-                edu_section = parts[1]
-                break
-    
-    if not edu_section:
-        return education
-    
-    # Find end of education section (start of next section)
-    next_section_markers = ['EXPERIENCE', 'Experience', 'WORK HISTORY', 'SKILLS', 'Skills']
-    for marker in next_section_markers:
-        if marker in edu_section:
-            edu_section = edu_section.split(marker, 1)[0]
+def _extract_education(section):
+    """Extract education entries (lines naming a degree) from the education section"""
+    if not section:
+        return []
     
     # Basic parsing of education entries (simplified)
     # This will need refinement for better accuracy
-    degree_markers = ['Bachelor', 'Master', 'Ph.D', 'MBA', 'B.S.', 'M.S.', 'B.A.', 'M.A.']
-    for line in edu_section.split('\n'):
-        for marker in degree_markers:
-            if marker in line:
-                education.append(line.strip())
-                break
-    
-    return education
+    return [line.strip() for line in section.split('\n') if _DEGREE.search(line)]
 
-def _extract_experience(text):
-    """Extract work experience from text"""
+def _extract_experience(section):
+    """Extract work experience entries from the experience section"""
     experience = []
-    
-    # Common experience section markers
-    exp_markers = ['EXPERIENCE', 'Experience', 'WORK HISTORY', 'Work History', 'EMPLOYMENT']
-    
-    # Find experience section using markers
-    exp_section = None
-    for marker in exp_markers:
-        if marker in text:
-            parts = text.split(marker, 1)
-            if len(parts) > 1:
-                exp_section = parts[1]
-                break
-    
-    if not exp_section:
+    if not section:
         return experience
     
-    # Find end of experience section (start of next section)
-    next_section_markers = ['EDUCATION', 'Education', 'SKILLS', 'Skills']
-    for marker in next_section_markers:
-        if marker in exp_section:
-            exp_section = exp_section.split(marker, 1)[0]
-    
     # Basic parsing of experience entries (simplified)
     # This is a simplified approach and would need more robust parsing
-    date_pattern = r'(\b\d{1,2}/\d{1,2}\b|\b\d{4}\b|\bPresent\b|\bCurrent\b)'
-    
     current_experience = None
-    for line in exp_section.split('\n'):
+    for line in section.split('\n'):
         line = line.strip()
         if not line:
             continue
             
         # If line has dates, it's likely a new job entry
-        if re.search(date_pattern, line):
+        if _EXPERIENCE_DATE.search(line):
             if current_experience:
                 experience.append(current_experience)
             current_experience = line
@@ -310,55 +518,35 @@ def _extract_experience(text):
     
     return experience
 
-def _extract_skills(text):
-    """Extract skills from text"""
-    skills = []
-    
-    # Common skills section markers
-    skill_markers = ['SKILLS', 'Skills', 'TECHNICAL SKILLS', 'Technical Skills']
+def _extract_skills(section, text):
+    """Extract skills from the skills section
     
-    # Find skills section using markers
-    skill_section = None
-    for marker in skill_markers:
-        if marker in text:
-            parts = text.split(marker, 1)
-            if len(parts) > 1:
-                skill_section = parts[1]
-                break
-    
-    if not skill_section:
+    Args:
+        section: Text of the skills section, or None when there is none
+        text: Whole resume text, searched for common skills when the
+            section has no bullets or commas
+    """
+    skills = []
+    if not section:
         return skills
     
-    # Find end of skills section (start of next section)
-    next_section_markers = ['EDUCATION', 'Education', 'EXPERIENCE', 'Experience']
-    for marker in next_section_markers:
-        if marker in skill_section:
-            skill_section = skill_section.split(marker, 1)[0]
-    
     # Extract skills (simplified approach)
     # First, try to find bullet points or commas
-    if '•' in skill_section or ',' in skill_section:
-        if '•' in skill_section:
-            skill_items = skill_section.split('•')
-            for item in skill_items[1:]:  # Skip the first item (header)
-                item = item.strip()
-                if item:
-                    skills.append(item.split('\n')[0])  # Take only the first line of each bullet point
-        else:  # Use commas
-            skill_items = skill_section.replace('\n', ', ').split(',')
-            for item in skill_items:
-                item = item.strip()
-                if item:
-                    skills.append(item)
-    else:  # Fallback: use individual words
-        # Preprocessed list of common technical skills (could be expanded)
-        common_skills = ['Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'Excel', 
-                        'Word', 'PowerPoint', 'Communication', 'Leadership', 'Project Management',
-                        'Agile', 'Scrum', 'Marketing', 'Sales', 'Customer Service', 'HTML', 'CSS',
-                        'Machine Learning', 'Data Analysis', 'Statistics', 'Research', 'Writing']
-        
-        for skill in common_skills:
+    if '•' in section:
+        skill_items = section.split('•')
+        for item in skill_items[1:]:  # Skip the first item (header)
+            item = item.strip()
+            if item:
+                skills.append(item.split('\n')[0])  # Take only the first line of each bullet point
+    elif ',' in section:
+        skill_items = section.replace('\n', ', ').split(',')
+        for item in skill_items:
+            item = item.strip()
+            if item:
+                skills.append(item)
+    else:  # Fallback: look for common skills anywhere in the resume
+        for skill in _COMMON_SKILLS:
             if skill in text:
                 skills.append(skill)
     
-    return skills
\ No newline at end of file
+    return skills
@@ -6,7 +6,7 @@ from flask import Blueprint
 bp = Blueprint('admin_routes', __name__, url_prefix='/api/admin_v2')
 
 # Import the routes
-from app.routes.admin import users, settings, stats
+from app.routes.admin import users, settings, stats, metrics
 
 # Register sub-blueprints if needed
 # bp.register_blueprint(some_sub_blueprint)
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""Admin route exposing job search provider metrics to Prometheus."""
+
+import hmac
+import logging
+from flask import Response, jsonify, request
+from flask_login import current_user
+from app.config import Config
+from app.modules.job_search.metrics import render_prometheus
+from app.routes.admin import bp
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def _scrape_token_valid():
+    """Check the bearer token a Prometheus scraper sends instead of logging in"""
+    if not Config.METRICS_TOKEN:
+        return False
+    header = request.headers.get('Authorization', '')
+    return header.startswith('Bearer ') and hmac.compare_digest(header[7:], Config.METRICS_TOKEN)
+
+@bp.route('/metrics', methods=['GET'])
+def get_provider_metrics():
+    """Get per-provider latency, status, yield and match score metrics (Prometheus text format)"""
+    admin = current_user.is_authenticated and current_user.is_admin
+    if not admin and not _scrape_token_valid():
+        return jsonify({'error': 'Admin privileges required'}), 403
+    try:
+        return Response(render_prometheus(), mimetype='text/plain; version=0.0.4')
+    except Exception as e:
+        logger.error(f"Error rendering provider metrics: {str(e)}")
+        return jsonify({'error': str(e)}), 500
@@ -6,6 +6,8 @@ import logging
 from datetime import datetime, timedelta
 from app.models import db, User, ApplicationHistory, UserSettings
 from app.routes.admin.decorators import admin_required
+from app.modules.job_search.cache import get_search_cache
+from app.modules.job_search.searcher import get_coalescing_stats
 from app.routes.admin import bp
 
 # Setup logging
@@ -56,4 +58,22 @@ def get_admin_stats():
         })
     except Exception as e:
         logger.error(f"Error getting admin stats: {str(e)}")
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/stats/search-cache', methods=['GET'])
+@login_required
+@admin_required
+def get_search_cache_stats():
+    """Get job search cache hit/miss counts and coalesced provider queries (this worker)"""
+    try:
+        search_cache = get_search_cache()
+        if search_cache is None:
+            return jsonify({'enabled': False, 'coalescing': get_coalescing_stats()})
+        
+        stats = search_cache.stats()
+        stats['enabled'] = True
+        stats['coalescing'] = get_coalescing_stats()
+        return jsonify(stats)
+    except Exception as e:
+        logger.error(f"Error getting search cache stats: {str(e)}")
+        return jsonify({'error': str(e)}), 500
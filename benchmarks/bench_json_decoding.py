@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark for decoding large provider responses.
+Compares json.loads, orjson and streaming the items with ijson on a
+synthetic Glassdoor-shaped feed, mapping every item to a job, and checks
+that all of them produce the same jobs.
+Peak memory excludes the raw body: with a real response, json and orjson
+also hold the whole body (the size printed per run), the stream does not.
+Run this with: python benchmarks/bench_json_decoding.py [item counts...]
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.modules.job_search import json_decoding
+from app.modules.job_search.api_implementations import get_provider
+
+WORDS = (
+    'team build scalable services api cloud data engineer senior backend frontend platform '
+    'remote collaborate javascript python django flask aws gcp docker kubernetes postgresql'
+).split()
+
+def make_feed(count, seed=42):
+    """Generate a Glassdoor-shaped response body with `count` job items"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        items.append({
+            'id': f"gd-{i}",
+            'title': f"{rng.choice(['Senior', 'Staff', 'Junior'])} Python Engineer {i}",
+            'company': f"Company {rng.randint(1, 500)}",
+            'location': rng.choice(['Remote', 'New York, NY', 'Austin, TX']),
+            'jobType': 'Full-time',
+            'salary': f"${rng.randint(80, 200)}k",
+            'postedDate': '2026-10-01T12:00:00Z',
+            'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(150, 400))),
+            'url': f"https://example.com/jobs/{i}",
+            'employer': {'rating': rng.random() * 5, 'reviews': [rng.random() for _ in range(10)]}
+        })
+    return json.dumps({'status': 'ok', 'data': {'jobs': items, 'total': count}}).encode('utf-8')
+
+def measure(label, decode, body, adapter):
+    """Decode and map a feed, printing elapsed time and peak memory, and return the jobs"""
+    start = time.perf_counter()
+    document = decode(body)
+    decode_seconds = time.perf_counter() - start
+    jobs = adapter.parse(document, {'keywords': ['python']})
+    seconds = time.perf_counter() - start
+    del document
+
+    # Memory is measured in a second pass, since tracing slows everything down
+    tracemalloc.start()
+    adapter.parse(decode(body), {'keywords': ['python']})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"    {label:<10} decode {decode_seconds:8.3f}s  total {seconds:8.3f}s  "
+          f"peak {peak / 1024 / 1024:8.1f} MB")
+    return jobs
+
+def run(count):
+    adapter = get_provider('glassdoor')
+    body = make_feed(count)
+    print(f"{count:>8} items ({len(body) / 1024 / 1024:.1f} MB)")
+
+    # Ids are stable for the same item, so results can be compared directly
+    baseline = measure('json', lambda data: json.loads(data), body, adapter)
+    results = []
+    if json_decoding.orjson is not None:
+        results.append(measure('orjson', json_decoding.loads, body, adapter))
+    if json_decoding.streaming_available():
+        # Read in 64 KB chunks, as from a response socket
+        def stream(data):
+            items = json_decoding.iter_items(io.BufferedReader(io.BytesIO(data), 65536), adapter.items_path)
+            return json_decoding.nest(adapter.items_path, list(items))
+        results.append(measure('ijson', stream, body, adapter))
+
+    for jobs in results:
+        if [dict(job, posted_at=None) for job in jobs] != [dict(job, posted_at=None) for job in baseline]:
+            raise SystemExit("Decoders disagree on the mapped jobs")
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 5000]
+    for count in counts:
+        run(count)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark for job match scoring.
+Compares the old per-job scorer with the batch scoring engine and checks
+that both give identical scores and reasons.
+Run this with: python benchmarks/bench_match_scoring.py [sizes...]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.modules.job_search.scoring import score_jobs
+
+KEYWORDS = ['Python', 'Django', 'AWS', 'Kubernetes', 'PostgreSQL', 'React', 'machine learning', 'java']
+WORDS = (
+    'team build scalable services api cloud data engineer senior backend frontend platform '
+    'remote collaborate javascript python django flask aws gcp docker kubernetes postgresql '
+    'react typescript testing agile product customers growth ownership mentoring design'
+).split()
+TITLES = ['Senior Python Engineer', 'Backend Developer (Django)', 'Data Scientist', 'Java Developer',
+          'Frontend Engineer - React', 'DevOps Engineer', 'Machine Learning Engineer', 'Product Manager']
+LOCATIONS = ['Remote', 'New York, NY', 'San Francisco, CA', 'Berlin, Germany', 'London (Remote)', 'Austin, TX']
+POSTED = ['Today', 'Yesterday', '2 days ago', '5 days ago', '12 days ago', 'Recently', '']
+SALARIES = ['$120k - $150k', '$90,000', '80000 - 95000 USD', 'Competitive', '', '$60/hr']
+
+USER_PREFERENCES = {
+    'job_titles': ['Python Engineer'],
+    'min_salary': 100000,
+    'max_commute_distance': 30,
+    'preferred_locations': ['New York', 'Berlin'],
+    'remote_only': False
+}
+
+def legacy_calculate_match_score(job, keywords, user_preferences=None):
+    """The per-job scorer the batch engine replaced, kept as the baseline"""
+    score = 0
+    reasons = []
+
+    keyword_title_matches = 0
+    for keyword in keywords:
+        if keyword.lower() in job['title'].lower():
+            keyword_title_matches += 1
+
+    if keyword_title_matches > 0:
+        title_score = min(40, 20 + (keyword_title_matches * 5))
+        score += title_score
+        reasons.append(f"Title matches {keyword_title_matches} keyword(s): +{title_score} points")
+
+    keyword_desc_matches = 0
+    for keyword in keywords:
+        if keyword.lower() in job['description'].lower():
+            keyword_desc_matches += 1
+
+    if keyword_desc_matches > 0:
+        desc_score = min(20, keyword_desc_matches * 3)
+        score += desc_score
+        reasons.append(f"Description matches {keyword_desc_matches} keyword(s): +{desc_score} points")
+
+    recency_score = 0
+    try:
+        if 'Today' in job['posted_date'] or 'today' in job['posted_date'].lower():
+            recency_score = 15
+            reasons.append("Job posted today: +15 points")
+        elif 'Yesterday' in job['posted_date'] or 'yesterday' in job['posted_date'].lower():
+            recency_score = 10
+            reasons.append("Job posted yesterday: +10 points")
+        else:
+            days_text = job['posted_date'].split()[0]
+            if days_text.isdigit():
+                days_ago = int(days_text)
+                if days_ago <= 7:
+                    recency_score = max(0, 10 - days_ago)
+                    reasons.append(f"Job posted {days_ago} days ago: +{recency_score} points")
+    except (ValueError, IndexError, AttributeError):
+        pass
+
+    score += recency_score
+
+    if user_preferences:
+        location_score = 0
+        is_remote = 'remote' in job['location'].lower()
+
+        if user_preferences['remote_only'] and is_remote:
+            location_score = 15
+            reasons.append("Remote job matches preference: +15 points")
+        elif not user_preferences['remote_only']:
+            if user_preferences['preferred_locations']:
+                for location in user_preferences['preferred_locations']:
+                    if location.lower() in job['location'].lower():
+                        location_score = 15
+                        reasons.append(f"Location {location} matches preference: +15 points")
+                        break
+
+        score += location_score
+
+        if user_preferences['min_salary'] and 'salary' in job and job['salary']:
+            try:
+                salary_text = job['salary'].lower()
+                numbers = []
+                for word in salary_text.replace('$', ' ').replace(',', '').replace('k', '000 ').split():
+                    if word.isdigit():
+                        numbers.append(int(word))
+                    elif word.replace('.', '').isdigit():
+                        numbers.append(float(word))
+
+                if numbers:
+                    if max(numbers) >= user_preferences['min_salary']:
+                        reasons.append("Salary meets minimum requirement: +10 points")
+                        score += 10
+            except Exception:
+                pass
+
+    score = max(0, min(100, score))
+
+    return score, reasons
+
+def make_jobs(count, seed=42):
+    """Generate synthetic job listings with realistic field sizes"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        jobs.append({
+            'id': f"bench-{i}",
+            'title': rng.choice(TITLES),
+            'company': f"Company {rng.randint(1, count // 10 + 1)}",
+            'location': rng.choice(LOCATIONS),
+            'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(80, 400))),
+            'salary': rng.choice(SALARIES),
+            'posted_date': rng.choice(POSTED)
+        })
+    return jobs
+
+def run(size):
+    jobs = make_jobs(size)
+
+    start = time.perf_counter()
+    legacy = [legacy_calculate_match_score(job, KEYWORDS, USER_PREFERENCES) for job in jobs]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = score_jobs(jobs, KEYWORDS, USER_PREFERENCES)
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score_jobs(jobs, KEYWORDS, USER_PREFERENCES, with_reasons=False)
+    scores_only_seconds = time.perf_counter() - start
+
+    if legacy != batch:
+        mismatches = sum(1 for a, b in zip(legacy, batch) if a != b)
+        raise SystemExit(f"Batch scorer disagrees with the legacy scorer on {mismatches} of {size} jobs")
+
+    print(f"{size:>8} jobs  legacy {legacy_seconds:8.3f}s  batch {batch_seconds:8.3f}s  "
+          f"speedup {legacy_seconds / batch_seconds:5.2f}x  "
+          f"scores only {scores_only_seconds:8.3f}s ({legacy_seconds / scores_only_seconds:5.2f}x)")
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]
+    for size in sizes:
+        run(size)
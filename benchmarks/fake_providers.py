@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the RapidAPI job providers, for benchmarking job search
+without using API quota.
+Serves every site in Config.get_job_portal_configs() (the 18 search adapters
+plus the hiring manager feed) at /<provider host>/<path>, which is where
+PROVIDER_BASE_URL sends the app's requests. Responses replay fixtures
+recorded from the real APIs when there are any, and are generated from each
+adapter's field mapping otherwise. Latency, server errors and 429s can be
+injected per site.
+
+Record fixtures (uses RAPIDAPI_KEY quota once per site):
+    python benchmarks/fake_providers.py --record --keywords python
+Serve:
+    python benchmarks/fake_providers.py --port 8900 --latency lognormal:0.3:0.5 \\
+        --site-latency glassdoor=lognormal:2:0.4 --error-rate 0.02 --rate-limited-rate 0.05
+Then run the app with PROVIDER_BASE_URL=http://127.0.0.1:8900 and any
+RAPIDAPI_KEY, and drive it with benchmarks/load_search.py.
+"""
+import os
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qsl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import Config
+from app.modules.job_search.api_implementations import PROVIDERS, get_provider
+from app.modules.job_search.json_decoding import nest
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+HIRING_MANAGER_URL = 'https://hiring-manager-api.p.rapidapi.com/recruitment-manager-24h'
+
+LEVELS = ['Senior', 'Staff', 'Junior', 'Lead', '']
+SKILLS = ['Python', 'Java', 'React', 'Data', 'Machine Learning', 'DevOps']
+ROLES = ['Engineer', 'Developer', 'Scientist', 'Intern', 'Architect']
+COMPANIES = [f"Company {i}" for i in range(1, 201)]
+LOCATIONS = ['Remote', 'New York, NY', 'San Francisco, CA', 'Austin, TX', 'Berlin, Germany', 'London, UK']
+SALARIES = ['$120k - $150k', '$90,000', '80000 - 95000 USD', 'Competitive', '', '$60/hr']
+WORDS = (
+    'team build scalable services api cloud data engineer senior backend frontend platform '
+    'remote collaborate javascript python django flask aws gcp docker kubernetes postgresql'
+).split()
+
+class LatencyModel:
+    """A response delay distribution parsed from 'fixed:S', 'uniform:LOW:HIGH',
+    'lognormal:MEDIAN:SIGMA' or 'none' (seconds)"""
+
+    def __init__(self, spec):
+        kind, _, args = spec.partition(':')
+        self.kind = kind
+        self.args = [float(arg) for arg in args.split(':')] if args else []
+        expected = {'none': 0, 'fixed': 1, 'uniform': 2, 'lognormal': 2}
+        if expected.get(kind) != len(self.args):
+            raise argparse.ArgumentTypeError(f"Invalid latency: {spec}")
+
+    def sample(self, rng):
+        if self.kind == 'fixed':
+            return self.args[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.args)
+        if self.kind == 'lognormal':
+            median, sigma = self.args
+            return median * rng.lognormvariate(0, sigma)
+        return 0.0
+
+def _endpoint(url):
+    """Get the path a provider URL is served at, e.g. '/indeed46.p.rapidapi.com/job'"""
+    parsed = urlparse(url)
+    return f"/{parsed.netloc}{parsed.path}"
+
+def build_routes():
+    """Map each served path to the sites using it (e.g. google and google_jobs)"""
+    routes = {}
+    for adapter in PROVIDERS.values():
+        routes.setdefault(_endpoint(adapter.url), []).append(adapter.name)
+    routes[_endpoint(HIRING_MANAGER_URL)] = ['hiring_manager']
+    return routes
+
+def _set_path(item, path, value):
+    """Set a value at a key or tuple of nested keys"""
+    if isinstance(path, str):
+        path = (path,)
+    for key in path[:-1]:
+        item = item.setdefault(key, {})
+    item[path[-1]] = value
+
+def _request_keywords(adapter, params, body):
+    """Get the search keywords the app sent, so generated titles match them"""
+    for param, (criterion, _) in adapter.param_map.items():
+        if criterion == 'keywords' and params.get(param):
+            return params[param].strip('"')
+    if isinstance(body, dict):
+        return body.get('scraper', {}).get('filters', {}).get('keyword', '')
+    return ''
+
+def _request_page(adapter, params):
+    """Get the 0-based result page requested from a paging provider"""
+    if not adapter.paging:
+        return 0
+    param, first, step = adapter.paging
+    try:
+        return max(0, (int(params.get(param, first)) - first) // step)
+    except ValueError:
+        return 0
+
+def generate_items(adapter, keywords, page, items_per_page):
+    """Generate one page of items in the provider's own response shape
+
+    The same site, keywords and page always give the same items, like a
+    real provider between index updates.
+    """
+    rng = random.Random(f"{adapter.name}:{keywords}:{page}")
+    now = datetime.now(timezone.utc)
+    items = []
+    for i in range(items_per_page):
+        level = rng.choice(LEVELS)
+        skill = keywords.title() if keywords and rng.random() < 0.8 else rng.choice(SKILLS)
+        values = {
+            'title': ' '.join(part for part in (level, skill, rng.choice(ROLES)) if part),
+            'company': rng.choice(COMPANIES),
+            'location': rng.choice(LOCATIONS),
+            'job_type': rng.choice(['Full-time', 'Contract', 'Part-time']),
+            'salary': rng.choice(SALARIES),
+            'posted_date': (now - timedelta(hours=rng.randint(0, 240))).isoformat(),
+            'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(80, 300))),
+            'url': f"https://jobs.example.com/{adapter.name}/{page}/{i}"
+        }
+        item = {}
+        for field, path in adapter.fields.items():
+            if field in adapter.constants:
+                continue
+            value = values[field]
+            if path == ('budget', 'amount'):
+                value = rng.randint(500, 20000)
+            _set_path(item, path, value)
+        if adapter.id_field:
+            item[adapter.id_field] = f"{page}-{i}"
+        items.append(item)
+    return items
+
+def generate_managers(count=200):
+    """Generate the hiring manager feed"""
+    rng = random.Random('hiring_manager')
+    return {'managers': [
+        {
+            'name': f"Manager {i}",
+            'title': rng.choice(['Engineering Manager', 'Head of Talent', 'CTO']),
+            'email': f"manager{i}@example.com",
+            'phone': '',
+            'company': rng.choice(COMPANIES)
+        }
+        for i in range(count)
+    ]}
+
+class FakeProviders:
+    """The state behind the server: routes, fixtures, fault injection and stats"""
+
+    def __init__(self, args):
+        self.routes = build_routes()
+        self.latency = args.latency
+        self.site_latency = dict(args.site_latency or [])
+        self.error_rate = args.error_rate
+        self.rate_limited_rate = args.rate_limited_rate
+        self.items_per_page = args.items
+        self.pages = args.pages
+        self.fixtures = self._load_fixtures(args.fixtures)
+        self.stats = Counter()
+        self.lock = threading.Lock()
+        self.rng = random.Random(args.seed)
+
+    def _load_fixtures(self, directory):
+        fixtures = {}
+        if os.path.isdir(directory):
+            for filename in os.listdir(directory):
+                site, extension = os.path.splitext(filename)
+                if extension == '.json':
+                    with open(os.path.join(directory, filename), 'rb') as f:
+                        fixtures[site] = f.read()
+        return fixtures
+
+    def respond(self, path, params, body):
+        """Work out a response for a request
+
+        Returns:
+            tuple: (delay in seconds, status, extra headers, body bytes)
+        """
+        sites = self.routes.get(path)
+        if not sites:
+            return 0, 404, {}, b'{"message": "Unknown endpoint"}'
+        site = sites[0]
+
+        with self.lock:
+            latency = self.site_latency.get(site, self.latency)
+            delay = latency.sample(self.rng)
+            roll = self.rng.random()
+        if roll < self.rate_limited_rate:
+            return delay, 429, {'Retry-After': '1'}, b'{"message": "Too many requests"}'
+        if roll < self.rate_limited_rate + self.error_rate:
+            return delay, 500, {}, b'{"message": "Internal server error"}'
+
+        if site == 'hiring_manager':
+            data = self.fixtures.get(site) or json.dumps(generate_managers()).encode('utf-8')
+            return delay, 200, {}, data
+
+        adapter = get_provider(site)
+        page = _request_page(adapter, params)
+        if site in self.fixtures:
+            # A recorded response is one page: later pages are empty
+            data = self.fixtures[site] if page == 0 else json.dumps(nest(adapter.items_path, [])).encode('utf-8')
+            return delay, 200, {}, data
+
+        items = []
+        if page < self.pages:
+            keywords = _request_keywords(adapter, params, body)
+            items = generate_items(adapter, keywords, page, self.items_per_page)
+        return delay, 200, {}, json.dumps(nest(adapter.items_path, items)).encode('utf-8')
+
+    def count(self, site, status):
+        with self.lock:
+            self.stats[(site, status)] += 1
+
+def make_handler(providers, verbose=False):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _handle(self):
+            parsed = urlparse(self.path)
+            params = dict(parse_qsl(parsed.query))
+            body = None
+            length = int(self.headers.get('Content-Length') or 0)
+            if length:
+                try:
+                    body = json.loads(self.rfile.read(length))
+                except ValueError:
+                    body = None
+
+            delay, status, headers, data = providers.respond(parsed.path, params, body)
+            if delay:
+                time.sleep(delay)
+            sites = providers.routes.get(parsed.path) or ['unknown']
+            providers.count(sites[0], status)
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = _handle
+        do_POST = _handle
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+def record(args):
+    """Save one real response per site as its fixture"""
+    if not Config.RAPIDAPI_KEY:
+        raise SystemExit("Set RAPIDAPI_KEY to record fixtures")
+    from app.modules.job_search.http_client import http_get, http_post
+
+    os.makedirs(args.fixtures, exist_ok=True)
+    portal_configs = Config.get_job_portal_configs()
+    criteria = {'keywords': args.keywords.split(), 'location': args.location}
+    for site, portal_config in portal_configs.items():
+        adapter = get_provider(site)
+        try:
+            if adapter is None:
+                response = http_get(portal_config['url'], headers={
+                    'x-rapidapi-host': portal_config['host'], 'x-rapidapi-key': portal_config['api_key']})
+            else:
+                method, url, headers, params, body = adapter.build_request(portal_config, criteria)
+                if method == 'POST':
+                    response = http_post(url, headers=headers, params=params, json=body)
+                else:
+                    response = http_get(url, headers=headers, params=params)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"{site:<16} failed: {str(e)}")
+            continue
+        with open(os.path.join(args.fixtures, f"{site}.json"), 'wb') as f:
+            f.write(response.content)
+        print(f"{site:<16} recorded {len(response.content)} bytes")
+
+def _site_latency(value):
+    site, _, spec = value.partition('=')
+    if site not in PROVIDERS and site != 'hiring_manager':
+        raise argparse.ArgumentTypeError(f"Unknown site: {site}")
+    return site, LatencyModel(spec)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES_DIR, help='Directory of <site>.json responses')
+    parser.add_argument('--latency', type=LatencyModel, default=LatencyModel('lognormal:0.3:0.5'))
+    parser.add_argument('--site-latency', type=_site_latency, action='append',
+                        help='Per-site latency, e.g. glassdoor=fixed:2 (repeatable)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of requests answered with 500')
+    parser.add_argument('--rate-limited-rate', type=float, default=0.0, help='Share of requests answered with 429')
+    parser.add_argument('--items', type=int, default=20, help='Generated items per page')
+    parser.add_argument('--pages', type=int, default=3, help='Generated pages per query on paging providers')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--verbose', action='store_true')
+    parser.add_argument('--record', action='store_true', help='Record fixtures from the real APIs and exit')
+    parser.add_argument('--keywords', default='python', help='Keywords used when recording')
+    parser.add_argument('--location', default='', help='Location used when recording')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+
+    providers = FakeProviders(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(providers, args.verbose))
+    server.daemon_threads = True
+    # Print the stats when stopped with kill as well as Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+    sites = sum(len(names) for names in providers.routes.values())
+    print(f"Serving {sites} sites ({len(providers.routes)} endpoints) on http://{args.host}:{args.port}, "
+          f"{len(providers.fixtures)} recorded fixtures")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for (site, status), count in sorted(providers.stats.items()):
+            print(f"{site:<16} {status} {count:>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Load test for /api/search-jobs.
+Logs in (registering the user on first run), then sends searches from
+several threads and reports latency percentiles, throughput and status
+counts. Point the app at benchmarks/fake_providers.py so no API quota is
+used:
+    python benchmarks/fake_providers.py --port 8900 &
+    PROVIDER_BASE_URL=http://127.0.0.1:8900 RAPIDAPI_KEY=local SEARCH_CACHE_BACKEND=none python wsgi.py &
+    python benchmarks/load_search.py --url http://127.0.0.1:5001 --concurrency 20 --requests 500
+Leave the search cache on to measure cached searches instead.
+"""
+import sys
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+KEYWORDS = ['python', 'java', 'react', 'data', 'machine learning', 'devops', 'backend', 'frontend']
+LOCATIONS = ['', 'Remote', 'New York', 'Berlin']
+
+def percentile(samples, fraction):
+    """Get a percentile of sorted samples (nearest rank)"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+def login(base_url, username, password):
+    """Get a logged in session, registering the user when it doesn't exist"""
+    session = requests.Session()
+    response = session.post(f"{base_url}/api/auth/login", json={'username': username, 'password': password})
+    if response.status_code == 401:
+        response = session.post(f"{base_url}/api/auth/register", json={
+            'username': username, 'email': f"{username}@example.com", 'password': password})
+    if response.status_code not in (200, 201):
+        raise SystemExit(f"Could not log in as {username}: {response.status_code} {response.text[:200]}")
+    return session
+
+def make_queries(count, seed):
+    """Build the distinct searches requests are drawn from"""
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        query = {'keywords': rng.sample(KEYWORDS, rng.randint(1, 2)), 'location': rng.choice(LOCATIONS)}
+        if i >= len(KEYWORDS) * len(LOCATIONS):
+            # Make sure there are as many distinct queries as asked for
+            query['keywords'].append(f"k{i}")
+        queries.append(query)
+    return queries
+
+def run(args):
+    session = login(args.url, args.username, args.password)
+    # Every worker thread shares the login cookie but gets its own connection pool
+    cookies = session.cookies.get_dict()
+    queries = make_queries(args.distinct_queries, args.seed)
+    local = threading.local()
+
+    latencies = []
+    statuses = Counter()
+    jobs_returned = []
+    lock = threading.Lock()
+
+    def search(i):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+            local.session.cookies.update(cookies)
+        body = dict(queries[i % len(queries)])
+        if args.limit:
+            body['limit'] = args.limit
+        start = time.perf_counter()
+        try:
+            response = local.session.post(f"{args.url}/api/search-jobs", json=body, timeout=args.timeout)
+            status = response.status_code
+            count = len(response.json().get('jobs', [])) if status == 200 else 0
+        except (requests.RequestException, ValueError) as e:
+            status, count = type(e).__name__, 0
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] += 1
+            jobs_returned.append(count)
+
+    # Warm up connections, caches and imports before timing anything
+    for i in range(min(args.warmup, args.requests)):
+        search(i)
+    latencies.clear()
+    statuses.clear()
+    jobs_returned.clear()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(search, range(args.requests)))
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{args.requests} searches, {args.concurrency} concurrent, {len(queries)} distinct queries")
+    print(f"  throughput  {args.requests / wall if wall else 0.0:8.2f} searches/s over {wall:.1f}s")
+    print(f"  latency     p50 {percentile(latencies, 0.50):.3f}s  p95 {percentile(latencies, 0.95):.3f}s  "
+          f"p99 {percentile(latencies, 0.99):.3f}s  max {latencies[-1] if latencies else 0.0:.3f}s")
+    print(f"  jobs        {sum(jobs_returned) / len(jobs_returned) if jobs_returned else 0.0:.1f} per search")
+    print("  statuses    " + ', '.join(f"{status}: {count}" for status, count in sorted(statuses.items(), key=str)))
+    return 0 if set(statuses) == {200} else 1
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5001', help='App base URL')
+    parser.add_argument('--username', default='loadtest')
+    parser.add_argument('--password', default='loadtest-password')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--distinct-queries', type=int, default=20)
+    parser.add_argument('--limit', type=int, default=0, help='Page size sent with each search (0 for all jobs)')
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--seed', type=int, default=1)
+    sys.exit(run(parser.parse_args()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Background worker that runs users' saved searches.
+Run this with: python saved_search_worker.py [--once]
+"""
+import sys
+import logging
+from app import create_app
+from app.modules.job_search.scheduler import run_due_searches, run_forever
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    app = create_app()
+    
+    if '--once' in sys.argv:
+        with app.app_context():
+            stats = run_due_searches()
+        print(f"Saved searches run: {stats}")
+        return
+    
+    run_forever(app)
+
+if __name__ == "__main__":
+    main()
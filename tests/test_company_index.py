@@ -0,0 +1,15 @@
+from app.modules.job_search.company_index import normalize_company_name, CompanyIndex
+
+def test_legal_suffixes_are_stripped():
+    assert normalize_company_name('The Acme Co., Inc.') == 'acme'
+    assert normalize_company_name('Acme GmbH') == normalize_company_name('ACME')
+
+def test_companies_differing_by_a_descriptive_word_are_kept_apart():
+    assert normalize_company_name('Data Corp') != normalize_company_name('Data Group')
+    assert normalize_company_name('Data Group') != normalize_company_name('Data Company')
+
+    index = CompanyIndex()
+    index.add('Data Corp', 'corp')
+    index.add('Data Group', 'group')
+    assert index.lookup('Data Corp, Inc.') == ['corp']
+    assert index.lookup('Data Group') == ['group']
@@ -0,0 +1,30 @@
+from app.modules.job_search.dedupe import NearDuplicateIndex
+
+# Company boilerplate long enough to dominate the shingled description start
+BLURB = ("Acme Inc is a fast growing company building the future of logistics software. We value ownership, "
+         "curiosity and kindness. Our team works across three continents and we offer competitive salary, equity, "
+         "health insurance, flexible hours and a generous learning budget. Join us to shape how goods move around "
+         "the world with reliable modern tools used by thousands of businesses every day. ") * 2
+
+def _job(title, company, description, source):
+    return {'title': title, 'company': company, 'description': description, 'source': source, 'id': source}
+
+def test_distinct_titles_at_one_company_are_kept():
+    index = NearDuplicateIndex(0.7)
+    added = [
+        index.add(_job('Senior Backend Engineer', 'Acme Inc', BLURB + 'python apis', 'a')),
+        index.add(_job('Office Manager', 'Acme Inc', BLURB + 'run the office', 'b')),
+        index.add(_job('Sales Development Representative', 'Acme Inc', BLURB + 'prospect leads', 'c'))
+    ]
+    assert added == [True, True, True]
+    assert len(index) == 3
+
+def test_syndicated_copies_are_merged():
+    index = NearDuplicateIndex(0.7)
+    added = [
+        index.add(_job('Senior Backend Engineer', 'Acme Inc', BLURB, 'a')),
+        index.add(_job('Sr. Backend Engineer', 'Acme', BLURB, 'b')),
+        index.add(_job('Senior Backend Engineer (Remote)', 'ACME Inc.', BLURB, 'c'))
+    ]
+    assert added == [True, False, False]
+    assert [source['source'] for source in index.jobs()[0]['other_sources']] == ['b', 'c']
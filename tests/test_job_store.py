@@ -0,0 +1,47 @@
+from flask import Flask
+from sqlalchemy import inspect, text
+from app.models import db, ApplicationHistory, Job
+from app.modules.job_search.job_store import ensure_job_store
+
+# The tables as they were before jobs were stored once (Migrations 6 and 7)
+PRE_SERIES_SCHEMA = (
+    """CREATE TABLE user (id VARCHAR(36) PRIMARY KEY, username VARCHAR(80) NOT NULL UNIQUE,
+       email VARCHAR(120) NOT NULL UNIQUE, password_hash VARCHAR(256) NOT NULL)""",
+    """CREATE TABLE application_history (id VARCHAR(36) PRIMARY KEY, user_id VARCHAR(36) NOT NULL REFERENCES user (id),
+       job_id VARCHAR(100), job_url VARCHAR(1024) NOT NULL, position VARCHAR(256) NOT NULL,
+       company VARCHAR(256) NOT NULL, location VARCHAR(256), platform VARCHAR(100) NOT NULL, description TEXT,
+       match_score INTEGER, match_reasons TEXT, auto_applied BOOLEAN, application_type VARCHAR(100) NOT NULL,
+       success BOOLEAN, timestamp DATETIME, message TEXT, error TEXT, cover_letter_text TEXT,
+       resume_used VARCHAR(256), notification_sent BOOLEAN, created_at DATETIME, updated_at DATETIME)""",
+    """INSERT INTO application_history (id, user_id, job_url, position, company, platform, application_type)
+       VALUES ('h1', 'u1', 'https://example.com/1', 'Engineer', 'Acme', 'linkedin', 'manual')""",
+    """CREATE TABLE job (id VARCHAR(36) PRIMARY KEY, fingerprint VARCHAR(40) NOT NULL UNIQUE,
+       external_id VARCHAR(256), title VARCHAR(256) NOT NULL, company VARCHAR(256) NOT NULL,
+       location VARCHAR(256), job_type VARCHAR(100), salary VARCHAR(256), posted_date VARCHAR(100),
+       description TEXT, url VARCHAR(1024), source VARCHAR(100), other_sources TEXT,
+       first_seen_at DATETIME, last_seen_at DATETIME, created_at DATETIME, updated_at DATETIME)"""
+)
+
+def test_existing_tables_get_the_new_columns(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{tmp_path}/old.sqlite'
+    db.init_app(app)
+    with app.app_context():
+        with db.engine.begin() as conn:
+            for statement in PRE_SERIES_SCHEMA:
+                conn.execute(text(statement))
+
+        ensure_job_store()
+
+        inspector = inspect(db.engine)
+        assert {'job_ref_id'} <= {column['name'] for column in inspector.get_columns('application_history')}
+        assert {'posted_at', 'salary_min', 'salary_max', 'currency', 'period'} <= {
+            column['name'] for column in inspector.get_columns('job')}
+        assert 'ix_application_history_job_ref_id' in {
+            index['name'] for index in inspector.get_indexes('application_history')}
+
+        # Mapped queries work on the upgraded tables, old rows included
+        history = db.session.get(ApplicationHistory, 'h1')
+        assert history.position == 'Engineer' and history.job_ref_id is None
+        assert Job.query.filter(Job.salary_min > 0).count() == 0
+        db.session.remove()
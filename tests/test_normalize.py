@@ -0,0 +1,24 @@
+from app.modules.job_search.api_implementations import get_provider
+from app.modules.job_search.normalize import parse_salary, annual_salary
+from app.modules.job_search.searcher import _filter_jobs
+
+def _job(**fields):
+    job = {'title': 'Python developer', 'company': 'Acme', 'location': 'Remote', 'description': ''}
+    job.update(fields)
+    return job
+
+def test_fixed_price_budgets_are_not_compared_with_yearly_pay():
+    budget = get_provider('upwork').map_item({'id': '1', 'title': 'Build a Flask API', 'budget': {'amount': 500}})
+    assert budget['salary_max'] == 500 and budget['period'] == 'fixed'
+    assert annual_salary(budget) is None
+
+    yearly = _job(**parse_salary('$40,000 - $45,000 a year'))
+    hourly = _job(**parse_salary('$50/hr'))
+    unknown = _job(**parse_salary('Competitive'))
+    kept = _filter_jobs([budget, yearly, hourly, unknown], {'min_salary': 60000})
+    assert kept == [budget, hourly, unknown]
+
+def test_stated_period_wins_over_the_default():
+    assert parse_salary('$30/hr', 'fixed')['period'] == 'hour'
+    assert parse_salary('$800 fixed price')['period'] == 'fixed'
+    assert annual_salary(parse_salary('$120,000')) == 120000
@@ -0,0 +1,56 @@
+from app.modules.resume_parser.parser import _parse_resume_text
+
+INLINE_HEADERS = """Jane Doe
+jane@example.com
+Skills: Python, Java, SQL
+Experience: Acme Corp, Engineer 2019 - Present
+Built services
+Education: B.S. Computer Science, MIT 2018
+"""
+
+QUALIFIED_HEADERS = """Jane Doe
+jane@example.com
+
+Skills
+Python, Java
+
+Professional Experience
+Acme 2019 - Present
+Built services
+
+Education
+B.S. Computer Science, MIT 2018
+"""
+
+# What the parser returned before sections were found in one pass, less the
+# header's colon and qualifier it used to leave in the section text
+# (': Python', 'Professional')
+INLINE_EXPECTED = {
+    'education': ['B.S. Computer Science, MIT 2018'],
+    'experience': ['Acme Corp, Engineer 2019 - Present Built services'],
+    'skills': ['Python', 'Java', 'SQL']
+}
+QUALIFIED_EXPECTED = {
+    'education': ['B.S. Computer Science, MIT 2018'],
+    'experience': ['Acme 2019 - Present Built services'],
+    'skills': ['Python', 'Java']
+}
+
+def _sections(text):
+    data = _parse_resume_text(text)
+    return {key: data[key] for key in ('education', 'experience', 'skills')}
+
+def test_inline_headers_keep_their_content():
+    assert _sections(INLINE_HEADERS) == INLINE_EXPECTED
+
+def test_qualified_headers_start_a_section():
+    assert _sections(QUALIFIED_HEADERS) == QUALIFIED_EXPECTED
+
+def test_qualified_upper_case_headers_start_a_section():
+    text = (QUALIFIED_HEADERS.replace('Professional Experience', 'PROFESSIONAL EXPERIENCE')
+            .replace('Skills\n', 'TECHNICAL SKILLS\n').replace('Education\n', 'EDUCATION\n'))
+    assert _sections(text) == QUALIFIED_EXPECTED
+
+def test_sentence_starting_with_a_keyword_is_not_a_header():
+    text = "Jane Doe\n\nSkills\nPython, Java\nExperience with Python in production\n"
+    assert _sections(text)['skills'] == ['Python', 'Java', 'Experience with Python in production']
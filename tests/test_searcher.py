@@ -0,0 +1,72 @@
+import pytest
+from app.config import Config
+from app.modules.job_search.searcher import _prepare_search
+
+def _deadline(value):
+    return _prepare_search({'keywords': ['python'], 'sites': [], 'deadline': value})[1]
+
+def test_missing_deadline_uses_the_default():
+    assert _deadline(None) == Config.JOB_SEARCH_DEADLINE_SECONDS
+    assert _deadline('') == Config.JOB_SEARCH_DEADLINE_SECONDS
+
+def test_deadline_is_capped(monkeypatch):
+    monkeypatch.setattr(Config, 'JOB_SEARCH_MAX_DEADLINE_SECONDS', 30.0)
+    assert _deadline('5') == 5.0
+    assert _deadline(1e9) == 30.0
+    assert _deadline('inf') == 30.0
+
+@pytest.mark.parametrize('value', [0, -1, '-5', 'nan', 'soon'])
+def test_invalid_deadline_is_rejected(value):
+    with pytest.raises(ValueError):
+        _deadline(value)
+
+def test_paging_records_match_scores_once(monkeypatch):
+    from app.modules.job_search import searcher
+    jobs = [{'id': str(i), 'title': f'Python developer {i}', 'company': 'Acme', 'location': 'Remote',
+             'description': 'python', 'source': 'a'} for i in range(5)]
+    monkeypatch.setattr(searcher, 'collect_jobs', lambda criteria, metadata=None, wanted=0, record_metrics=True: jobs)
+    monkeypatch.setattr(searcher, 'get_user_preferences', lambda: {})
+    monkeypatch.setattr(searcher, '_enhance_with_hiring_manager_info', lambda page: page)
+    recorded = []
+    monkeypatch.setattr(searcher, 'record_match_scores', lambda scored, scores: recorded.extend(scores))
+
+    criteria = {'keywords': ['python'], 'sites': []}
+    metadata = {}
+    pages = [searcher.search_jobs(criteria, metadata=metadata, limit=2)]
+    while metadata['next_cursor']:
+        pages.append(searcher.search_jobs(criteria, metadata=metadata, limit=2, cursor=metadata['next_cursor']))
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert len(recorded) == len(jobs)
+
+def test_closing_a_stream_cancels_queued_sites(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from app.modules.job_search import searcher
+    sites = list(searcher.JOB_SITES)[:3]
+    started = []
+
+    def search_site(site, criteria):
+        started.append(site)
+        if site == sites[0]:
+            return [{'id': '1', 'title': 'Python developer', 'company': 'Acme', 'location': 'Remote',
+                     'description': 'python', 'source': site}]
+        time.sleep(0.3)
+        return []
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(searcher, '_get_executor', lambda: executor)
+    monkeypatch.setattr(searcher, '_search_site', search_site)
+    for name in ('_persist_jobs', 'record_unique_jobs', 'record_match_scores'):
+        monkeypatch.setattr(searcher, name, lambda *args: None)
+    monkeypatch.setattr(searcher, 'get_user_preferences', lambda: {})
+    monkeypatch.setattr(searcher, '_enhance_with_hiring_manager_info', lambda jobs: jobs)
+
+    results = searcher.iter_search_jobs({'keywords': ['python'], 'sites': sites})
+    site, jobs = next(results)
+    results.close()
+    executor.shutdown(wait=True)
+
+    assert site == sites[0] and len(jobs) == 1
+    # The second site may already have started; the third was still queued
+    assert sites[2] not in started